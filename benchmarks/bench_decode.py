@@ -0,0 +1,58 @@
+"""Decode cost of validated and trusted responses.
+
+    python -m benchmarks.bench_decode
+
+`validate` is the default decode path, `trusted` parses with orjson and wraps the result in trusted views, and
+`trusted+read` also reads one field of every model, e.g. what a crawler storing a few stats per player does.
+"""
+
+import timeit
+
+import orjson
+
+from pyltover.apis.v4 import ChampionMasteries
+from pyltover.apis.v4.schema import League
+from pyltover.apis.v5.schema import Match
+from pyltover.decode import trusted_view, type_adapter
+
+from benchmarks.mock_riot import LEAGUE_JSON, MASTERIES_JSON, MATCH_JSON
+
+
+def _read_match(match):
+    return [participant.champion_name for participant in match.info.participants]
+
+
+def _read_league(league):
+    return [item.league_points for item in league.entries]
+
+
+def _read_masteries(masteries):
+    return [mastery.champion_points for mastery in masteries]
+
+
+CASES = [
+    ("Match", Match, MATCH_JSON, _read_match),
+    ("League (300 entries)", League, LEAGUE_JSON, _read_league),
+    ("list[ChampionMastery] (170)", ChampionMasteries, MASTERIES_JSON, _read_masteries),
+]
+
+
+def _best_of(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    print(f"{'payload':<30}{'validate':>12}{'trusted':>12}{'trusted+read':>14}{'speedup':>10}")
+    for name, type_, content, read in CASES:
+        adapter = type_adapter(type_)
+        validate = _best_of(lambda: read(adapter.validate_json(content)), 200)
+        trusted = _best_of(lambda: trusted_view(type_, orjson.loads(content)), 200)
+        trusted_read = _best_of(lambda: read(trusted_view(type_, orjson.loads(content))), 200)
+        print(
+            f"{name:<30}{validate * 1e3:>10.3f}ms{trusted * 1e3:>10.3f}ms{trusted_read * 1e3:>12.3f}ms"
+            f"{validate / trusted_read:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Throughput, latency, decode time and memory of the main endpoints, against the in-process riot of `mock_riot`.
+
+    python -m benchmarks.bench_endpoints [--requests 2000] [--concurrency 50] [--latency 0.0] [--json results.json]
+
+Every scenario sends `--requests` calls through a whole `Pyltover` client, `--concurrency` at a time, with a distinct
+path each so concurrent calls are not coalesced. `req/s` and the latency percentiles cover the full call (rate
+limiter, transport, decoding), `decode` is the mean decode time of the endpoint from `pyltover.metrics.Metrics` and
+`per object` is the memory held by one decoded response. `--json` writes the results, to compare them release over
+release.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+from pyltover import Pyltover
+from pyltover.apis.schema import Division, Tier, QueueTypes
+from pyltover.apis.v4 import ChampionMasteries, LeagueEntries
+from pyltover.apis.v4.schema import ChampionMastery, League
+from pyltover.apis.v5.schema import Match
+from pyltover.concurrency import bounded_map
+from pyltover.decode import type_adapter
+from pyltover.metrics import Metrics
+
+from benchmarks.mock_riot import (
+    LEAGUE_ENTRIES_BY_PUUID_JSON,
+    LEAGUE_ENTRIES_JSON,
+    LEAGUE_JSON,
+    MASTERIES_JSON,
+    MASTERY_JSON,
+    MATCH_JSON,
+    MockRiot,
+)
+
+
+# (api name, call of the index of the request, type and payload the response decodes to)
+SCENARIOS: list[tuple[str, Callable[[Pyltover, int], Awaitable[Any]], Any, bytes | None]] = [
+    (
+        "v5.get_match_by_id",
+        lambda pyltover, index: pyltover.europe.v5.get_match_by_id(f"EUW1_{index}"),
+        Match,
+        MATCH_JSON,
+    ),
+    (
+        "v4.get_league_with_id",
+        lambda pyltover, index: pyltover.euw1.v4.get_league_with_id(f"league-{index}"),
+        League,
+        LEAGUE_JSON,
+    ),
+    (
+        "v4.get_league_entries_for_puuid",
+        lambda pyltover, index: pyltover.euw1.v4.get_league_entries_for_puuid(f"puuid-{index}"),
+        LeagueEntries,
+        LEAGUE_ENTRIES_BY_PUUID_JSON,
+    ),
+    (
+        "v4.get_all_the_league_entries",
+        lambda pyltover, index: pyltover.euw1.v4.get_all_the_league_entries(
+            QueueTypes.RANKED_SOLO_5x5, Tier.GOLD, Division.II, page=index + 1
+        ),
+        LeagueEntries,
+        LEAGUE_ENTRIES_JSON,
+    ),
+    (
+        "v4.get_all_champion_mastery",
+        lambda pyltover, index: pyltover.euw1.v4.get_all_champion_mastery(f"puuid-{index}"),
+        ChampionMasteries,
+        MASTERIES_JSON,
+    ),
+    (
+        "v4.get_champion_mastery",
+        lambda pyltover, index: pyltover.euw1.v4.get_champion_mastery(f"puuid-{index}", "1"),
+        ChampionMastery,
+        MASTERY_JSON,
+    ),
+    (
+        "v4.get_total_champion_mastery_score",
+        lambda pyltover, index: pyltover.euw1.v4.get_total_champion_mastery_score(f"puuid-{index}"),
+        int,
+        None,
+    ),
+]
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def _held_bytes(type_: Any, content: bytes, count: int = 100) -> int:
+    adapter = type_adapter(type_)
+    tracemalloc.start()
+    objects = [adapter.validate_json(content) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size // count
+
+
+async def _run(api_name: str, call, requests: int, concurrency: int, latency: float) -> dict:
+    metrics = Metrics()
+    async with Pyltover("token", transport=MockRiot(latency).transport(), metrics=metrics) as pyltover:
+        latencies = []
+
+        async def timed(index: int):
+            started_at = time.perf_counter()
+            await call(pyltover, index)
+            latencies.append(time.perf_counter() - started_at)
+
+        # Warms up the connection pool, the rate limiter and pydantic's validators.
+        async for _ in bounded_map(timed, range(requests, requests + 50), concurrency=concurrency):
+            pass
+        latencies.clear()
+        metrics.endpoints.clear()
+
+        started_at = time.perf_counter()
+        async for _ in bounded_map(timed, range(requests), concurrency=concurrency):
+            pass
+        elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    decode = metrics.endpoint(api_name).decode
+    return {
+        "requests_per_second": requests / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+        "mean_ms": statistics.fmean(latencies) * 1e3,
+        "decode_ms": decode.sum / decode.count * 1e3 if decode.count else None,
+    }
+
+
+async def main(requests: int, concurrency: int, latency: float) -> dict:
+    results = {}
+    print(f"{'endpoint':<38}{'req/s':>10}{'p50':>10}{'p99':>10}{'decode':>10}{'per object':>13}")
+    for api_name, call, type_, content in SCENARIOS:
+        result = await _run(api_name, call, requests, concurrency, latency)
+        result["bytes_per_object"] = _held_bytes(type_, content) if content is not None else None
+        results[api_name] = result
+
+        decode = f"{result['decode_ms']:.3f}ms" if result["decode_ms"] is not None else "-"
+        held = f"{result['bytes_per_object'] / 1024:.1f}KiB" if result["bytes_per_object"] is not None else "-"
+        print(
+            f"{api_name:<38}{result['requests_per_second']:>10.0f}{result['p50_ms']:>8.2f}ms"
+            f"{result['p99_ms']:>8.2f}ms{decode:>10}{held:>13}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the mock server waits before answering")
+    parser.add_argument("--json", help="file to write the results to")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args.requests, args.concurrency, args.latency))
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "latency": args.latency,
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
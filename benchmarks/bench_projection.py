@@ -0,0 +1,60 @@
+"""Decode time and resident size of whole and projected matches.
+
+python -m benchmarks.bench_projection
+"""
+
+import timeit
+import tracemalloc
+
+from pyltover.apis.v5.schema import Match
+from pyltover.projection import projected_model
+
+from benchmarks.mock_riot import MATCH_JSON
+
+
+FIELDS = [
+    "metadata.match_id",
+    "info.game_creation",
+    "info.game_duration",
+    "info.queue_id",
+    *(
+        f"info.participants.{name}"
+        for name in (
+            "puuid",
+            "champion_id",
+            "team_position",
+            "win",
+            "kills",
+            "deaths",
+            "assists",
+            "gold_earned",
+            "total_minions_killed",
+            "vision_score",
+            "total_damage_dealt_to_champions",
+        )
+    ),
+    *(
+        f"info.participants.challenges.{name}"
+        for name in ("kda", "damage_per_minute", "gold_per_minute", "kill_participation", "vision_score_per_minute")
+    ),
+]
+
+
+def _held_bytes(model, count: int) -> int:
+    tracemalloc.start()
+    matches = [model.model_validate_json(MATCH_JSON) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del matches
+    return size // count
+
+
+def main():
+    print(f"{'model':<12}{'decode':>12}{'held per match':>18}")
+    for name, model in (("Match", Match), (f"{len(FIELDS)} fields", projected_model(Match, FIELDS))):
+        decode = min(timeit.repeat(lambda: model.model_validate_json(MATCH_JSON), number=200, repeat=5)) / 200
+        print(f"{name:<12}{decode * 1e3:>10.3f}ms{_held_bytes(model, 200) / 1024:>15.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""In-process riot api serving fixed payloads for every endpoint, so benchmarks run without network nor api key.
+
+    async with Pyltover("token", transport=MockRiot().transport()) as pyltover:
+        match = await pyltover.europe.v5.get_match_by_id("EUW1_1")
+
+Every path parameter is accepted, e.g. any match id returns the same recorded match. Responses carry riot's rate
+limit headers with limits far above what a benchmark sends, so the rate limiter runs its usual bookkeeping without
+ever waiting.
+"""
+
+import asyncio
+import re
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import orjson
+
+
+MATCH_JSON = (Path(__file__).parent.parent / "tests" / "fixtures" / "match.json").read_bytes()
+
+LEAGUE_JSON = orjson.dumps(
+    {
+        "leagueId": "c0a8c5e0-0000-0000-0000-000000000000",
+        "tier": "CHALLENGER",
+        "name": "Sion's Marksmen",
+        "queue": "RANKED_SOLO_5x5",
+        "entries": [
+            {
+                "freshBlood": False,
+                "wins": 200 + index,
+                "inactive": False,
+                "veteran": True,
+                "hotStreak": index % 2 == 0,
+                "rank": "I",
+                "leaguePoints": 1500 - index,
+                "losses": 150,
+                "puuid": f"{index:078d}",
+            }
+            for index in range(300)
+        ],
+    }
+)
+
+LEAGUE_ENTRIES_JSON = orjson.dumps(
+    [
+        {
+            "leagueId": "c0a8c5e0-0000-0000-0000-000000000000",
+            "puuid": f"{index:078d}",
+            "queueType": "RANKED_SOLO_5x5",
+            "tier": "GOLD",
+            "rank": "II",
+            "leaguePoints": index % 100,
+            "wins": 40 + index % 30,
+            "losses": 40,
+            "hotStreak": False,
+            "veteran": False,
+            "freshBlood": index % 3 == 0,
+            "inactive": False,
+        }
+        for index in range(205)
+    ]
+)
+
+LEAGUE_ENTRIES_BY_PUUID_JSON = orjson.dumps(orjson.loads(LEAGUE_ENTRIES_JSON)[:2])
+
+_MASTERY = {
+    "puuid": "0" * 78,
+    "championId": 0,
+    "championLevel": 7,
+    "championPoints": 100_000,
+    "lastPlayTime": 1_750_000_000_000,
+    "championPointsSinceLastLevel": 1000,
+    "championPointsUntilNextLevel": 0,
+    "markRequiredForNextLevel": 2,
+    "tokensEarned": 0,
+    "championSeasonMilestone": 1,
+    "milestoneGrades": ["A-", "S"],
+    "nextSeasonMilestone": {"requireGradeCounts": {"A-": 1}, "rewardMarks": 1, "bonus": False, "totalGamesRequires": 1},
+}
+
+MASTERIES_JSON = orjson.dumps(
+    [{**_MASTERY, "championId": champion_id, "championPoints": 100_000 - champion_id} for champion_id in range(170)]
+)
+
+MASTERY_JSON = orjson.dumps(_MASTERY)
+
+
+def _timeline_json(minutes: int = 30) -> bytes:
+    frames = []
+    for minute in range(minutes):
+        frames.append(
+            {
+                "events": [
+                    {"type": "ITEM_PURCHASED", "timestamp": minute * 60_000 + 10, "participantId": pid, "itemId": 1055}
+                    for pid in range(1, 11)
+                ],
+                "participantFrames": {
+                    str(pid): {
+                        "championStats": {"armor": 30 + minute, "attackSpeed": 100},
+                        "currentGold": 100 * minute,
+                        "damageStats": {"totalDamageDoneToChampions": 250 * minute * pid},
+                        "goldPerSecond": 2,
+                        "jungleMinionsKilled": 0,
+                        "level": 1 + minute // 2,
+                        "minionsKilled": 8 * minute,
+                        "participantId": pid,
+                        "position": {"x": 500 * pid, "y": 400},
+                        "timeEnemySpentControlled": 0,
+                        "totalGold": 500 + 400 * minute,
+                        "xp": 300 * minute,
+                    }
+                    for pid in range(1, 11)
+                },
+                "timestamp": minute * 60_000,
+            }
+        )
+    return orjson.dumps(
+        {
+            "metadata": {
+                "dataVersion": "2",
+                "matchId": "EUW1_1",
+                "participants": [f"puuid-{pid}" for pid in range(10)],
+            },
+            "info": {
+                "endOfGameResult": "GameComplete",
+                "frameInterval": 60000,
+                "gameId": 1,
+                "participants": [{"participantId": pid, "puuid": f"puuid-{pid - 1}"} for pid in range(1, 11)],
+                "frames": frames,
+            },
+        }
+    )
+
+
+TIMELINE_JSON = _timeline_json()
+
+ACCOUNT_JSON = orjson.dumps({"puuid": "0" * 78, "gameName": "Sion", "tagLine": "EUW"})
+
+ROUTES: list[tuple[str, bytes]] = [
+    (r"/riot/account/v1/accounts/(by-puuid/[^/]+|by-riot-id/[^/]+/[^/]+|me)", ACCOUNT_JSON),
+    (
+        r"/riot/account/v1/active-shards/by-game/[^/]+/by-puuid/[^/]+",
+        orjson.dumps({"puuid": "0" * 78, "game": "val", "activeShard": "eu"}),
+    ),
+    (
+        r"/riot/account/v1/region/by-game/[^/]+/by-puuid/[^/]+",
+        orjson.dumps({"puuid": "0" * 78, "game": "lol", "region": "euw1"}),
+    ),
+    (
+        r"/lol/platform/v3/champion-rotations",
+        orjson.dumps({"freeChampionIds": list(range(1, 21)), "freeChampionIdsForNewPlayers": list(range(1, 11))}),
+    ),
+    (r"/lol/champion-mastery/v4/champion-masteries/by-puuid/[^/]+", MASTERIES_JSON),
+    (r"/lol/champion-mastery/v4/champion-masteries/by-puuid/[^/]+/by-champion/[^/]+", MASTERY_JSON),
+    (r"/lol/champion-mastery/v4/champion-masteries/by-puuid/[^/]+/top", orjson.dumps(orjson.loads(MASTERIES_JSON)[:3])),
+    (r"/lol/champion-mastery/v4/scores/by-puuid/[^/]+", b"1190"),
+    (r"/lol/league/v4/(challengerleagues|grandmasterleagues|masterleagues)/by-queue/[^/]+", LEAGUE_JSON),
+    (r"/lol/league/v4/leagues/[^/]+", LEAGUE_JSON),
+    (r"/lol/league/v4/entries/by-puuid/[^/]+", LEAGUE_ENTRIES_BY_PUUID_JSON),
+    (r"/lol/league/v4/entries/[^/]+/[^/]+/[^/]+", LEAGUE_ENTRIES_JSON),
+    (
+        r"/lol/summoner/v4/summoners/by-puuid/[^/]+",
+        orjson.dumps({"profileIconId": 29, "revisionDate": 1_750_000_000_000, "summonerLevel": 420, "puuid": "0" * 78}),
+    ),
+    (r"/lol/match/v5/matches/by-puuid/[^/]+/ids", orjson.dumps([f"EUW1_{index}" for index in range(20)])),
+    (r"/lol/match/v5/matches/[^/]+", MATCH_JSON),
+    (r"/lol/match/v5/matches/[^/]+/timeline", TIMELINE_JSON),
+]
+
+RATE_LIMIT_HEADERS = {
+    "X-App-Rate-Limit": "1000000:10,10000000:600",
+    "X-App-Rate-Limit-Count": "1:10,1:600",
+    "X-Method-Rate-Limit": "1000000:10",
+    "X-Method-Rate-Limit-Count": "1:10",
+}
+
+
+class MockRiot:
+    """Serves `ROUTES` to an httpx client, counting the requests it answered per path pattern.
+
+    `latency` seconds are awaited before every response, to model the time riot takes to answer.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self._routes = [(re.compile(pattern), content) for pattern, content in ROUTES]
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = request.url.path
+        for pattern, content in self._routes:
+            if pattern.fullmatch(path):
+                self.requests[pattern.pattern] += 1
+                return httpx.Response(
+                    200, content=content, headers={"Content-Type": "application/json", **RATE_LIMIT_HEADERS}
+                )
+        return httpx.Response(404, json={"status": {"message": "Not found", "status_code": 404}})
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
@@ -14,6 +14,13 @@ class Tier(StrEnum):
     PLATINUM = "PLATINUM"
     EMERALD = "EMERALD"
     DIAMOND = "DIAMOND"
+    MASTER = "MASTER"
+    GRANDMASTER = "GRANDMASTER"
+    CHALLENGER = "CHALLENGER"
+
+
+# Tiers without divisions, riot lists their players as a single league per queue.
+APEX_TIERS = (Tier.MASTER, Tier.GRANDMASTER, Tier.CHALLENGER)
 
 
 class Division(StrEnum):
@@ -1,4 +1,7 @@
 from typing import Literal, Union
+
+import httpx
+
 from pyltover.base import BasePyltover
 from pyltover import servers
 from pyltover.apis.v1 import schema
@@ -12,13 +15,20 @@ Union[
 
 
 class Pyltover(BasePyltover):
-    def __init__(self, server_addr: str, riot_token: str):
-        super().__init__(riot_token)
+    def __init__(
+        self,
+        server_addr: str,
+        riot_token: str,
+        *,
+        parent: BasePyltover | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(riot_token, parent=parent, async_client=async_client)
         self.server_addr = server_addr
 
     async def get_account_by_puuid(self, puuid: str) -> schema.Account:
         url = urls.get_account_by_puuid.format(server_addr=self.server_addr, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v1.get_account_by_puuid")
         if resp.status_code == 200:
             account = self._response_json(resp, "v1.get_account_by_puuid")
             return schema.Account(
@@ -31,7 +41,7 @@ class Pyltover(BasePyltover):
 
     async def get_account_by_riot_id(self, tag_line: str, game_name: str) -> schema.Account:
         url = urls.get_account_by_riot_id.format(server_addr=self.server_addr, tag_line=tag_line, game_name=game_name)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v1.get_account_by_riot_id")
         if resp.status_code == 200:
             account = self._response_json(resp, "v1.get_account_by_riot_id")
             return schema.Account(
@@ -44,7 +54,7 @@ class Pyltover(BasePyltover):
 
     async def get_active_shard_for_player(self, game: str, puuid: str) -> schema.ActiveShards:
         url = urls.get_active_shard_for_player.format(server_addr=self.server_addr, game=game, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v1.get_active_shard_for_player")
         if resp.status_code == 200:
             active_shard = self._response_json(resp, "v1.get_active_shard_for_player")
             return schema.ActiveShards(
@@ -57,7 +67,7 @@ class Pyltover(BasePyltover):
 
     async def get_active_region(self, game: str, puuid: str) -> schema.ActiveRegion:
         url = urls.get_active_region.format(server_addr=self.server_addr, game=game, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v1.get_active_region")
         if resp.status_code == 200:
             account = self._response_json(resp, "v1.get_active_region")
             return schema.ActiveRegion(game=account["game"], puuid=account["puuid"], region=account["region"])
@@ -66,7 +76,7 @@ class Pyltover(BasePyltover):
 
     async def get_account_by_access_token(self) -> schema.Account:
         url = urls.get_account_by_access_token.format(server_addr=self.server_addr)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v1.get_account_by_access_token")
         if resp.status_code == 200:
             account = self._response_json(resp, "v1.get_account_by_access_token")
             return schema.ActiveRegion(game=account["game"], puuid=account["puuid"], region=account["region"])
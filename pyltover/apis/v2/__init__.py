@@ -1,7 +1,16 @@
+import httpx
+
 from pyltover.base import BasePyltover
 
 
 class Pyltover(BasePyltover):
-    def __init__(self, server_addr: str, riot_token: str):
-        super().__init__(riot_token)
+    def __init__(
+        self,
+        server_addr: str,
+        riot_token: str,
+        *,
+        parent: BasePyltover | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(riot_token, parent=parent, async_client=async_client)
         self.server_addr = server_addr
@@ -1,20 +1,27 @@
+import httpx
+
 from pyltover.base import BasePyltover
 from pyltover.apis.v3.schema import ChampionRotation
 from pyltover.apis.v3 import urls
 
 
 class Pyltover(BasePyltover):
-    def __init__(self, server_addr: str, riot_token: str):
-        super().__init__(riot_token)
+    def __init__(
+        self,
+        server_addr: str,
+        riot_token: str,
+        *,
+        parent: BasePyltover | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(riot_token, parent=parent, async_client=async_client)
         self.server_addr = server_addr
 
     async def get_champion_rotaions(self, load_champ: bool = False):
         url = urls.get_champion_rotaions.format(server_addr=self.server_addr)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v3.get_champion_rotaions")
         if resp.status_code == 200:
-            champion_rotation = self._model_validate_json(
-                ChampionRotation, resp.content, "v3.get_champion_rotaions", resp
-            )
+            champion_rotation = self._decode_json(ChampionRotation, resp.content, "v3.get_champion_rotaions", resp)
             if load_champ:
                 free_champions = []
                 for champion_id in champion_rotation.free_champion_ids:
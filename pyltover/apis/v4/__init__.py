@@ -1,27 +1,36 @@
-from pydantic import TypeAdapter
+import asyncio
+from typing import AsyncIterator, Iterable
+
+import httpx
 
 from pyltover.base import BasePyltover
 from pyltover.apis.v4 import urls
 from pyltover.apis.v4.schema import ChampionMastery, League, LeagueEntry, Summoner
-from pyltover.apis.schema import Division, Tier, QueueTypes
+from pyltover.apis.schema import APEX_TIERS, Division, Tier, QueueTypes
+from pyltover.concurrency import bounded_map
 
 
-ChampionMasteries = TypeAdapter(list[ChampionMastery])
-LeagueEntries = TypeAdapter(list[LeagueEntry])
+ChampionMasteries = list[ChampionMastery]
+LeagueEntries = list[LeagueEntry]
 
 
 class Pyltover(BasePyltover):
-    def __init__(self, server_addr: str, riot_token: str):
-        super().__init__(riot_token)
+    def __init__(
+        self,
+        server_addr: str,
+        riot_token: str,
+        *,
+        parent: BasePyltover | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(riot_token, parent=parent, async_client=async_client)
         self.server_addr = server_addr
 
     async def get_all_champion_mastery(self, puuid: str, load_champ: bool = False):
         url = urls.get_all_champion_mastery.format(server_addr=self.server_addr, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_all_champion_mastery")
         if resp.status_code == 200:
-            champion_mastery = self._adapter_validate_json(
-                ChampionMasteries, resp.content, "v4.get_all_champion_mastery", resp
-            )
+            champion_mastery = self._decode_json(ChampionMasteries, resp.content, "v4.get_all_champion_mastery", resp)
             if load_champ:
                 for mastery in champion_mastery:
                     champion = BasePyltover.champions_db.get_champion_by_id(mastery.champion_id)
@@ -32,9 +41,9 @@ class Pyltover(BasePyltover):
 
     async def get_champion_mastery(self, puuid: str, champion_id: str, load_champ: bool = False) -> ChampionMastery:
         url = urls.get_champion_mastery.format(server_addr=self.server_addr, puuid=puuid, champion_id=champion_id)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_champion_mastery")
         if resp.status_code == 200:
-            champion_mastery = self._model_validate_json(ChampionMastery, resp.content, "v4.get_champion_mastery", resp)
+            champion_mastery = self._decode_json(ChampionMastery, resp.content, "v4.get_champion_mastery", resp)
             if load_champ:
                 champion = BasePyltover.champions_db.get_champion_by_id(champion_mastery.champion_id)
                 champion_mastery.set_champion_info(champion)
@@ -44,9 +53,9 @@ class Pyltover(BasePyltover):
 
     async def get_top_champion_mastery_by_count(self, puuid: str, count: int, load_champ: bool = False):
         url = urls.get_top_champion_mastery_by_count.format(server_addr=self.server_addr, puuid=puuid)
-        resp = await Pyltover.async_client.get(url, params={"count": count})
+        resp = await self._get(url, "v4.get_top_champion_mastery_by_count", params={"count": count})
         if resp.status_code == 200:
-            champion_mastery = self._adapter_validate_json(
+            champion_mastery = self._decode_json(
                 ChampionMasteries, resp.content, "v4.get_top_champion_mastery_by_count", resp
             )
             if load_champ:
@@ -59,68 +68,126 @@ class Pyltover(BasePyltover):
 
     async def get_total_champion_mastery_score(self, puuid: str) -> int:
         url = urls.get_total_champion_mastery_score.format(server_addr=self.server_addr, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_total_champion_mastery_score")
         if resp.status_code == 200:
-            return int(resp.text)
+            return self._response_json(resp, "v4.get_total_champion_mastery_score")
         else:
             self._raise_riot_api_error(resp, "v4.get_total_champion_mastery_score")
 
     # League-V4
     async def get_the_challenger_league_for_queue(self, queue: QueueTypes) -> League:
         url = urls.get_the_challenger_league_for_queue.format(server_addr=self.server_addr, queue=queue.value)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_the_challenger_league_for_queue")
         if resp.status_code == 200:
-            return self._model_validate_json(League, resp.content, "v4.get_the_challenger_league_for_queue", resp)
+            return self._decode_json(League, resp.content, "v4.get_the_challenger_league_for_queue", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_the_challenger_league_for_queue")
 
     async def get_league_entries_for_puuid(self, puuid: str) -> list[LeagueEntry]:
         url = urls.get_league_entries_for_puuid.format(server_addr=self.server_addr, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_league_entries_for_puuid")
         if resp.status_code == 200:
-            return self._adapter_validate_json(LeagueEntries, resp.content, "v4.get_league_entries_for_puuid", resp)
+            return self._decode_json(LeagueEntries, resp.content, "v4.get_league_entries_for_puuid", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_league_entries_for_puuid")
 
-    async def get_all_the_league_entries(self, queue: QueueTypes, tier: Tier, division: Division) -> list[LeagueEntry]:
+    async def get_all_the_league_entries(
+        self, queue: QueueTypes, tier: Tier, division: Division, page: int = 1
+    ) -> list[LeagueEntry]:
         url = urls.get_all_the_league_entries.format(
             server_addr=self.server_addr, queue=queue.value, tier=tier.value, division=division.value
         )
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_all_the_league_entries", params={"page": page})
         if resp.status_code == 200:
-            return self._adapter_validate_json(LeagueEntries, resp.content, "v4.get_all_the_league_entries", resp)
+            return self._decode_json(LeagueEntries, resp.content, "v4.get_all_the_league_entries", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_all_the_league_entries")
 
     async def get_the_grandmaster_league_for_queue(self, queue: QueueTypes) -> League:
         url = urls.get_the_grandmaster_league_for_queue.format(server_addr=self.server_addr, queue=queue.value)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_the_grandmaster_league_for_queue")
         if resp.status_code == 200:
-            return self._model_validate_json(League, resp.content, "v4.get_the_grandmaster_league_for_queue", resp)
+            return self._decode_json(League, resp.content, "v4.get_the_grandmaster_league_for_queue", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_the_grandmaster_league_for_queue")
 
     async def get_league_with_id(self, league_id: str) -> League:
         url = urls.get_league_with_id.format(server_addr=self.server_addr, league_id=league_id)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_league_with_id")
         if resp.status_code == 200:
-            return self._model_validate_json(League, resp.content, "v4.get_league_with_id", resp)
+            return self._decode_json(League, resp.content, "v4.get_league_with_id", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_league_with_id")
 
     async def get_the_master_league_for_queue(self, queue: QueueTypes) -> League:
         url = urls.get_the_master_league_for_queue.format(server_addr=self.server_addr, queue=queue.value)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_the_master_league_for_queue")
         if resp.status_code == 200:
-            return self._model_validate_json(League, resp.content, "v4.get_the_master_league_for_queue", resp)
+            return self._decode_json(League, resp.content, "v4.get_the_master_league_for_queue", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_the_master_league_for_queue")
 
+    async def iter_ladder(
+        self,
+        queues: Iterable[QueueTypes] = (QueueTypes.RANKED_SOLO_5x5, QueueTypes.RANKED_FLEX_SR),
+        tiers: Iterable[Tier] = tuple(Tier),
+        *,
+        concurrency: int = 8,
+    ) -> AsyncIterator[LeagueEntry]:
+        """Streams every ranked player of this platform, as the pages of the ladder arrive.
+
+        Each division of `tiers` is paged through until its first empty page, and the master, grandmaster and
+        challenger leagues are merged in as `LeagueEntry` objects. Up to `concurrency` divisions and apex leagues are
+        crawled at the same time, and the crawl waits for the consumer when it falls behind.
+        """
+        pages: asyncio.Queue[list[LeagueEntry] | None] = asyncio.Queue(maxsize=concurrency)
+        apex_leagues = {
+            Tier.MASTER: self.get_the_master_league_for_queue,
+            Tier.GRANDMASTER: self.get_the_grandmaster_league_for_queue,
+            Tier.CHALLENGER: self.get_the_challenger_league_for_queue,
+        }
+
+        async def crawl_division(queue: QueueTypes, tier: Tier, division: Division):
+            page = 1
+            while entries := await self.get_all_the_league_entries(queue, tier, division, page):
+                await pages.put(entries)
+                page += 1
+
+        async def crawl_apex_league(queue: QueueTypes, tier: Tier):
+            league = await apex_leagues[tier](queue)
+            await pages.put(league.league_entries())
+
+        jobs = []
+        for queue in queues:
+            for tier in tiers:
+                if tier in APEX_TIERS:
+                    jobs.append((crawl_apex_league, queue, tier))
+                else:
+                    jobs.extend((crawl_division, queue, tier, division) for division in Division)
+
+        async def crawl():
+            try:
+                async for _ in bounded_map(lambda job: job[0](*job[1:]), jobs, concurrency=concurrency):
+                    pass
+            except Exception:
+                await pages.put(None)
+                raise
+            await pages.put(None)
+
+        crawler = asyncio.ensure_future(crawl())
+        try:
+            while (entries := await pages.get()) is not None:
+                for entry in entries:
+                    yield entry
+            await crawler
+        finally:
+            crawler.cancel()
+
     # Summoner-V4
     async def get_summoner_by_puuid(self, encrypted_puuid: str) -> Summoner:
         url = urls.get_summoner_by_puuid.format(server_addr=self.server_addr, encrypted_puuid=encrypted_puuid)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v4.get_summoner_by_puuid")
         if resp.status_code == 200:
-            return self._model_validate_json(Summoner, resp.content, "v4.get_summoner_by_puuid", resp)
+            return self._decode_json(Summoner, resp.content, "v4.get_summoner_by_puuid", resp)
         else:
             self._raise_riot_api_error(resp, "v4.get_summoner_by_puuid")
@@ -61,6 +61,27 @@ class League(BaseModel):
     name: str
     queue: str
 
+    def league_entries(self) -> list["LeagueEntry"]:
+        """The entries of the league in the same shape as the ones of `get_all_the_league_entries`."""
+        return [
+            LeagueEntry(
+                leagueId=self.league_id,
+                puuid=item.puuid,
+                queueType=self.queue,
+                tier=self.tier,
+                rank=item.rank,
+                leaguePoints=item.league_points,
+                wins=item.wins,
+                losses=item.losses,
+                hotStreak=item.hot_streak,
+                veteran=item.veteran,
+                freshBlood=item.fresh_blood,
+                inactive=item.inactive,
+                miniSeries=item.mini_series,
+            )
+            for item in self.entries
+        ]
+
 
 class LeagueEntry(BaseModel):
     league_id: str = Field(alias="leagueId")
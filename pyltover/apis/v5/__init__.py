@@ -1,11 +1,33 @@
+import asyncio
+import functools
+from typing import AsyncIterator, Container, Iterable
+
+import httpx
+from pydantic import BaseModel
+
 from pyltover.base import BasePyltover
+from pyltover.concurrency import bounded_map
+from pyltover.lazy import LazyModel
+from pyltover.projection import projected_model
+from pyltover.tracing import finish_trace
 from pyltover.apis.v5 import schema
 from pyltover.apis.v5 import urls
 
 
+# Largest `count` riot accepts when listing match ids.
+MAX_MATCH_IDS_PAGE_SIZE = 100
+
+
 class Pyltover(BasePyltover):
-    def __init__(self, server_addr: str, riot_token: str):
-        super().__init__(riot_token)
+    def __init__(
+        self,
+        server_addr: str,
+        riot_token: str,
+        *,
+        parent: BasePyltover | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(riot_token, parent=parent, async_client=async_client)
         self.server_addr = server_addr
 
     async def get_list_of_match_ids_by_puuid(
@@ -29,24 +51,143 @@ class Pyltover(BasePyltover):
             "count": count,
         }
         params = {key: value for key, value in params.items() if value is not None}
-        resp = await Pyltover.async_client.get(url, params=params)
+        resp = await self._get(url, "v5.get_list_of_match_ids_by_puuid", params=params)
         if resp.status_code == 200:
             return self._response_json(resp, "v5.get_list_of_match_ids_by_puuid")
         else:
             self._raise_riot_api_error(resp, "v5.get_list_of_match_ids_by_puuid")
 
-    async def get_match_by_id(self, match_id: str) -> schema.Match:
+    async def iter_match_ids_by_puuid(
+        self,
+        puuid: str,
+        *,
+        startTime: int | None = None,
+        endTime: int | None = None,
+        queue: int | None = None,
+        type: str | None = None,
+        page_size: int = 100,
+        stop_at: str | Container[str] | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[str]:
+        """Walks the whole match history of a player, newest match first, one `page_size` page at a time.
+
+        Iteration ends with the last page of the history, or right before the first match id in `stop_at`, which
+        can be a single id (e.g. the newest match already stored) or a collection of already seen ids. With
+        `prefetch` the next page is downloaded while the current one is consumed. Riot returns at most 100 ids per
+        page, so `page_size` must be between 1 and 100.
+        """
+        if not 1 <= page_size <= MAX_MATCH_IDS_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_MATCH_IDS_PAGE_SIZE}, got {page_size}")
+        if isinstance(stop_at, str):
+            stop_at = {stop_at}
+        elif stop_at is None:
+            stop_at = ()
+
+        def fetch_page(start: int):
+            return asyncio.ensure_future(
+                self.get_list_of_match_ids_by_puuid(
+                    puuid, startTime=startTime, endTime=endTime, queue=queue, type=type, start=start, count=page_size
+                )
+            )
+
+        start = 0
+        next_page = fetch_page(start)
+        try:
+            while next_page is not None:
+                page = await next_page
+                start += page_size
+                next_page = None
+                has_more = len(page) == page_size
+                if has_more and prefetch:
+                    next_page = fetch_page(start)
+
+                for match_id in page:
+                    if match_id in stop_at:
+                        return
+                    yield match_id
+
+                if has_more and next_page is None:
+                    next_page = fetch_page(start)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def get_match_by_id(
+        self, match_id: str, *, lazy: bool = False, fields: Iterable[str] | type[BaseModel] | None = None
+    ) -> schema.Match | LazyModel | BaseModel:
+        """`lazy=True` returns a `LazyModel` over the raw match instead, which only validates the parts of the
+        match that are read, e.g. `match.info.participants[0].challenges`.
+
+        `fields` only decodes part of the match, either a slim model of the match json or a list of field paths such
+        as `["metadata.match_id", "info.participants.champion_id", "info.participants.challenges.kda"]`, see
+        `pyltover.projection.projected_model`. Every other field is skipped while parsing.
+        """
+        model = schema.Match
+        if fields is not None:
+            model = fields if isinstance(fields, type) else projected_model(schema.Match, fields)
+
+        if self.match_store is not None:
+            content = await self.match_store.get(match_id)
+            if content is not None:
+                return self._load_match(model, content, lazy)
+
         url = urls.get_match_by_id.format(server_addr=self.server_addr, match_id=match_id)
-        resp = await Pyltover.async_client.get(url)
+        resp = await self._get(url, "v5.get_match_by_id")
         if resp.status_code == 200:
-            return self._model_validate_json(schema.Match, resp.text, "v5.get_match_by_id", resp)
+            match = self._load_match(model, resp.content, lazy, resp)
+            if self.match_store is not None:
+                await self.match_store.set(match_id, resp.content)
+            return match
         else:
             self._raise_riot_api_error(resp, "v5.get_match_by_id")
 
-    async def get_match_timeline_by_id(self, puuid: str) -> schema.MatchTimeline:
-        url = urls.get_match_timeline_by_id.format(server_addr=self.server_addr, puuid=puuid)
-        resp = await Pyltover.async_client.get(url)
+    def _load_match(
+        self, model: type[BaseModel], content: bytes, lazy: bool, resp: httpx.Response | None = None
+    ) -> schema.Match | LazyModel | BaseModel:
+        if lazy:
+            with self._timed_decode("v5.get_match_by_id"):
+                match = LazyModel(model, content)
+            finish_trace()
+            return match
+        # A projection is always validated, trusted views would keep the whole match json alive.
+        trusted = None if model is schema.Match else False
+        return self._decode_json(model, content, "v5.get_match_by_id", resp, trusted=trusted)
+
+    async def iter_matches(
+        self,
+        match_ids: Iterable[str],
+        *,
+        concurrency: int = 10,
+        ordered: bool = False,
+        return_exceptions: bool = True,
+        lazy: bool = False,
+        fields: Iterable[str] | type[BaseModel] | None = None,
+    ) -> AsyncIterator[tuple[str, schema.Match | LazyModel | BaseModel | Exception]]:
+        """Fetches many matches concurrently, yielding `(match_id, match)` pairs as they arrive.
+
+        At most `concurrency` matches are downloaded at a time, and new downloads only start when the consumer
+        takes results. A match that fails to download is yielded with its exception in place of the match, unless
+        `return_exceptions=False` which stops the whole batch on the first error. `ordered=True` yields matches in
+        the order of `match_ids`, and `lazy=True` and `fields` work like in `get_match_by_id`.
+        """
+        if fields is not None and not isinstance(fields, type):
+            fields = projected_model(schema.Match, fields)
+        async for match_id, match in bounded_map(
+            functools.partial(self.get_match_by_id, lazy=lazy, fields=fields),
+            match_ids,
+            concurrency=concurrency,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        ):
+            yield match_id, match
+
+    async def get_match_timeline_by_id(self, match_id: str) -> schema.MatchTimeline:
+        url = urls.get_match_timeline_by_id.format(server_addr=self.server_addr, match_id=match_id)
+        resp = await self._get(url, "v5.get_match_timeline_by_id")
         if resp.status_code == 200:
-            return schema.MatchTimeline()
+            with self._timed_decode("v5.get_match_timeline_by_id"):
+                timeline = schema.MatchTimeline.from_json(resp.content)
+            finish_trace()
+            return timeline
         else:
             self._raise_riot_api_error(resp, "v5.get_match_timeline_by_id")
@@ -0,0 +1,158 @@
+from array import array
+from typing import Any, Iterable
+
+import orjson
+
+from pyltover.apis.v5 import schema
+from pyltover.lazy import LazyModel, unwrap_optional
+
+
+# array typecodes of the scalar annotations of the match models, strings are kept in plain lists.
+_TYPECODES = {int: "q", float: "d", bool: "b", str: None}
+_NUMPY_DTYPES = {"q": "int64", "d": "float64", "b": "bool"}
+
+_MATCH_COLUMNS = {
+    "match_id": (("metadata", "matchId"), ("metadata", "match_id"), str),
+    "game_creation": (("info", "gameCreation"), ("info", "game_creation"), int),
+    "game_duration": (("info", "gameDuration"), ("info", "game_duration"), int),
+    "game_version": (("info", "gameVersion"), ("info", "game_version"), str),
+    "queue_id": (("info", "queueId"), ("info", "queue_id"), int),
+}
+
+
+class Column:
+    """A typed column of values, with a null mask marking the rows that had no value.
+
+    Numbers and booleans are kept in an `array.array`, which numpy can use without copying, strings in a list.
+    """
+
+    def __init__(self, name: str, type_: type):
+        self.name = name
+        self.type = type_
+        self.typecode = _TYPECODES[type_]
+        self.values: array | list = array(self.typecode) if self.typecode else []
+        self.mask = bytearray()
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __repr__(self):
+        return f"[Column: <name: {self.name}, type: {self.type.__name__}, rows: {len(self)}>]"
+
+    def append(self, value: Any):
+        if value is None:
+            self.mask.append(1)
+            self.values.append("" if self.typecode is None else 0)
+        else:
+            self.mask.append(0)
+            self.values.append(value if self.typecode is None else self.type(value))
+
+    @property
+    def has_nulls(self) -> bool:
+        return 1 in self.mask
+
+    def to_list(self) -> list:
+        values = self.values if self.type is not bool else [bool(value) for value in self.values]
+        return [None if null else value for value, null in zip(values, self.mask)]
+
+    def to_numpy(self):
+        """Returns the column as a numpy array, or a masked array when it has nulls. Requires numpy."""
+        import numpy
+
+        if self.typecode is None:
+            data = numpy.array(self.values, dtype=object)
+        else:
+            data = numpy.frombuffer(self.values, dtype="int8" if self.typecode == "b" else self.typecode)
+            data = data.astype(_NUMPY_DTYPES[self.typecode], copy=False)
+        if self.has_nulls:
+            return numpy.ma.MaskedArray(data, mask=numpy.frombuffer(self.mask, dtype=bool))
+        return data
+
+
+def _scalar_fields(model) -> dict[str, tuple[str, type]]:
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = unwrap_optional(field.annotation)
+        if annotation in _TYPECODES:
+            fields[name] = (field.alias or name, annotation)
+    return fields
+
+
+PARTICIPANT_FIELDS = _scalar_fields(schema.Participant)
+CHALLENGES_FIELDS = _scalar_fields(schema.Challenges)
+OBJECTIVES = tuple(schema.MatchObjectives.model_fields)
+
+
+def _column_specs(fields: Iterable[str] | None, challenges: Iterable[str], objectives: bool):
+    """(column name, path in the raw json, path in the models, type) of every column."""
+    specs = [(name, keys, attrs, type_) for name, (keys, attrs, type_) in _MATCH_COLUMNS.items()]
+    for name in PARTICIPANT_FIELDS if fields is None else fields:
+        key, type_ = PARTICIPANT_FIELDS[name]
+        specs.append((name, ("participant", key), ("participant", name), type_))
+    for name in challenges:
+        key, type_ = CHALLENGES_FIELDS[name]
+        specs.append(
+            (f"challenges.{name}", ("participant", "challenges", key), ("participant", "challenges", name), type_)
+        )
+    if objectives:
+        for objective in OBJECTIVES:
+            for attr, type_ in (("kills", int), ("first", bool)):
+                path = ("team", "objectives", objective, attr)
+                specs.append((f"team.{objective}.{attr}", path, path, type_))
+    return specs
+
+
+def _dig(obj: Any, path: tuple[str, ...], by_key: bool) -> Any:
+    for step in path:
+        if obj is None:
+            return None
+        obj = obj.get(step) if by_key else getattr(obj, step, None)
+    return obj
+
+
+def participant_columns(
+    matches: Iterable[schema.Match | LazyModel | bytes | str | dict],
+    *,
+    fields: Iterable[str] | None = None,
+    challenges: Iterable[str] = (),
+    objectives: bool = True,
+) -> dict[str, Column]:
+    """Turns matches into one row per participant, returned as a dict of typed columns.
+
+    Matches can be `Match` models, lazy matches or raw match json, which is read without any validation. Every row
+    holds the `match_id`, `game_creation`, `game_duration`, `game_version` and `queue_id` of its match, the scalar
+    `Participant` `fields` (all of them by default), the `challenges` fields given by name (as
+    `challenges.<name>`), and unless `objectives=False` the kills and first flag of every objective of the
+    participant's team (as `team.<objective>.kills` and `team.<objective>.first`).
+    """
+    specs = _column_specs(fields, tuple(challenges), objectives)
+    columns = {name: Column(name, type_) for name, _, _, type_ in specs}
+    appenders = [(columns[name].append, keys, attrs) for name, keys, attrs, _ in specs]
+
+    for match in matches:
+        if isinstance(match, (bytes, str)):
+            match = orjson.loads(match)
+        elif isinstance(match, LazyModel):
+            match = match.parsed_json()
+
+        by_key = isinstance(match, dict)
+        info = _dig(match, ("info",), by_key)
+        participants = _dig(info, ("participants",), by_key) or ()
+        teams = {
+            _dig(team, ("teamId" if by_key else "team_id",), by_key): team
+            for team in _dig(info, ("teams",), by_key) or ()
+        }
+
+        for participant in participants:
+            team = teams.get(_dig(participant, ("teamId" if by_key else "team_id",), by_key))
+            roots = {
+                "metadata": _dig(match, ("metadata",), by_key),
+                "info": info,
+                "participant": participant,
+                "team": team,
+            }
+            for append, keys, attrs in appenders:
+                path = keys if by_key else attrs
+                append(_dig(roots[path[0]], path[1:], by_key))
+
+    return columns
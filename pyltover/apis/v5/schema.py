@@ -1,5 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
+
+from pyltover.apis.v5.timeline import TimelineEvents, TimelineFrames
 
 
 class MatchMetadata(BaseModel):
@@ -429,5 +433,51 @@ class Match(BaseModel):
     info: MatchInfo
 
 
+class TimelineParticipant(BaseModel):
+    participant_id: int = Field(alias="participantId")
+    puuid: str
+
+
+class TimelineInfo(BaseModel):
+    end_of_game_result: Optional[str] = Field(None, alias="endOfGameResult")
+    frame_interval: int = Field(alias="frameInterval")
+    game_id: Optional[int] = Field(None, alias="gameId")
+    participants: list[TimelineParticipant] = []
+
+
 class MatchTimeline(BaseModel):
-    pass
+    """Timeline of a match, with its frames and events kept in typed arrays instead of one object per value."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    metadata: MatchMetadata
+    info: TimelineInfo
+    frames: TimelineFrames
+    events: TimelineEvents
+
+    @classmethod
+    def from_json(cls, content: bytes | str) -> "MatchTimeline":
+        data = orjson.loads(content)
+        info = data["info"]
+        frames = TimelineFrames(max(len(info.get("participants") or ()), 10))
+        events = TimelineEvents()
+        for frame in info.get("frames") or ():
+            frames.append(frame)
+            for event in frame.get("events") or ():
+                events.append(event)
+        return cls(
+            metadata=MatchMetadata.model_validate(data["metadata"]),
+            info=TimelineInfo.model_validate(info),
+            frames=frames,
+            events=events,
+        )
+
+    def gold_diff_at(self, minute: float) -> int:
+        """Total gold of team 100 minus the one of team 200 at `minute`."""
+        frame = self.frames.frame_at(minute)
+        return self.frames.team_total("total_gold", frame, 100) - self.frames.team_total("total_gold", frame, 200)
+
+    def xp_diff_at(self, minute: float) -> int:
+        """Total xp of team 100 minus the one of team 200 at `minute`."""
+        frame = self.frames.frame_at(minute)
+        return self.frames.team_total("xp", frame, 100) - self.frames.team_total("xp", frame, 200)
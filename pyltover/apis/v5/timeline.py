@@ -0,0 +1,195 @@
+from array import array
+
+
+# (attribute, path in the participant frame json) of every per participant stat of a timeline frame.
+PARTICIPANT_FRAME_STATS = (
+    ("current_gold", ("currentGold",)),
+    ("gold_per_second", ("goldPerSecond",)),
+    ("jungle_minions_killed", ("jungleMinionsKilled",)),
+    ("level", ("level",)),
+    ("minions_killed", ("minionsKilled",)),
+    ("time_enemy_spent_controlled", ("timeEnemySpentControlled",)),
+    ("total_gold", ("totalGold",)),
+    ("xp", ("xp",)),
+    ("position_x", ("position", "x")),
+    ("position_y", ("position", "y")),
+    *(
+        (f"champion_stats_{name}", ("championStats", key))
+        for name, key in (
+            ("ability_haste", "abilityHaste"),
+            ("ability_power", "abilityPower"),
+            ("armor", "armor"),
+            ("armor_pen", "armorPen"),
+            ("armor_pen_percent", "armorPenPercent"),
+            ("attack_damage", "attackDamage"),
+            ("attack_speed", "attackSpeed"),
+            ("bonus_armor_pen_percent", "bonusArmorPenPercent"),
+            ("bonus_magic_pen_percent", "bonusMagicPenPercent"),
+            ("cc_reduction", "ccReduction"),
+            ("cooldown_reduction", "cooldownReduction"),
+            ("health", "health"),
+            ("health_max", "healthMax"),
+            ("health_regen", "healthRegen"),
+            ("lifesteal", "lifesteal"),
+            ("magic_pen", "magicPen"),
+            ("magic_pen_percent", "magicPenPercent"),
+            ("magic_resist", "magicResist"),
+            ("movement_speed", "movementSpeed"),
+            ("omnivamp", "omnivamp"),
+            ("physical_vamp", "physicalVamp"),
+            ("power", "power"),
+            ("power_max", "powerMax"),
+            ("power_regen", "powerRegen"),
+            ("spell_vamp", "spellVamp"),
+        )
+    ),
+    *(
+        (f"damage_stats_{name}", ("damageStats", key))
+        for name, key in (
+            ("magic_damage_done", "magicDamageDone"),
+            ("magic_damage_done_to_champions", "magicDamageDoneToChampions"),
+            ("magic_damage_taken", "magicDamageTaken"),
+            ("physical_damage_done", "physicalDamageDone"),
+            ("physical_damage_done_to_champions", "physicalDamageDoneToChampions"),
+            ("physical_damage_taken", "physicalDamageTaken"),
+            ("total_damage_done", "totalDamageDone"),
+            ("total_damage_done_to_champions", "totalDamageDoneToChampions"),
+            ("total_damage_taken", "totalDamageTaken"),
+            ("true_damage_done", "trueDamageDone"),
+            ("true_damage_done_to_champions", "trueDamageDoneToChampions"),
+            ("true_damage_taken", "trueDamageTaken"),
+        )
+    ),
+)
+
+# Keys of the event json that end up in the participant_id, team_id and detail columns, first present one wins.
+_EVENT_PARTICIPANT_KEYS = ("participantId", "killerId", "creatorId")
+_EVENT_TEAM_KEYS = ("teamId", "killerTeamId")
+_EVENT_DETAIL_KEYS = ("monsterType", "buildingType", "wardType", "killType", "levelUpType", "towerType", "laneType")
+
+
+def _first(data: dict, keys: tuple[str, ...], default):
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+class TimelineFrames:
+    """Per minute participant stats of a timeline, one int32 array per stat.
+
+    The value of a participant (1 to `participant_count`) in a frame is at `frame * participant_count +
+    participant_id - 1` of each array, `stat(name, frame, participant_id)` does the indexing. Float stats (e.g. attack
+    speed) are truncated by riot already, so every stat fits an int.
+    """
+
+    def __init__(self, participant_count: int = 10):
+        self.participant_count = participant_count
+        self.timestamps = array("q")
+        self.stats: dict[str, array] = {name: array("i") for name, _ in PARTICIPANT_FRAME_STATS}
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __repr__(self):
+        return f"[TimelineFrames: <frames: {len(self)}, participants: {self.participant_count}>]"
+
+    def append(self, frame: dict):
+        self.timestamps.append(frame.get("timestamp", 0))
+        participant_frames = frame.get("participantFrames") or {}
+        for participant_id in range(1, self.participant_count + 1):
+            participant_frame = participant_frames.get(str(participant_id)) or {}
+            for name, path in PARTICIPANT_FRAME_STATS:
+                value = participant_frame
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                self.stats[name].append(int(value or 0))
+
+    def stat(self, name: str, frame: int, participant_id: int) -> int:
+        return self.stats[name][frame * self.participant_count + participant_id - 1]
+
+    def participant_series(self, name: str, participant_id: int) -> array:
+        """Values of a stat for one participant, one per frame."""
+        return self.stats[name][participant_id - 1 :: self.participant_count]
+
+    def frame_at(self, minute: float) -> int:
+        """Index of the frame closest to `minute`, frames are a few milliseconds late compared to the minutes.
+
+        Raises `ValueError` on a timeline without frames, e.g. of a remade game.
+        """
+        if not self.timestamps:
+            raise ValueError("the timeline has no frames")
+        milliseconds = minute * 60_000
+        return min(range(len(self.timestamps)), key=lambda index: abs(self.timestamps[index] - milliseconds))
+
+    def team_total(self, name: str, frame: int, team_id: int) -> int:
+        """Sum of a stat over a team, participants 1 to 5 are team 100 and the rest team 200."""
+        half = self.participant_count // 2
+        first = 1 if team_id == 100 else half + 1
+        return sum(self.stat(name, frame, participant_id) for participant_id in range(first, first + half))
+
+
+class TimelineEvents:
+    """Events of a timeline, as typed columns of equal length.
+
+    `types` and `details` index into the `type_names` and `detail_names` string tables. Columns an event has no
+    value for hold 0 (-1 for positions). The assisting participants of event `i` are
+    `assisting_participant_ids[assisting_offsets[i]:assisting_offsets[i + 1]]`.
+    """
+
+    def __init__(self):
+        self.type_names: list[str] = []
+        self.detail_names: list[str] = [""]
+        self._type_index: dict[str, int] = {}
+        self._detail_index: dict[str, int] = {"": 0}
+
+        self.timestamps = array("q")
+        self.types = array("H")
+        self.participant_ids = array("b")
+        self.victim_ids = array("b")
+        self.team_ids = array("h")
+        self.item_ids = array("i")
+        self.position_x = array("i")
+        self.position_y = array("i")
+        self.details = array("H")
+        self.assisting_offsets = array("I", [0])
+        self.assisting_participant_ids = array("b")
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __repr__(self):
+        return f"[TimelineEvents: <events: {len(self)}, types: {len(self.type_names)}>]"
+
+    @staticmethod
+    def _intern(value: str, names: list[str], index: dict[str, int]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(names)
+            names.append(value)
+        return code
+
+    def append(self, event: dict):
+        self.timestamps.append(event.get("timestamp", 0))
+        self.types.append(self._intern(event.get("type", ""), self.type_names, self._type_index))
+        self.participant_ids.append(_first(event, _EVENT_PARTICIPANT_KEYS, 0))
+        self.victim_ids.append(event.get("victimId") or 0)
+        self.team_ids.append(_first(event, _EVENT_TEAM_KEYS, 0))
+        self.item_ids.append(event.get("itemId") or 0)
+        position = event.get("position") or {}
+        self.position_x.append(position.get("x", -1))
+        self.position_y.append(position.get("y", -1))
+        self.details.append(self._intern(_first(event, _EVENT_DETAIL_KEYS, ""), self.detail_names, self._detail_index))
+        self.assisting_participant_ids.extend(event.get("assistingParticipantIds") or ())
+        self.assisting_offsets.append(len(self.assisting_participant_ids))
+
+    def of_type(self, type_name: str) -> list[int]:
+        """Indexes of the events of one type, e.g. `CHAMPION_KILL`."""
+        code = self._type_index.get(type_name)
+        if code is None:
+            return []
+        return [index for index, event_type in enumerate(self.types) if event_type == code]
+
+    def assisting(self, index: int) -> array:
+        return self.assisting_participant_ids[self.assisting_offsets[index] : self.assisting_offsets[index + 1]]
@@ -1,83 +1,605 @@
+import asyncio
+import contextlib
+import copy
 import json
 import logging
+import os
+import time
+from pathlib import Path
 from typing import Any, NoReturn
 
 import httpx
+import orjson
 from pydantic import BaseModel as PydanticBaseModel, TypeAdapter, ValidationError
 
 from pyltover.apis.errors import translate_error
+from pyltover.cache import ResponseCache
+from pyltover.decode import trusted_view, type_adapter
+from pyltover.keys import REJECTED_KEY_STATUS_CODES, RIOT_TOKEN_HEADER, KeyPool
+from pyltover.metrics import MetricsListener
+from pyltover.tracing import RequestTrace, Tracer, current_trace, finish_trace, traced_phase
+from pyltover.ratelimit import RateLimiter
+from pyltover.retry import RateLimitType, RetryPolicy, rate_limit_type, retry_after_seconds
+from pyltover.scheduler import PriorityScheduler
 from pyltover.schema import ChampionWithDetails, ChampionWithDetailsResponse, ChampionsDB
+from pyltover.singleflight import SingleFlight
+from pyltover.store import MatchStore
 
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=30.0)
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+def create_async_client(
+    riot_token: str | None,
+    *,
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    http2: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Creates the client every api object of a `Pyltover` root sends its requests with.
+
+    One pool is shared by all the platform and regional servers, so each of them keeps its connections warm. httpx
+    negotiates gzip/deflate compression by default, and brotli/zstd when the `brotli`/`zstandard` packages are
+    installed. `http2=True` needs the `h2` package, e.g. `pip install pyltover[http2]`. Without a `riot_token` the
+    token is sent with each request, as done for the keys of a `KeyPool`.
+
+    httpx ignores `limits` and `http2` when a `transport` is given, the pool is configured on the transport instead,
+    e.g. `RecordingTransport(path, httpx.AsyncHTTPTransport(limits=limits, http2=True))`. Passing both raises a
+    `ValueError` rather than silently dropping the pool options.
+    """
+    if transport is not None and (http2 or limits != DEFAULT_LIMITS):
+        raise ValueError(
+            "limits and http2 are ignored with a transport, configure the pool on the transport instead, e.g. "
+            "httpx.AsyncHTTPTransport(limits=limits, http2=http2)"
+        )
+    return httpx.AsyncClient(
+        headers={RIOT_TOKEN_HEADER: riot_token} if riot_token is not None else None,
+        limits=limits,
+        timeout=timeout,
+        http2=http2,
+        transport=transport,
+    )
+
+
+def _write_atomically(path: Path, content: bytes):
+    """Writes `content` to `path` through a temporary file, so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary_path.write_bytes(content)
+    os.replace(temporary_path, path)
+
+
 class BasePyltover:
     ddragon_version = "15.15.1"
     champions_db = None
-    async_client = None
+    champion_details_db = {"by_id": {}, "by_name": {}}
     ddragon_cdn_address = "ddragon.leagueoflegends.com"
+    _latest_ddragon_version: tuple[float, str | None] = (0.0, None)
+
+    _shared_attributes = (
+        "async_client",
+        "rate_limiter",
+        "key_pool",
+        "retry_policy",
+        "cache",
+        "single_flight",
+        "match_store",
+        "trusted",
+        "metrics",
+        "tracer",
+        "scheduler",
+        "priority",
+    )
 
     def __init__(
         self,
-        riot_token: str,
+        riot_token: str | KeyPool,
+        *,
+        parent: "BasePyltover | None" = None,
+        async_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        match_store: MatchStore | None = None,
+        trusted: bool = False,
+        metrics: MetricsListener | None = None,
+        tracer: Tracer | None = None,
+        scheduler: PriorityScheduler | None = None,
     ):
+        """`parent` makes this api object share the client, rate limits and options of another one, which is how
+        the servers and api versions of a `Pyltover` root share a single connection pool.
+
+        `riot_token` is either an api key or a `KeyPool` spreading the requests over several ones."""
         self.riot_token = riot_token
+        self._owns_client = False
+
+        if parent is not None:
+            for name in self._shared_attributes:
+                setattr(self, name, getattr(parent, name))
+            return
 
-        BasePyltover.async_client = httpx.AsyncClient(headers={"X-Riot-Token": self.riot_token})
-        BasePyltover.champion_details_db = {"by_id": {}, "by_name": {}}
+        self.key_pool = riot_token if isinstance(riot_token, KeyPool) else None
+        if async_client is None:
+            async_client = create_async_client(riot_token if self.key_pool is None else None)
+            self._owns_client = True
+        self.async_client = async_client
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.single_flight = single_flight if single_flight is not None else SingleFlight()
+        self.match_store = match_store
+        self.trusted = trusted
+        self.metrics = metrics
+        self.tracer = tracer
+        self.scheduler = scheduler
+        self.priority = None
+
+    async def aclose(self):
+        """Closes the connection pool, if it was created by this object."""
+        if self._owns_client:
+            await self.async_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     @classmethod
     async def init_champions_db(cls):
         """preloads champions data"""
-        BasePyltover.champions_db = await cls._fetch_ddragon_champions_json()
+        async with httpx.AsyncClient() as async_client:
+            BasePyltover.champions_db = await cls._fetch_ddragon_champions_json(async_client)
+
+    @classmethod
+    async def preload_champion_details(
+        cls, cache_dir: str | Path | None = None, async_client: httpx.AsyncClient | None = None
+    ):
+        """Preloads every champion with its details at once from ddragon's `championFull.json`, filling both
+        `champions_db` and the champion details instead of downloading them one champion at a time.
+
+        With `cache_dir` the file is kept on disk per `ddragon_version`, so later starts load it without a request.
+        """
+        version = cls.ddragon_version
+        if async_client is None:
+            async with httpx.AsyncClient() as async_client:
+                champions = await cls._load_champion_full(async_client, version, cache_dir)
+        else:
+            champions = await cls._load_champion_full(async_client, version, cache_dir)
+        cls._swap_ddragon_data(version, *cls._champion_full_dbs(champions))
+
+    @classmethod
+    async def latest_ddragon_version(cls, async_client: httpx.AsyncClient | None = None, max_age: float = 600) -> str:
+        """The newest patch of ddragon, from its `versions.json`. The answer is reused for `max_age` seconds."""
+        checked_at, version = BasePyltover._latest_ddragon_version
+        if version is not None and time.monotonic() - checked_at < max_age:
+            return version
+
+        url = f"https://{BasePyltover.ddragon_cdn_address}/api/versions.json"
+        if async_client is None:
+            async with httpx.AsyncClient() as async_client:
+                resp = await async_client.get(url)
+        else:
+            resp = await async_client.get(url)
+        resp.raise_for_status()
+        version = cls._parse_json(resp, "ddragon.versions")[0]
+        BasePyltover._latest_ddragon_version = (time.monotonic(), version)
+        return version
+
+    @classmethod
+    async def refresh_ddragon(
+        cls,
+        *,
+        details: bool = False,
+        cache_dir: str | Path | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ) -> bool:
+        """Switches `ddragon_version` to the newest patch when it changed, returning whether it did.
+
+        The champion data of the new patch is downloaded first (with their details when `details=True`, see
+        `preload_champion_details`) and swapped in at once, so calls running meanwhile keep using the previous patch.
+        """
+        if async_client is None:
+            async with httpx.AsyncClient() as async_client:
+                return await cls.refresh_ddragon(details=details, cache_dir=cache_dir, async_client=async_client)
+
+        version = await cls.latest_ddragon_version(async_client)
+        if version == BasePyltover.ddragon_version and BasePyltover.champions_db is not None:
+            return False
+
+        if details:
+            champions = await cls._load_champion_full(async_client, version, cache_dir)
+            champions_db, champion_details_db = cls._champion_full_dbs(champions)
+        else:
+            champions_db = await cls._fetch_ddragon_champions_json(async_client, version)
+            champion_details_db = {"by_id": {}, "by_name": {}}
+        cls._swap_ddragon_data(version, champions_db, champion_details_db)
+        logger.info("ddragon switched to patch %s", version)
+        return True
+
+    @classmethod
+    def start_ddragon_refresh(
+        cls, interval: float = 3600, *, details: bool = False, cache_dir: str | Path | None = None
+    ) -> asyncio.Task:
+        """Calls `refresh_ddragon` every `interval` seconds in a background task, starting right away. Failed
+        refreshes are logged and tried again at the next interval. Cancel the returned task to stop it."""
+
+        async def refresh_forever():
+            async with httpx.AsyncClient() as async_client:
+                while True:
+                    try:
+                        await cls.refresh_ddragon(details=details, cache_dir=cache_dir, async_client=async_client)
+                    except Exception:
+                        logger.exception("ddragon refresh failed, retrying in %ss", interval)
+                    await asyncio.sleep(interval)
+
+        return asyncio.create_task(refresh_forever())
+
+    @staticmethod
+    def _swap_ddragon_data(version: str, champions_db: ChampionsDB, champion_details_db: dict):
+        # No await between the assignments, so no call ever sees the data of two patches.
+        BasePyltover.ddragon_version = version
+        BasePyltover.champions_db = champions_db
+        BasePyltover.champion_details_db = champion_details_db
+
+    @staticmethod
+    def _champion_full_dbs(champions: ChampionWithDetailsResponse) -> tuple[ChampionsDB, dict]:
+        champions_db = ChampionsDB(
+            type=champions.type, format=champions.format, version=champions.version, data=champions.data
+        )
+        champion_details_db = {
+            "by_id": {int(champion.key): champion for champion in champions.data.values()},
+            "by_name": dict(champions.data),
+        }
+        return champions_db, champion_details_db
+
+    @classmethod
+    async def _load_champion_full(
+        cls, async_client: httpx.AsyncClient, version: str, cache_dir: str | Path | None
+    ) -> ChampionWithDetailsResponse:
+        path = Path(cache_dir).expanduser() / f"championFull-{version}.json" if cache_dir is not None else None
+        if path is not None and path.exists():
+            content = await asyncio.to_thread(path.read_bytes)
+            try:
+                return cls._model_validate_json(ChampionWithDetailsResponse, content, "ddragon.championFull")
+            except ValidationError:
+                logger.warning("Ignoring invalid cached %s", path)
+
+        content = await cls._fetch_ddragon_champion_full_json(async_client, version)
+        champions = cls._model_validate_json(ChampionWithDetailsResponse, content, "ddragon.championFull")
+        if path is not None:
+            await asyncio.to_thread(_write_atomically, path, content)
+        return champions
 
     async def get_champion_details(self, id: int) -> ChampionWithDetails:
-        if not self.champion_details_db["by_id"].get(id):
-            name = self.champions_db.get_champion_by_id(id).name
-            champion_details = await self._fetch_ddragon_champion_details(name)
-            self.champion_details_db["by_id"][id] = champion_details
-            self.champion_details_db["by_name"][name] = champion_details
-        return self.champion_details_db["by_id"][id]
+        champion_details_db = self.champion_details_db
+        if not champion_details_db["by_id"].get(id):
+            name = self.champions_db.get_champion_by_id(id).id
+            champion_details = await self.single_flight.do(
+                ("ddragon", name), lambda: self._fetch_ddragon_champion_details(self.async_client, name)
+            )
+            champion_details_db["by_id"][id] = champion_details
+            champion_details_db["by_name"][name] = champion_details
+        return champion_details_db["by_id"][id]
 
     async def get_champion_details_by_name(self, name: str) -> ChampionWithDetails:
-        if not self.champion_details_db["by_id"].get(name):
-            champion_details = await self._fetch_ddragon_champion_details(name)
-            self.champion_details_db["by_name"][name] = champion_details
-            self.champion_details_db["by_id"][champion_details.id] = champion_details
-        return self.champion_details_db["by_name"][name]
+        champion_details_db = self.champion_details_db
+        if not champion_details_db["by_name"].get(name):
+            champion_details = await self.single_flight.do(
+                ("ddragon", name), lambda: self._fetch_ddragon_champion_details(self.async_client, name)
+            )
+            champion_details_db["by_name"][name] = champion_details
+            champion_details_db["by_id"][int(champion_details.key)] = champion_details
+        return champion_details_db["by_name"][name]
 
     @classmethod
-    async def _fetch_ddragon_champions_json(cls) -> ChampionsDB:
-        url = f"https://{BasePyltover.ddragon_cdn_address}/cdn/{cls.ddragon_version}/data/en_US/champion.json"
-        resp = await BasePyltover.async_client.get(url)
+    async def _fetch_ddragon_champions_json(
+        cls, async_client: httpx.AsyncClient, version: str | None = None
+    ) -> ChampionsDB:
+        version = version or cls.ddragon_version
+        url = f"https://{BasePyltover.ddragon_cdn_address}/cdn/{version}/data/en_US/champion.json"
+        resp = await async_client.get(url)
         return cls._model_validate_json(ChampionsDB, resp.content, "ddragon._fetch_ddragon_champions_json", resp)
 
     @classmethod
-    async def _fetch_ddragon_champion_details(cls, name: str) -> ChampionWithDetails:
+    async def _fetch_ddragon_champion_full_json(cls, async_client: httpx.AsyncClient, version: str) -> bytes:
+        url = f"https://{BasePyltover.ddragon_cdn_address}/cdn/{version}/data/en_US/championFull.json"
+        resp = await async_client.get(url)
+        resp.raise_for_status()
+        return resp.content
+
+    @classmethod
+    async def _fetch_ddragon_champion_details(cls, async_client: httpx.AsyncClient, name: str) -> ChampionWithDetails:
         url = f"https://{BasePyltover.ddragon_cdn_address}/cdn/{cls.ddragon_version}/data/en_US/champion/{name}.json"
-        resp = await cls.async_client.get(url)
+        resp = await async_client.get(url)
         champion_response = cls._model_validate_json(
             ChampionWithDetailsResponse, resp.content, "ddragon._fetch_ddragon_champion_details", resp
         )
         return champion_response.data[name]
 
+    def with_options(
+        self,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        max_retries: int | None = None,
+        trusted: bool | None = None,
+        priority: str | None = None,
+    ):
+        """Returns a copy of this api object with different request options, e.g. a per call retry budget:
+
+        `await pyltover.europe.v5.with_options(max_retries=10).get_match_by_id(match_id)`
+
+        Called on the root or on a server, the options apply to every api object below the copy.
+
+        `trusted=True` returns the responses without validating them, see `pyltover.decode.trusted_view`. `priority`
+        is the class of the requests in the queue of the root's `scheduler`, see `PriorityScheduler`.
+        """
+        clone = copy.copy(self)
+        if trusted is not None:
+            clone.trusted = trusted
+        if priority is not None:
+            clone.priority = priority
+        if retry_policy is not None:
+            clone.retry_policy = retry_policy
+        if max_retries is not None:
+            clone.retry_policy = clone.retry_policy.model_copy(update={"max_retries": max_retries})
+        clone._rebuild_children()
+        return clone
+
+    def _rebuild_children(self):
+        """Recreates the api objects below this one, so a clone made by `with_options` passes its options on."""
+
+    async def _get(self, url: str, api_name: str, params: dict | None = None) -> httpx.Response:
+        """Sends a GET request to riot's api, waiting for the rate limits of `api_name` on this server first.
+
+        Failed requests are retried as long as `retry_policy` allows it, the last response is returned as is.
+        Successful responses of endpoints with a ttl in `cache` are served from it without a request, and concurrent
+        identical requests share a single one.
+
+        When `tracer` samples the call, its phases are timed until the response is decoded, see `RequestTrace`.
+        """
+        key = ResponseCache.key(url, params)
+        # Only responses landing in the cache can be read by other nodes waiting for the same request.
+        shared = self.cache is not None and self.cache.is_cached(api_name)
+        if self.tracer is None:
+            return await self.single_flight.do(
+                ("GET", key), lambda: self._get_or_cached(url, api_name, params, key), shared=shared
+            )
+
+        trace = RequestTrace(self.server_addr, api_name, url, self.tracer) if self.tracer.sample() else None
+        current_trace.set(trace)
+        try:
+            return await self.single_flight.do(
+                ("GET", key), lambda: self._get_or_cached(url, api_name, params, key), shared=shared
+            )
+        except BaseException as error:
+            if trace is not None:
+                trace.error = error
+                finish_trace()
+            raise
+
+    async def _get_or_cached(self, url: str, api_name: str, params: dict | None, key: str) -> httpx.Response:
+        if self.cache is None or not self.cache.is_cached(api_name):
+            return await self._get_with_retries(url, api_name, params)
+
+        content = await self.cache.get(api_name, key)
+        if content is not None:
+            trace = current_trace.get()
+            if trace is not None:
+                trace.cache_hit = True
+                trace.status_code = 200
+            return httpx.Response(
+                200,
+                content=content,
+                headers={"Content-Type": "application/json"},
+                request=httpx.Request("GET", url, params=params),
+            )
+
+        resp = await self._get_with_retries(url, api_name, params)
+        if resp.status_code == 200:
+            await self.cache.set(api_name, key, resp.content)
+        return resp
+
+    async def _get_with_retries(self, url: str, api_name: str, params: dict | None = None) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                resp = await self._send(url, api_name, params)
+            except httpx.TransportError as error:
+                if not self.retry_policy.should_retry_error(error, attempt):
+                    raise
+                delay = self.retry_policy.backoff(attempt)
+                logger.warning("%s failed with %r, retrying in %.2fs", api_name, error, delay)
+            else:
+                if not self.retry_policy.should_retry(resp, attempt):
+                    return resp
+                delay = self._retry_delay(resp, api_name, attempt)
+                logger.warning("%s returned %s, retrying in %.2fs", api_name, resp.status_code, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send(self, url: str, api_name: str, params: dict | None = None) -> httpx.Response:
+        trace = current_trace.get()
+        queued_at = time.perf_counter()
+        options = {}
+        if self.key_pool is None:
+            key = None
+            rate_limiter = self.rate_limiter
+            await self._acquire(rate_limiter, api_name)
+        else:
+            key = await self._acquire(self.key_pool, api_name)
+            rate_limiter = key.rate_limiter
+            options["headers"] = {RIOT_TOKEN_HEADER: key.token}
+        started_at = time.perf_counter()
+        if trace is not None:
+            trace.attempts += 1
+            trace.add("limiter_wait", started_at - queued_at)
+            options["extensions"] = {"trace": trace.httpx_trace}
+
+        resp = None
+        try:
+            resp = await self.async_client.get(url, params=params, **options)
+        except httpx.TransportError as error:
+            if self.metrics is not None:
+                self.metrics.on_transport_error(self.server_addr, api_name, error, time.perf_counter() - started_at)
+            raise
+        finally:
+            rate_limiter.update(self.server_addr, api_name, resp.headers if resp is not None else None)
+        if self.metrics is not None:
+            self.metrics.on_response(self.server_addr, api_name, resp, time.perf_counter() - started_at)
+        if trace is not None:
+            trace.status_code = resp.status_code
+        if key is not None:
+            if resp.status_code not in REJECTED_KEY_STATUS_CODES:
+                self.key_pool.answered(key)
+            elif self.key_pool.refused(key):
+                return await self._send(url, api_name, params)
+        return resp
+
+    async def _acquire(self, limiter: RateLimiter | KeyPool, api_name: str) -> Any:
+        if self.scheduler is None:
+            return await limiter.acquire(self.server_addr, api_name)
+        return await self.scheduler.acquire(limiter, self.server_addr, api_name, self.priority)
+
+    def _retry_delay(self, resp: httpx.Response, api_name: str, attempt: int) -> float:
+        limit_type = rate_limit_type(resp)
+        retry_after = retry_after_seconds(resp)
+        if resp.status_code == 429 and limit_type in (RateLimitType.APPLICATION, RateLimitType.METHOD):
+            # The rate limiter holds back this request, and every other one sharing the limit, for retry_after.
+            if retry_after is None:
+                retry_after = self.retry_policy.backoff(attempt)
+            self._rate_limiter_of(resp).block(self.server_addr, api_name, limit_type, retry_after)
+            return 0.0
+        return self.retry_policy.delay(resp, attempt)
+
+    def _rate_limiter_of(self, resp: httpx.Response) -> RateLimiter:
+        """The rate limiter counting the request of `resp`, the one of the key it was sent with in a `KeyPool`."""
+        if self.key_pool is not None:
+            key = self.key_pool.key(resp.request.headers.get(RIOT_TOKEN_HEADER, ""))
+            if key is not None:
+                return key.rate_limiter
+        return self.rate_limiter
+
+    def _response_json(self, resp: httpx.Response, api_name: str) -> Any:
+        """Parses the body of an endpoint returning plain json values, timed in `metrics` like `_decode_json`."""
+        if self.metrics is None:
+            return self._parse_json(resp, api_name)
+        started_at = time.perf_counter()
+        try:
+            return self._parse_json(resp, api_name)
+        finally:
+            self.metrics.on_decode(api_name, time.perf_counter() - started_at)
+
     @staticmethod
-    def _response_json(resp: httpx.Response, api_name: str) -> dict:
+    def _parse_json(resp: httpx.Response, api_name: str) -> Any:
+        trace = current_trace.get()
+        started_at = time.perf_counter()
         try:
             return resp.json()
         except json.decoder.JSONDecodeError:
-            logger.exception(
-                "JSON decode error in %s (status=%s, url=%s). Response content: %r",
-                api_name,
-                resp.status_code,
-                resp.url,
-                resp.text,
-            )
+            BasePyltover._log_json_decode_error(api_name, resp.content, resp)
             raise
+        finally:
+            if trace is not None:
+                trace.add("decode", time.perf_counter() - started_at)
+                finish_trace()
 
     def _raise_riot_api_error(self, resp: httpx.Response, api_name: str) -> NoReturn:
-        raise translate_error(self._response_json(resp, api_name))
+        raise translate_error(self._parse_json(resp, api_name))
+
+    @contextlib.contextmanager
+    def _timed_decode(self, api_name: str):
+        """Times a response decoded without `_decode_json`, in the current trace and in `metrics`."""
+        started_at = time.perf_counter()
+        try:
+            with traced_phase("decode"):
+                yield
+        finally:
+            if self.metrics is not None:
+                self.metrics.on_decode(api_name, time.perf_counter() - started_at)
+
+    def _decode_json(
+        self,
+        type_: Any,
+        content: bytes | str,
+        api_name: str,
+        resp: httpx.Response | None = None,
+        *,
+        trusted: bool | None = None,
+    ) -> Any:
+        """Validates a response body as `type_`, a model or e.g. a list of models. When this api object is `trusted`
+        the body is only parsed with orjson and returned as a trusted view of `type_`, see `trusted_view`."""
+        trusted = self.trusted if trusted is None else trusted
+        trace = current_trace.get()
+        if self.metrics is None and trace is None:
+            return self._decode_json_as(type_, content, api_name, resp, trusted)
+
+        started_at = time.perf_counter()
+        try:
+            if trace is not None:
+                return self._decode_json_traced(trace, type_, content, api_name, resp, trusted)
+            return self._decode_json_as(type_, content, api_name, resp, trusted)
+        finally:
+            if self.metrics is not None:
+                self.metrics.on_decode(api_name, time.perf_counter() - started_at)
+            if trace is not None:
+                finish_trace()
+
+    def _decode_json_as(
+        self, type_: Any, content: bytes | str, api_name: str, resp: httpx.Response | None, trusted: bool
+    ) -> Any:
+        if trusted:
+            try:
+                return trusted_view(type_, orjson.loads(content))
+            except orjson.JSONDecodeError:
+                self._log_json_decode_error(api_name, content, resp)
+                raise
+        if isinstance(type_, type) and issubclass(type_, PydanticBaseModel):
+            return self._model_validate_json(type_, content, api_name, resp)
+        return self._adapter_validate_json(type_adapter(type_), content, api_name, resp)
+
+    def _decode_json_traced(
+        self,
+        trace: RequestTrace,
+        type_: Any,
+        content: bytes | str,
+        api_name: str,
+        resp: httpx.Response | None,
+        trusted: bool,
+    ) -> Any:
+        # Parsing and validating in two steps, pydantic does both at once otherwise.
+        started_at = time.perf_counter()
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            self._log_json_decode_error(api_name, content, resp)
+            raise
+        parsed_at = time.perf_counter()
+        trace.add("decode", parsed_at - started_at)
+        try:
+            if trusted:
+                return trusted_view(type_, data)
+            if isinstance(type_, type) and issubclass(type_, PydanticBaseModel):
+                return type_.model_validate(data)
+            return type_adapter(type_).validate_python(data)
+        finally:
+            trace.add("validate", time.perf_counter() - parsed_at)
+
+    @staticmethod
+    def _log_json_decode_error(api_name: str, content: bytes | str, resp: httpx.Response | None):
+        logger.exception(
+            "JSON decode error in %s (status=%s, url=%s). Response content: %r",
+            api_name,
+            resp.status_code if resp else "n/a",
+            resp.url if resp else "n/a",
+            resp.text if resp else content,
+        )
 
     @staticmethod
     def _is_json_decode_validation_error(error: ValidationError) -> bool:
@@ -91,16 +613,7 @@ class BasePyltover:
             return model.model_validate_json(content)
         except ValidationError as error:
             if BasePyltover._is_json_decode_validation_error(error):
-                status_code = resp.status_code if resp else "n/a"
-                url = resp.url if resp else "n/a"
-                body = resp.text if resp else content
-                logger.exception(
-                    "JSON decode error in %s (status=%s, url=%s). Response content: %r",
-                    api_name,
-                    status_code,
-                    url,
-                    body,
-                )
+                BasePyltover._log_json_decode_error(api_name, content, resp)
             raise
 
     @staticmethod
@@ -111,14 +624,5 @@ class BasePyltover:
             return adapter.validate_json(content)
         except ValidationError as error:
             if BasePyltover._is_json_decode_validation_error(error):
-                status_code = resp.status_code if resp else "n/a"
-                url = resp.url if resp else "n/a"
-                body = resp.text if resp else content
-                logger.exception(
-                    "JSON decode error in %s (status=%s, url=%s). Response content: %r",
-                    api_name,
-                    status_code,
-                    url,
-                    body,
-                )
+                BasePyltover._log_json_decode_error(api_name, content, resp)
             raise
@@ -0,0 +1,125 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+# Seconds a response of each endpoint is kept for, endpoints missing here are never cached. Matches never change
+# once they are over, so they are kept until evicted.
+DEFAULT_CACHE_TTLS = {
+    "v1.get_account_by_puuid": 3600.0,
+    "v1.get_account_by_riot_id": 3600.0,
+    "v1.get_active_shard_for_player": 600.0,
+    "v1.get_active_region": 600.0,
+    "v3.get_champion_rotaions": 3600.0,
+    "v4.get_all_champion_mastery": 600.0,
+    "v4.get_champion_mastery": 600.0,
+    "v4.get_top_champion_mastery_by_count": 600.0,
+    "v4.get_total_champion_mastery_score": 600.0,
+    "v4.get_league_entries_for_puuid": 300.0,
+    "v4.get_summoner_by_puuid": 300.0,
+    "v5.get_match_by_id": math.inf,
+    "v5.get_match_timeline_by_id": math.inf,
+}
+
+
+class Cache(ABC):
+    """Storage of a `ResponseCache`, subclass it to keep the cached bodies somewhere else than in memory."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float):
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """In memory LRU cache, bounded by both the number of entries and their total size in bytes."""
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        if len(value) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.size += len(value)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        _, value = self._entries.pop(key)
+        self.size -= len(value)
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self):
+        return f"[CacheStats: <hits: {self.hits}, misses: {self.misses}, hit_ratio: {self.hit_ratio:.2f}>]"
+
+
+class ResponseCache:
+    """Caches the bodies of successful responses, for as long as the ttl of their endpoint.
+
+    `ttls` overrides the per endpoint defaults of `DEFAULT_CACHE_TTLS`, mapping an endpoint to `0` disables caching
+    it. Hits and misses are counted per endpoint in `stats`.
+    """
+
+    def __init__(self, backend: Cache | None = None, ttls: dict[str, float] | None = None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.stats: dict[str, CacheStats] = {}
+
+    def is_cached(self, api_name: str) -> bool:
+        return self.ttls.get(api_name, 0) > 0
+
+    @staticmethod
+    def key(url: str, params: dict | None) -> str:
+        if not params:
+            return url
+        return url + "?" + "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+
+    async def get(self, api_name: str, key: str) -> bytes | None:
+        stats = self.stats.get(api_name)
+        if stats is None:
+            stats = self.stats[api_name] = CacheStats()
+        value = await self.backend.get(key)
+        if value is None:
+            stats.misses += 1
+        else:
+            stats.hits += 1
+        return value
+
+    async def set(self, api_name: str, key: str, value: bytes):
+        await self.backend.set(key, value, self.ttls[api_name])
@@ -1,13 +1,76 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+
+import httpx
+
 from pyltover import servers
 from pyltover.apis import v1, v2, v3, v4, v5
-from pyltover.base import BasePyltover
+from pyltover.base import DEFAULT_LIMITS, DEFAULT_TIMEOUT, BasePyltover, create_async_client
+from pyltover.cache import ResponseCache
+from pyltover.concurrency import bounded_map
+from pyltover.keys import KeyPool
+from pyltover.metrics import MetricsListener
+from pyltover.tracing import Tracer
+from pyltover.ratelimit import RateLimiter
+from pyltover.retry import RetryPolicy
+from pyltover.scheduler import PriorityScheduler
 from pyltover.servers import RegionalRoutingValues, PlatformRoutingValues, esports_server
+from pyltover.singleflight import SingleFlight
+from pyltover.store import MatchStore
 
 
 class Pyltover(BasePyltover):
-    def __init__(self, riot_token: str):
-        super().__init__(riot_token)
-        self.riot_token = riot_token
+    """Root of the api, every server below it shares one connection pool and one set of rate limits.
+
+    The pool is closed with `await pyltover.aclose()`, or by using the root as an async context manager:
+
+        async with Pyltover("your token", http2=True) as pyltover:
+            summoner = await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+
+    An already configured `async_client` can be passed instead of the pool options, it is not closed by `aclose`.
+    """
+
+    def __init__(
+        self,
+        riot_token: str | KeyPool,
+        *,
+        async_client: httpx.AsyncClient | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        match_store: MatchStore | None = None,
+        trusted: bool = False,
+        metrics: MetricsListener | None = None,
+        tracer: Tracer | None = None,
+        scheduler: PriorityScheduler | None = None,
+    ):
+        owns_client = async_client is None
+        if owns_client:
+            async_client = create_async_client(
+                riot_token if not isinstance(riot_token, KeyPool) else None,
+                limits=limits,
+                timeout=timeout,
+                http2=http2,
+                transport=transport,
+            )
+        super().__init__(
+            riot_token,
+            async_client=async_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            single_flight=single_flight,
+            match_store=match_store,
+            trusted=trusted,
+            metrics=metrics,
+            tracer=tracer,
+            scheduler=scheduler,
+        )
+        self._owns_client = owns_client
 
         self._esport = None
 
@@ -34,10 +97,75 @@ class Pyltover(BasePyltover):
         self._vn = None
         self._me = None
 
+    def _rebuild_children(self):
+        # Servers are created on first access, from this object's options.
+        for name, value in list(vars(self).items()):
+            if isinstance(value, PyltoverServerSpecific):
+                setattr(self, name, None)
+
+    def server(self, server_addr: servers.ServerAddress) -> "PyltoverServerSpecific":
+        """The api object of a routing value, e.g. `pyltover.server(PlatformRoutingValues.EUW1)` is `pyltover.euw1`."""
+        if server_addr == esports_server:
+            return self.esport
+        for routing_values in (PlatformRoutingValues, RegionalRoutingValues):
+            try:
+                return getattr(self, routing_values(server_addr).name.lower())
+            except ValueError:
+                pass
+        raise ValueError(f"unknown routing value {server_addr!r}")
+
+    async def fan_out_as_completed(
+        self,
+        call: Callable[["PyltoverServerSpecific"], Awaitable[Any]],
+        routing_values: Iterable[servers.ServerAddress] = PlatformRoutingValues,
+        *,
+        return_exceptions: bool = True,
+    ) -> AsyncIterator[tuple[servers.ServerAddress, Any]]:
+        """Runs `call` on the api object of every routing value of `routing_values`, all the platforms by default,
+        concurrently, yielding `(server_addr, result)` pairs as they complete:
+
+            async for platform, league in pyltover.fan_out_as_completed(
+                lambda server: server.v4.get_the_challenger_league_for_queue(QueueTypes.RANKED_SOLO_5x5)
+            ):
+
+        Riot counts rate limits per routing value, so the calls only wait for the limits of their own server, and
+        the whole fan-out takes about as long as its slowest server. A call that fails is yielded with its exception
+        in place of the result, unless `return_exceptions=False` which stops the fan-out on the first error.
+        """
+        server_addrs = list(dict.fromkeys(routing_values))
+        async for server_addr, result in bounded_map(
+            lambda server_addr: call(self.server(server_addr)),
+            server_addrs,
+            concurrency=max(len(server_addrs), 1),
+            return_exceptions=return_exceptions,
+        ):
+            yield server_addr, result
+
+    async def fan_out(
+        self,
+        call: Callable[["PyltoverServerSpecific"], Awaitable[Any]],
+        routing_values: Iterable[servers.ServerAddress] = PlatformRoutingValues,
+        *,
+        return_exceptions: bool = True,
+    ) -> dict[servers.ServerAddress, Any]:
+        """Like `fan_out_as_completed`, but returns the results once every call finished, by routing value in the
+        order of `routing_values`, e.g. the free champion rotation of every platform:
+
+            rotations = await pyltover.fan_out(lambda server: server.v3.get_champion_rotaions())
+            rotations[PlatformRoutingValues.KR]
+        """
+        server_addrs = list(dict.fromkeys(routing_values))
+        results = {}
+        async for server_addr, result in self.fan_out_as_completed(
+            call, server_addrs, return_exceptions=return_exceptions
+        ):
+            results[server_addr] = result
+        return {server_addr: results[server_addr] for server_addr in server_addrs}
+
     @property
     def esport(self):
         if self._esport is None:
-            self._esport = PyltoverServerSpecific(esports_server, self.riot_token)
+            self._esport = PyltoverServerSpecific(esports_server, self.riot_token, parent=self)
         return self._esport
 
     # Regional
@@ -45,25 +173,25 @@ class Pyltover(BasePyltover):
     @property
     def americas(self):
         if self._americas is None:
-            self._americas = PyltoverServerSpecific(RegionalRoutingValues.AMERICAS.value, self.riot_token)
+            self._americas = PyltoverServerSpecific(RegionalRoutingValues.AMERICAS.value, self.riot_token, parent=self)
         return self._americas
 
     @property
     def asia(self):
         if self._asia is None:
-            self._asia = PyltoverServerSpecific(RegionalRoutingValues.ASIA.value, self.riot_token)
+            self._asia = PyltoverServerSpecific(RegionalRoutingValues.ASIA.value, self.riot_token, parent=self)
         return self._asia
 
     @property
     def sea(self):
         if self._sea is None:
-            self._sea = PyltoverServerSpecific(RegionalRoutingValues.SEA.value, self.riot_token)
+            self._sea = PyltoverServerSpecific(RegionalRoutingValues.SEA.value, self.riot_token, parent=self)
         return self._sea
 
     @property
     def europe(self):
         if self._europe is None:
-            self._europe = PyltoverServerSpecific(RegionalRoutingValues.EUROPE.value, self.riot_token)
+            self._europe = PyltoverServerSpecific(RegionalRoutingValues.EUROPE.value, self.riot_token, parent=self)
         return self._europe
 
     # Platforms
@@ -71,112 +199,115 @@ class Pyltover(BasePyltover):
     @property
     def br1(self):
         if self._br is None:
-            self._br = PyltoverServerSpecific(PlatformRoutingValues.BR1.value, self.riot_token)
+            self._br = PyltoverServerSpecific(PlatformRoutingValues.BR1.value, self.riot_token, parent=self)
         return self._br
 
     @property
     def eun1(self):
         if self._eun is None:
-            self._eun = PyltoverServerSpecific(PlatformRoutingValues.EUN1.value, self.riot_token)
+            self._eun = PyltoverServerSpecific(PlatformRoutingValues.EUN1.value, self.riot_token, parent=self)
         return self._eun
 
     @property
     def euw1(self):
         if self._euw is None:
-            self._euw = PyltoverServerSpecific(PlatformRoutingValues.EUW1.value, self.riot_token)
+            self._euw = PyltoverServerSpecific(PlatformRoutingValues.EUW1.value, self.riot_token, parent=self)
         return self._euw
 
     @property
     def jp1(self):
         if self._jp is None:
-            self._jp = PyltoverServerSpecific(PlatformRoutingValues.JP1.value, self.riot_token)
+            self._jp = PyltoverServerSpecific(PlatformRoutingValues.JP1.value, self.riot_token, parent=self)
         return self._jp
 
     @property
     def kr(self):
         if self._kr is None:
-            self._kr = PyltoverServerSpecific(PlatformRoutingValues.KR.value, self.riot_token)
+            self._kr = PyltoverServerSpecific(PlatformRoutingValues.KR.value, self.riot_token, parent=self)
         return self._kr
 
     @property
     def la1(self):
         if self._la1 is None:
-            self._la1 = PyltoverServerSpecific(PlatformRoutingValues.LA1.value, self.riot_token)
+            self._la1 = PyltoverServerSpecific(PlatformRoutingValues.LA1.value, self.riot_token, parent=self)
         return self._la1
 
     @property
     def la2(self):
         if self._la2 is None:
-            self._la2 = PyltoverServerSpecific(PlatformRoutingValues.LA2.value, self.riot_token)
+            self._la2 = PyltoverServerSpecific(PlatformRoutingValues.LA2.value, self.riot_token, parent=self)
         return self._la2
 
     @property
     def na1(self):
         if self._na is None:
-            self._na = PyltoverServerSpecific(PlatformRoutingValues.NA1.value, self.riot_token)
+            self._na = PyltoverServerSpecific(PlatformRoutingValues.NA1.value, self.riot_token, parent=self)
         return self._na
 
     @property
     def oc1(self):
         if self._oc is None:
-            self._oc = PyltoverServerSpecific(PlatformRoutingValues.OC1.value, self.riot_token)
+            self._oc = PyltoverServerSpecific(PlatformRoutingValues.OC1.value, self.riot_token, parent=self)
         return self._oc
 
     @property
     def tr1(self):
         if self._tr is None:
-            self._tr = PyltoverServerSpecific(PlatformRoutingValues.TR1.value, self.riot_token)
+            self._tr = PyltoverServerSpecific(PlatformRoutingValues.TR1.value, self.riot_token, parent=self)
         return self._tr
 
     @property
     def ru(self):
         if self._ru is None:
-            self._ru = PyltoverServerSpecific(PlatformRoutingValues.RU.value, self.riot_token)
+            self._ru = PyltoverServerSpecific(PlatformRoutingValues.RU.value, self.riot_token, parent=self)
         return self._ru
 
     @property
     def ph2(self):
         if self._ph is None:
-            self._ph = PyltoverServerSpecific(PlatformRoutingValues.PH2.value, self.riot_token)
+            self._ph = PyltoverServerSpecific(PlatformRoutingValues.PH2.value, self.riot_token, parent=self)
         return self._ph
 
     @property
     def sg2(self):
         if self._sg is None:
-            self._sg = PyltoverServerSpecific(PlatformRoutingValues.SG2.value, self.riot_token)
+            self._sg = PyltoverServerSpecific(PlatformRoutingValues.SG2.value, self.riot_token, parent=self)
         return self._sg
 
     @property
     def th2(self):
         if self._th is None:
-            self._th = PyltoverServerSpecific(PlatformRoutingValues.TH2.value, self.riot_token)
+            self._th = PyltoverServerSpecific(PlatformRoutingValues.TH2.value, self.riot_token, parent=self)
         return self._th
 
     @property
     def tw2(self):
         if self._tw is None:
-            self._tw = PyltoverServerSpecific(PlatformRoutingValues.TW2.value, self.riot_token)
+            self._tw = PyltoverServerSpecific(PlatformRoutingValues.TW2.value, self.riot_token, parent=self)
         return self._tw
 
     @property
     def vn2(self):
         if self._vn is None:
-            self._vn = PyltoverServerSpecific(PlatformRoutingValues.VN2.value, self.riot_token)
+            self._vn = PyltoverServerSpecific(PlatformRoutingValues.VN2.value, self.riot_token, parent=self)
         return self._vn
 
     @property
     def me1(self):
         if self._me is None:
-            self._me = PyltoverServerSpecific(PlatformRoutingValues.ME1.value, self.riot_token)
+            self._me = PyltoverServerSpecific(PlatformRoutingValues.ME1.value, self.riot_token, parent=self)
         return self._me
 
 
 class PyltoverServerSpecific(BasePyltover):
-    def __init__(self, server_addr: servers.ServerAddress, riot_token: str):
+    def __init__(self, server_addr: servers.ServerAddress, riot_token: str, *, parent: BasePyltover | None = None):
+        super().__init__(riot_token, parent=parent)
         self.server_addr = server_addr
-
-        self.v1 = v1.Pyltover(self.server_addr, riot_token)
-        self.v2 = v2.Pyltover(self.server_addr, riot_token)
-        self.v3 = v3.Pyltover(self.server_addr, riot_token)
-        self.v4 = v4.Pyltover(self.server_addr, riot_token)
-        self.v5 = v5.Pyltover(self.server_addr, riot_token)
+        self._rebuild_children()
+
+    def _rebuild_children(self):
+        self.v1 = v1.Pyltover(self.server_addr, self.riot_token, parent=self)
+        self.v2 = v2.Pyltover(self.server_addr, self.riot_token, parent=self)
+        self.v3 = v3.Pyltover(self.server_addr, self.riot_token, parent=self)
+        self.v4 = v4.Pyltover(self.server_addr, self.riot_token, parent=self)
+        self.v5 = v5.Pyltover(self.server_addr, self.riot_token, parent=self)
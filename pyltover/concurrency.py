@@ -0,0 +1,64 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+
+T = TypeVar("T")
+
+
+async def bounded_map(
+    func: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+    ordered: bool = False,
+    return_exceptions: bool = False,
+) -> AsyncIterator[tuple[T, Any]]:
+    """Runs `func` over `items` with at most `concurrency` calls in flight, yielding `(item, result)` pairs.
+
+    Items are only pulled from `items` when a call finishes, so a slow consumer holds back new calls instead of
+    piling up results. Results are yielded as they complete, or in the order of `items` when `ordered=True`.
+    A failed call raises, and cancels the calls still in flight, unless `return_exceptions=True` in which case the
+    exception is yielded as its result.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    iterator = iter(items)
+    in_flight: dict[asyncio.Future, T] = {}
+    queue: deque[asyncio.Future] = deque()
+
+    def launch() -> bool:
+        for item in iterator:
+            task = asyncio.ensure_future(func(item))
+            in_flight[task] = item
+            queue.append(task)
+            return True
+        return False
+
+    def result(task: asyncio.Future) -> Any:
+        if return_exceptions and not task.cancelled() and task.exception() is not None:
+            return task.exception()
+        return task.result()
+
+    try:
+        while len(in_flight) < concurrency and launch():
+            pass
+
+        while in_flight:
+            if ordered:
+                task = queue[0]
+                await asyncio.wait((task,))
+                done = [task]
+            else:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                item = in_flight.pop(task)
+                queue.remove(task)
+                value = result(task)
+                launch()
+                yield item, value
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,108 @@
+import functools
+import types
+import typing
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from pyltover.lazy import unwrap_optional
+
+
+@functools.cache
+def type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _wrapper(annotation: Any):
+    """Function wrapping a json value of `annotation` in trusted views, None when the value is used as is."""
+    annotation = unwrap_optional(annotation)
+    if _is_model(annotation):
+        return trusted_type(annotation)
+    if typing.get_origin(annotation) is list:
+        wrap_item = _wrapper(typing.get_args(annotation)[0])
+        if wrap_item is not None:
+            return lambda values: [None if value is None else wrap_item(value) for value in values]
+    if typing.get_origin(annotation) is dict:
+        wrap_value = _wrapper(typing.get_args(annotation)[1])
+        if wrap_value is not None:
+            return lambda values: {key: None if value is None else wrap_value(value) for key, value in values.items()}
+    return None
+
+
+class _TrustedField:
+    """Reads a field from the json of a trusted view on first access, then caches it in the view's `__dict__`, which
+    takes precedence over this descriptor from then on."""
+
+    __slots__ = ("name", "key", "default", "wrap")
+
+    def __init__(self, name: str, key: str, default: Any, wrap):
+        self.name = name
+        self.key = key
+        self.default = default
+        self.wrap = wrap
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance._data.get(self.key)
+        if value is None:
+            value = self.default
+        elif self.wrap is not None:
+            value = self.wrap(value)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class TrustedView:
+    """Base of the trusted views of the api models, see `trusted_type`."""
+
+    model: type[BaseModel]
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def parsed_json(self) -> dict:
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        return self.model.model_validate(self._data)
+
+    def __repr__(self):
+        return f"Trusted{self.model.__name__}(<{len(self.__dict__) - 1} of {len(self.model.model_fields)} fields read>)"
+
+
+@functools.cache
+def trusted_type(model: type[BaseModel]) -> type[TrustedView]:
+    """Class of the trusted views of `model`, reading like the model over its parsed json without validating it.
+
+    Fields are read from the json on first access. Nested models are views too, and the methods the api models
+    define (e.g. `League.league_entries`) work on them, pydantic's own ones need `to_model()` first.
+    """
+    namespace = {"model": model}
+    for base in reversed(model.__mro__[: model.__mro__.index(BaseModel)]):
+        for name, attribute in vars(base).items():
+            if isinstance(attribute, types.FunctionType) and not name.startswith("__"):
+                namespace[name] = attribute
+    for name, field in model.model_fields.items():
+        default = None if field.is_required() else field.get_default(call_default_factory=True)
+        namespace[name] = _TrustedField(name, field.alias or name, default, _wrapper(field.annotation))
+    return type(f"Trusted{model.__name__}", (TrustedView,), namespace)
+
+
+def trusted_view(annotation: Any, data: Any) -> Any:
+    """Wraps parsed json in trusted views of `annotation`, e.g. a model or a list of models.
+
+    Nothing is validated or coerced: fields hold the json values as they are, e.g. enum fields hold plain strings
+    (which compare equal to `StrEnum` members) and missing required fields are None. Building pydantic models without
+    validation, e.g. with `model_construct`, is slower than validating them with pydantic-core, so only skipping the
+    models altogether makes decoding cheaper. Only use it on responses known to be valid. `Pyltover(token, trusted=True)`
+    decodes every response with it, `with_options(trusted=True)` only the calls of one api object.
+    """
+    wrap = _wrapper(annotation)
+    if wrap is None or data is None:
+        return data
+    return wrap(data)
@@ -0,0 +1,250 @@
+import asyncio
+import math
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+from pyltover.cache import Cache
+from pyltover.ratelimit import (
+    APP_RATE_LIMIT_COUNT_HEADER,
+    METHOD_RATE_LIMIT_COUNT_HEADER,
+    RateLimitBucket,
+    RateLimiter,
+    parse_rate_limit_header,
+)
+from pyltover.redis_protocol import RespClient
+from pyltover.singleflight import SingleFlight
+
+
+def _milliseconds(seconds: float) -> int:
+    return max(1, math.ceil(seconds * 1000))
+
+
+class RateLimitBackend(ABC):
+    """Storage of the rate limit windows a `DistributedRateLimiter` shares with the other nodes using the same key.
+
+    Windows are identified by the key of their bucket and their length in seconds, e.g. `("euw1.api.riotgames.com",
+    10)` for the 10 seconds application window of `euw1`. Subclass it to keep them somewhere else than in Redis.
+    """
+
+    @abstractmethod
+    async def consume(self, windows: list[tuple[str, int, float]], buckets: list[str]) -> float:
+        """Counts a request in every window, given as `(bucket, limit, seconds)`, and returns 0 when all of them had
+        room and none of `buckets` is blocked. Otherwise counts nothing and returns the seconds to wait first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def sync(self, bucket: str, seconds: float, count: int):
+        """Raises the count of a window to `count`, the requests riot already counted in it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def block(self, bucket: str, seconds: float):
+        """Holds back every request of `bucket` for `seconds`, e.g. after a 429 response."""
+        raise NotImplementedError
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Keeps window counters in a Redis protocol server, as keys expiring with their window.
+
+    A request is counted by incrementing every window it falls in, and rolled back when one of them overflows, so
+    concurrent nodes never count more requests than a window allows.
+    """
+
+    def __init__(self, client: RespClient, *, prefix: str = "pyltover:", padding: float = 0.05):
+        self.client = client
+        self.prefix = prefix
+        self.padding = padding
+
+    def _window_key(self, bucket: str, seconds: float) -> str:
+        return f"{self.prefix}window:{bucket}:{seconds:g}"
+
+    def _block_key(self, bucket: str) -> str:
+        return f"{self.prefix}block:{bucket}"
+
+    async def consume(self, windows: list[tuple[str, int, float]], buckets: list[str]) -> float:
+        commands = [("PTTL", self._block_key(bucket)) for bucket in buckets]
+        for bucket, _, seconds in windows:
+            key = self._window_key(bucket, seconds)
+            ttl = _milliseconds(seconds + self.padding)
+            commands += [("SET", key, 0, "NX", "PX", ttl), ("INCR", key), ("PTTL", key)]
+        replies = await self.client.pipeline(*commands)
+
+        wait_time = max((ttl / 1000 for ttl in replies[: len(buckets)] if ttl > 0), default=0.0)
+        window_replies = replies[len(buckets) :]
+        repairs = []
+        for index, (bucket, limit, seconds) in enumerate(windows):
+            count, ttl = window_replies[index * 3 + 1], window_replies[index * 3 + 2]
+            if ttl < 0:
+                # The window expired between SET and INCR, which recreated it without expiry.
+                ttl = _milliseconds(seconds + self.padding)
+                repairs.append(("PEXPIRE", self._window_key(bucket, seconds), ttl))
+            if count > limit:
+                wait_time = max(wait_time, ttl / 1000)
+        if wait_time > 0:
+            repairs += [("DECR", self._window_key(bucket, seconds)) for bucket, _, seconds in windows]
+        if repairs:
+            await self.client.pipeline(*repairs)
+        return wait_time
+
+    async def sync(self, bucket: str, seconds: float, count: int):
+        key = self._window_key(bucket, seconds)
+        current = await self.client.execute("GET", key)
+        if current is None:
+            await self.client.execute("SET", key, count, "NX", "PX", _milliseconds(seconds + self.padding))
+        elif count > int(current):
+            await self.client.execute("INCRBY", key, count - int(current))
+
+    async def block(self, bucket: str, seconds: float):
+        key = self._block_key(bucket)
+        if await self.client.execute("PTTL", key) < seconds * 1000:
+            await self.client.execute("SET", key, 1, "PX", _milliseconds(seconds))
+
+
+class _DistributedBucket(RateLimitBucket):
+    def __init__(self, key: str, padding: float):
+        super().__init__(padding)
+        self.key = key
+
+
+class DistributedRateLimiter(RateLimiter):
+    """Rate limiter sharing the counts of its windows with every node using the same `backend`, e.g. a crawler fleet
+    running on several hosts with one api key:
+
+        backend = RedisRateLimitBackend(RespClient("redis.internal"))
+        pyltover = Pyltover("your token", rate_limiter=DistributedRateLimiter(backend))
+
+    Each node learns the limits from its own responses and counts its requests in the shared windows, which riot's
+    counts from the response headers are synced into. A 429 blocks the exceeded limit on every node. The counts kept
+    locally, e.g. for `headroom()`, only add up this node's requests to riot's last counts.
+    """
+
+    def __init__(self, backend: RateLimitBackend, padding: float = 0.05):
+        super().__init__(padding)
+        self.backend = backend
+        self._pending: list[tuple[Callable[..., Awaitable], tuple]] = []
+
+    def _new_bucket(self, key: str) -> RateLimitBucket:
+        return _DistributedBucket(key, self.padding)
+
+    async def _flush(self):
+        pending, self._pending = self._pending, []
+        for func, args in pending:
+            await func(*args)
+
+    async def _consume(self, app_bucket, method_bucket, probing) -> float:
+        # Probes are claimed before awaiting the backend, so this node still sends one probe at a time.
+        for bucket in probing:
+            bucket.probing = True
+        try:
+            await self._flush()
+            now = time.monotonic()
+            wait_time = max(app_bucket.wait_time(now), method_bucket.wait_time(now))
+            if wait_time <= 0:
+                windows = [
+                    (bucket.key, window.limit, window.seconds)
+                    for bucket in (app_bucket, method_bucket)
+                    for window in bucket.windows.values()
+                ]
+                wait_time = await self.backend.consume(windows, [app_bucket.key, method_bucket.key])
+        except BaseException:
+            self._release_probe(app_bucket, probing)
+            raise
+        if wait_time > 0:
+            self._release_probe(app_bucket, probing)
+            return wait_time
+        now = time.monotonic()
+        app_bucket.consume(now)
+        method_bucket.consume(now)
+        return 0.0
+
+    def _release_probe(self, app_bucket: _DistributedBucket, probing: list[RateLimitBucket]):
+        if not probing:
+            return
+        for bucket in probing:
+            bucket.probing = False
+        # The app bucket's key is the routing value the waiting probes are keyed by.
+        event = self._probe_done.pop(app_bucket.key, None)
+        if event is not None:
+            event.set()
+
+    def block(self, server_addr: str, method: str, rate_limit_type: str, seconds: float):
+        super().block(server_addr, method, rate_limit_type, seconds)
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        bucket = app_bucket if rate_limit_type == "application" else method_bucket
+        self._pending.append((self.backend.block, (bucket.key, seconds)))
+
+    def update(self, server_addr: str, method: str, headers: Mapping[str, str] | None):
+        super().update(server_addr, method, headers)
+        if headers is None:
+            return
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        for bucket, count_header in (
+            (app_bucket, APP_RATE_LIMIT_COUNT_HEADER),
+            (method_bucket, METHOD_RATE_LIMIT_COUNT_HEADER),
+        ):
+            for seconds, count in parse_rate_limit_header(headers.get(count_header)).items():
+                if seconds in bucket.windows:
+                    self._pending.append((self.backend.sync, (bucket.key, seconds, count)))
+
+
+class RedisCache(Cache):
+    """Response cache backend kept in a Redis protocol server, shared by every node using it."""
+
+    def __init__(self, client: RespClient, *, prefix: str = "pyltover:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.execute("GET", self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        if math.isinf(ttl):
+            await self.client.execute("SET", self.prefix + key, value)
+        else:
+            await self.client.execute("SET", self.prefix + key, value, "PX", _milliseconds(ttl))
+
+
+class DistributedSingleFlight(SingleFlight):
+    """Coalesces identical concurrent requests across nodes, through locks in a Redis protocol server.
+
+    Calls are first coalesced on this node. Requests of the endpoints cached in a shared `RedisCache` are then
+    coalesced across nodes too: the node holding the lock of a request sends it while the others wait for the lock to
+    be released, and find the response in the cache. Other requests are only coalesced on this node, waiting for
+    another node could not spare them the request. A lock expires after `lock_timeout` seconds, in case its node died
+    while holding it.
+    """
+
+    def __init__(
+        self,
+        client: RespClient,
+        *,
+        prefix: str = "pyltover:flight:",
+        lock_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]], *, shared: bool = False) -> Any:
+        if not shared:
+            return await super().do(key, func)
+        return await super().do(key, lambda: self._locked(key, func), shared=True)
+
+    async def _locked(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        lock = self.prefix + (":".join(map(str, key)) if isinstance(key, tuple) else str(key))
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+        while not await self.client.execute("SET", lock, token, "NX", "PX", _milliseconds(self.lock_timeout)):
+            if time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(self.poll_interval)
+        try:
+            return await func()
+        finally:
+            if await self.client.execute("GET", lock) == token.encode():
+                await self.client.execute("DEL", lock)
@@ -0,0 +1,118 @@
+import logging
+from typing import Callable, Iterable
+
+from pyltover.ratelimit import RateLimiter
+
+
+logger = logging.getLogger(__name__)
+
+
+RIOT_TOKEN_HEADER = "X-Riot-Token"
+
+# Statuses riot answers a revoked, expired or unknown api key with. They also answer requests the key has nothing to
+# do with, e.g. a 403 "Forbidden" for an unknown path or an endpoint the key type can't use.
+REJECTED_KEY_STATUS_CODES = frozenset({401, 403})
+
+
+class NoApiKeyError(Exception):
+    """Raised when every key of a `KeyPool` was rejected by riot."""
+
+
+class ApiKey:
+    """One api key of a `KeyPool`, with the rate limits riot enforces on it."""
+
+    def __init__(self, token: str, rate_limiter: RateLimiter):
+        self.token = token
+        self.rate_limiter = rate_limiter
+        self.active = True
+        self.refusals = 0
+
+    def __repr__(self):
+        state = "active" if self.active else "rejected"
+        return f"[ApiKey: <...{self.token[-4:]}, {state}>]"
+
+
+class KeyPool:
+    """Spreads requests over several api keys, so the throughput of a `Pyltover` root grows with the number of keys.
+
+        pyltover = Pyltover(KeyPool(["first key", "second key"]))
+
+    Riot counts rate limits per key, so every key has its own `RateLimiter`, and each request goes to the key with
+    the most room left in the limits of its endpoint, or the one freeing up first when all of them are used up.
+
+    A 401 or 403 is returned to the caller, riot's message doesn't tell a bad key from a forbidden endpoint. The
+    refused key is only picked again once no other key has room left, and is dropped from the pool after
+    `max_refusals` refusals in a row, on any endpoint, without a request answered in between. The request refused last
+    is then sent again with another key, and `NoApiKeyError` is raised once no key is left.
+
+    `rate_limiter` creates the limiter of each token, e.g. a `SharedMemoryRateLimiter` shared with other processes.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        padding: float = 0.05,
+        rate_limiter: Callable[[str], RateLimiter] | None = None,
+        max_refusals: int = 3,
+    ):
+        if rate_limiter is None:
+            rate_limiter = lambda token: RateLimiter(padding)  # noqa: E731
+        self.keys = [ApiKey(token, rate_limiter(token)) for token in dict.fromkeys(tokens)]
+        if not self.keys:
+            raise ValueError("a key pool needs at least one api key")
+        self._keys_by_token = {key.token: key for key in self.keys}
+        self.max_refusals = max_refusals
+
+    def __len__(self):
+        return len(self.active_keys())
+
+    def active_keys(self) -> list[ApiKey]:
+        return [key for key in self.keys if key.active]
+
+    def key(self, token: str) -> ApiKey | None:
+        return self._keys_by_token.get(token)
+
+    def pick(self, server_addr: str, method: str) -> ApiKey:
+        keys = self.active_keys()
+        if not keys:
+            raise NoApiKeyError("every api key of the pool was rejected by riot")
+        return max(
+            keys,
+            key=lambda key: (
+                # The limits of a refused key are never learnt, unknown limits would count as free.
+                key.rate_limiter.headroom(server_addr, method) if not key.refusals else 0.0,
+                -key.rate_limiter.wait_time(server_addr, method),
+            ),
+        )
+
+    def method_wait_time(self, server_addr: str, method: str) -> float:
+        """Seconds until the limits of `method` have room on one of the keys, leaving out the application limits."""
+        return min((key.rate_limiter.method_wait_time(server_addr, method) for key in self.active_keys()), default=0.0)
+
+    async def acquire(self, server_addr: str, method: str) -> ApiKey:
+        """Waits until a request to `method` on `server_addr` fits into the limits of a key, and counts it there."""
+        key = self.pick(server_addr, method)
+        await key.rate_limiter.acquire(server_addr, method)
+        return key
+
+    def refused(self, key: ApiKey) -> bool:
+        """Records a 401 or 403 riot answered a request sent with `key`, and returns whether the key was dropped for
+        it and the request can be sent again with another one."""
+        key.refusals += 1
+        if key.refusals < self.max_refusals:
+            return False
+        return self.reject(key)
+
+    def answered(self, key: ApiKey):
+        """Records that riot answered a request sent with `key`, which clears its refusals."""
+        key.refusals = 0
+
+    def reject(self, key: ApiKey) -> bool:
+        """Drops a key riot rejected, returns whether other keys are left to send requests with."""
+        if key.active:
+            key.active = False
+            logger.warning("Riot rejected %r, %d api keys left in the pool", key, len(self))
+        return len(self) > 0
+
+    def __repr__(self):
+        return f"[KeyPool: <{len(self)} of {len(self.keys)} keys active>]"
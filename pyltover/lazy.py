@@ -0,0 +1,145 @@
+import functools
+import types
+import typing
+from collections.abc import Sequence
+from typing import Any
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+
+# How a field is loaded on first access: models with nested models stay lazy, leaf models are validated as a
+# whole, everything else goes through a TypeAdapter of its annotation.
+_LAZY = "lazy"
+_LAZY_LIST = "lazy_list"
+_MODEL = "model"
+_MODEL_LIST = "model_list"
+_VALUE = "value"
+
+
+def unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _has_nested_models(model: type[BaseModel]) -> bool:
+    for field in model.model_fields.values():
+        annotation = unwrap_optional(field.annotation)
+        if typing.get_origin(annotation) is list:
+            annotation = typing.get_args(annotation)[0]
+        if _is_model(annotation):
+            return True
+    return False
+
+
+@functools.cache
+def _field_plan(model: type[BaseModel]) -> dict[str, tuple[str, str, Any]]:
+    plan = {}
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+        annotation = unwrap_optional(field.annotation)
+        if _is_model(annotation):
+            plan[name] = (key, _LAZY if _has_nested_models(annotation) else _MODEL, annotation)
+        elif typing.get_origin(annotation) is list and _is_model(typing.get_args(annotation)[0]):
+            item_model = typing.get_args(annotation)[0]
+            plan[name] = (key, _LAZY_LIST if _has_nested_models(item_model) else _MODEL_LIST, item_model)
+        else:
+            plan[name] = (key, _VALUE, TypeAdapter(field.annotation))
+    return plan
+
+
+def _load(kind: str, target: Any, raw: Any) -> Any:
+    if raw is None:
+        return None
+    if kind == _LAZY:
+        return LazyModel(target, raw)
+    if kind == _MODEL:
+        return target.model_validate(raw)
+    if kind == _LAZY_LIST:
+        return LazyList(raw, functools.partial(LazyModel, target))
+    if kind == _MODEL_LIST:
+        return LazyList(raw, target.model_validate)
+    return target.validate_python(raw)
+
+
+class LazyList(Sequence):
+    """Read only list loading each of its items on first access."""
+
+    __slots__ = ("_raw", "_load_item", "_items")
+
+    def __init__(self, raw: list, load_item):
+        self._raw = raw
+        self._load_item = load_item
+        self._items = [None] * len(raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._load_item(self._raw[index])
+        return item
+
+    def __repr__(self):
+        return f"LazyList(<{len(self)} items>)"
+
+
+class LazyModel:
+    """Read only view of a pydantic model over its raw json, validating each field on first access.
+
+    The json is only parsed when the first field is read. Fields holding models with nested models (e.g. a match's
+    `info` or its participants) are lazy views themselves, leaf models (e.g. a participant's `challenges`) are
+    validated as a whole on first access. Every loaded field is cached, and `to_model()` validates the whole model.
+    """
+
+    __slots__ = ("_model", "_raw", "_data", "_fields")
+
+    def __init__(self, model: type[BaseModel], raw: bytes | str | dict):
+        self._model = model
+        self._raw = raw
+        self._data = raw if isinstance(raw, dict) else None
+        self._fields = {}
+
+    @property
+    def raw_json(self) -> bytes | str | dict:
+        return self._raw
+
+    def parsed_json(self) -> dict:
+        if self._data is None:
+            self._data = orjson.loads(self._raw)
+        return self._data
+
+    def __getattr__(self, name: str) -> Any:
+        fields = self._fields
+        if name in fields:
+            return fields[name]
+
+        field_plan = _field_plan(self._model).get(name)
+        if field_plan is None:
+            raise AttributeError(f"{self._model.__name__} has no field {name!r}")
+        key, kind, target = field_plan
+        data = self.parsed_json()
+        if key in data:
+            value = _load(kind, target, data[key])
+        else:
+            value = self._model.model_fields[name].get_default(call_default_factory=True)
+        fields[name] = value
+        return value
+
+    def to_model(self) -> BaseModel:
+        if self._data is None:
+            return self._model.model_validate_json(self._raw)
+        return self._model.model_validate(self._data)
+
+    def __repr__(self):
+        return f"Lazy{self._model.__name__}(<{len(self._fields)} of {len(self._model.model_fields)} fields loaded>)"
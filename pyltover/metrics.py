@@ -0,0 +1,204 @@
+import bisect
+import math
+from collections import Counter
+from typing import Mapping
+
+import httpx
+
+from pyltover.ratelimit import (
+    APP_RATE_LIMIT_COUNT_HEADER,
+    APP_RATE_LIMIT_HEADER,
+    METHOD_RATE_LIMIT_COUNT_HEADER,
+    METHOD_RATE_LIMIT_HEADER,
+    parse_rate_limit_header,
+)
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DECODE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class MetricsListener:
+    """Receives what happens on the request path, subclass it to send it anywhere, e.g. to statsd.
+
+    `api_name` is the endpoint name passed around by the api objects, e.g. `"v5.get_match_by_id"`.
+    """
+
+    def on_response(self, server_addr: str, api_name: str, resp: httpx.Response, seconds: float):
+        """Called for every response received from riot, retried ones included."""
+
+    def on_transport_error(self, server_addr: str, api_name: str, error: httpx.TransportError, seconds: float):
+        """Called for every request that failed without a response."""
+
+    def on_decode(self, api_name: str, seconds: float):
+        """Called after every response body was decoded into models."""
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket bounds, in the shape prometheus exposes them."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        total, cumulative = 0, []
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def __repr__(self):
+        return f"[Histogram: <count: {self.count}, sum: {self.sum:.3f}>]"
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.status_codes: Counter[int] = Counter()
+        self.transport_errors = 0
+        self.bytes_received = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.decode = Histogram(DECODE_BUCKETS)
+        # Last values of riot's rate limit headers, {(server, "application" or "method"): {seconds: (count, limit)}}.
+        self.rate_limits: dict[tuple[str, str], dict[int, tuple[int | None, int]]] = {}
+
+    def __repr__(self):
+        return f"[EndpointMetrics: <requests: {self.requests}, status_codes: {dict(self.status_codes)}>]"
+
+
+def _rate_limit_windows(headers: Mapping[str, str], limit_header: str, count_header: str):
+    limits = parse_rate_limit_header(headers.get(limit_header))
+    counts = parse_rate_limit_header(headers.get(count_header))
+    return {seconds: (counts.get(seconds), limit) for seconds, limit in limits.items()}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics(MetricsListener):
+    """Aggregates the requests of a `Pyltover` root per endpoint, e.g. `metrics.endpoints["v5.get_match_by_id"]`.
+
+        pyltover = Pyltover("your token", metrics=Metrics())
+
+    Counts requests, status codes, transport errors and bytes received, keeps latency and decode time histograms
+    and the last seen rate limit headers of every endpoint. `render_prometheus()` exposes all of it in prometheus'
+    text format.
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, api_name: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(api_name)
+        if metrics is None:
+            metrics = self.endpoints[api_name] = EndpointMetrics()
+        return metrics
+
+    def on_response(self, server_addr: str, api_name: str, resp: httpx.Response, seconds: float):
+        metrics = self.endpoint(api_name)
+        metrics.requests += 1
+        metrics.status_codes[resp.status_code] += 1
+        # Responses that were not streamed from a transport (e.g. mocked ones) have no downloaded byte count.
+        metrics.bytes_received += resp.num_bytes_downloaded or len(resp.content)
+        metrics.latency.observe(seconds)
+
+        headers = resp.headers
+        if APP_RATE_LIMIT_HEADER in headers:
+            metrics.rate_limits[(server_addr, "application")] = _rate_limit_windows(
+                headers, APP_RATE_LIMIT_HEADER, APP_RATE_LIMIT_COUNT_HEADER
+            )
+        if METHOD_RATE_LIMIT_HEADER in headers:
+            metrics.rate_limits[(server_addr, "method")] = _rate_limit_windows(
+                headers, METHOD_RATE_LIMIT_HEADER, METHOD_RATE_LIMIT_COUNT_HEADER
+            )
+
+    def on_transport_error(self, server_addr: str, api_name: str, error: httpx.TransportError, seconds: float):
+        metrics = self.endpoint(api_name)
+        metrics.requests += 1
+        metrics.transport_errors += 1
+        metrics.latency.observe(seconds)
+
+    def on_decode(self, api_name: str, seconds: float):
+        self.endpoint(api_name).decode.observe(seconds)
+
+    def render_prometheus(self, prefix: str = "pyltover") -> str:
+        lines = []
+
+        def family(name: str, type_: str, help_: str, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_}")
+            lines.append(f"# TYPE {prefix}_{name} {type_}")
+            for suffix, labels, value in samples:
+                lines.append(f"{prefix}_{name}{suffix}{_labels(**labels)} {_number(value)}")
+
+        def histogram_samples(attribute: str):
+            for api_name, metrics in sorted(self.endpoints.items()):
+                histogram = getattr(metrics, attribute)
+                for bound, count in histogram.cumulative_counts():
+                    yield "_bucket", {"api": api_name, "le": _number(bound)}, count
+                yield "_sum", {"api": api_name}, histogram.sum
+                yield "_count", {"api": api_name}, histogram.count
+
+        endpoints = sorted(self.endpoints.items())
+        family(
+            "requests_total",
+            "counter",
+            "Responses received from riot per endpoint and status code.",
+            (
+                ("", {"api": api_name, "status": status}, count)
+                for api_name, metrics in endpoints
+                for status, count in sorted(metrics.status_codes.items())
+            ),
+        )
+        family(
+            "transport_errors_total",
+            "counter",
+            "Requests that failed without a response.",
+            (("", {"api": api_name}, metrics.transport_errors) for api_name, metrics in endpoints),
+        )
+        family(
+            "response_bytes_total",
+            "counter",
+            "Bytes received from riot, as sent on the wire.",
+            (("", {"api": api_name}, metrics.bytes_received) for api_name, metrics in endpoints),
+        )
+        family("request_duration_seconds", "histogram", "Time to a complete response.", histogram_samples("latency"))
+        family("decode_duration_seconds", "histogram", "Time decoding response bodies.", histogram_samples("decode"))
+
+        rate_limit_windows = [
+            ({"api": api_name, "server": server_addr, "scope": scope, "window": seconds}, count, limit)
+            for api_name, metrics in endpoints
+            for (server_addr, scope), windows in sorted(metrics.rate_limits.items())
+            for seconds, (count, limit) in sorted(windows.items())
+        ]
+        family(
+            "rate_limit",
+            "gauge",
+            "Requests allowed per rate limit window, from riot's last rate limit headers.",
+            (("", labels, limit) for labels, _, limit in rate_limit_windows),
+        )
+        family(
+            "rate_limit_count",
+            "gauge",
+            "Requests already counted in each rate limit window, from riot's last rate limit headers.",
+            (("", labels, count) for labels, count, _ in rate_limit_windows if count is not None),
+        )
+        return "\n".join(lines) + "\n"
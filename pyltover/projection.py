@@ -0,0 +1,74 @@
+import functools
+import types
+import typing
+from typing import Any, Iterable, Union
+
+from pydantic import BaseModel, Field, create_model
+
+from pyltover.lazy import unwrap_optional
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    annotation = unwrap_optional(annotation)
+    if typing.get_origin(annotation) is list:
+        annotation = unwrap_optional(typing.get_args(annotation)[0])
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _replace(annotation: Any, old: type, new: type) -> Any:
+    if annotation is old:
+        return new
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        return list[_replace(typing.get_args(annotation)[0], old, new)]
+    if origin in (typing.Union, types.UnionType):
+        return Union[tuple(_replace(arg, old, new) for arg in typing.get_args(annotation))]
+    return annotation
+
+
+def _path_tree(model: type[BaseModel], paths: Iterable[str]) -> dict:
+    """Nests dotted paths into a dict of field name to sub tree, None standing for the whole field."""
+    tree = {}
+    for path in paths:
+        node, current = tree, model
+        names = path.split(".")
+        for depth, name in enumerate(names):
+            if current is None or name not in current.model_fields:
+                raise ValueError(f"{path!r} is not a field path of {model.__name__}")
+            if depth == len(names) - 1:
+                node[name] = None
+                break
+            if name in node and node[name] is None:
+                break
+            node = node.setdefault(name, {})
+            current = _nested_model(current.model_fields[name].annotation)
+    return tree
+
+
+def _freeze(tree: dict) -> tuple:
+    return tuple(sorted((name, None if sub_tree is None else _freeze(sub_tree)) for name, sub_tree in tree.items()))
+
+
+@functools.cache
+def _build(model: type[BaseModel], tree: tuple) -> type[BaseModel]:
+    fields = {}
+    for name, sub_tree in tree:
+        field = model.model_fields[name]
+        annotation = field.annotation
+        if sub_tree is not None:
+            nested = _nested_model(annotation)
+            annotation = _replace(annotation, nested, _build(nested, sub_tree))
+        fields[name] = (annotation, Field(field.default, alias=field.alias))
+    return create_model(f"{model.__name__}Projection", **fields)
+
+
+def projected_model(model: type[BaseModel], paths: Iterable[str]) -> type[BaseModel]:
+    """A copy of `model` keeping only the fields at `paths`, dotted field names such as `metadata.match_id` or
+    `info.participants.challenges.kda` (lists of models are walked through transparently).
+
+    A path ending on a model keeps the whole model. Validating json with the projected model skips every other field
+    while parsing, so neither the cpu nor the memory is spent on them. Projections are cached per set of paths.
+    """
+    return _build(model, _freeze(_path_tree(model, paths)))
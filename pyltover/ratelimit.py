@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import time
+from typing import Mapping
+
+
+logger = logging.getLogger(__name__)
+
+
+APP_RATE_LIMIT_HEADER = "X-App-Rate-Limit"
+APP_RATE_LIMIT_COUNT_HEADER = "X-App-Rate-Limit-Count"
+METHOD_RATE_LIMIT_HEADER = "X-Method-Rate-Limit"
+METHOD_RATE_LIMIT_COUNT_HEADER = "X-Method-Rate-Limit-Count"
+
+
+def parse_rate_limit_header(value: str | None) -> dict[int, int]:
+    """Parses riot's `limit:seconds,limit:seconds` header format into a `{seconds: limit}` dict.
+
+    The same format is used by the `-Count` headers, in which case the values are the number of requests already
+    counted in each window.
+    """
+    windows = {}
+    if not value:
+        return windows
+    for pair in value.split(","):
+        try:
+            amount, seconds = pair.split(":")
+            windows[int(seconds)] = int(amount)
+        except ValueError:
+            logger.warning("Ignoring malformed rate limit header value %r", value)
+    return windows
+
+
+class RateLimitWindow:
+    """A fixed window allowing `limit` requests every `seconds` seconds.
+
+    Riot starts a window on the first request counted in it and resets the whole count when it expires, so the
+    window mirrors that instead of leaking tokens continuously.
+    """
+
+    def __init__(self, limit: int, seconds: int, padding: float):
+        self.limit = limit
+        self.seconds = seconds
+        self.padding = padding
+        self.count = 0
+        self.reset_at: float | None = None
+
+    def _expire(self, now: float):
+        if self.reset_at is not None and now >= self.reset_at:
+            self.count = 0
+            self.reset_at = None
+
+    def wait_time(self, now: float) -> float:
+        self._expire(now)
+        if self.count < self.limit:
+            return 0.0
+        return self.reset_at - now
+
+    def headroom(self, now: float) -> float:
+        self._expire(now)
+        return max(self.limit - self.count, 0) / self.limit if self.limit else 0.0
+
+    def consume(self, now: float):
+        if self.reset_at is None:
+            self.reset_at = now + self.seconds + self.padding
+        self.count += 1
+
+    def sync(self, limit: int, count: int | None, now: float):
+        self._expire(now)
+        self.limit = limit
+        if count is not None and count > self.count:
+            self.count = count
+            if self.reset_at is None:
+                self.reset_at = now + self.seconds + self.padding
+
+
+class RateLimitBucket:
+    """All the windows riot enforces on one key, e.g. the application limit of a routing value."""
+
+    def __init__(self, padding: float):
+        self.padding = padding
+        self.windows: dict[int, RateLimitWindow] = {}
+        self.probing = False
+        self.blocked_until = 0.0
+
+    @property
+    def known(self) -> bool:
+        return bool(self.windows)
+
+    def wait_time(self, now: float) -> float:
+        wait_time = max((window.wait_time(now) for window in self.windows.values()), default=0.0)
+        return max(wait_time, self.blocked_until - now)
+
+    def headroom(self, now: float) -> float:
+        if self.probing or self.blocked_until > now:
+            return 0.0
+        return min((window.headroom(now) for window in self.windows.values()), default=1.0)
+
+    def consume(self, now: float):
+        for window in self.windows.values():
+            window.consume(now)
+
+    def sync(self, limits: dict[int, int], counts: dict[int, int], now: float):
+        for seconds in list(self.windows):
+            if seconds not in limits:
+                del self.windows[seconds]
+        for seconds, limit in limits.items():
+            window = self.windows.get(seconds)
+            if window is None:
+                window = self.windows[seconds] = self._new_window(limit, seconds)
+            window.sync(limit, counts.get(seconds), now)
+
+    def _new_window(self, limit: int, seconds: int) -> RateLimitWindow:
+        return RateLimitWindow(limit, seconds, self.padding)
+
+
+class RateLimiter:
+    """Client side mirror of riot's application and method rate limits.
+
+    Riot announces the limits of an API key in the `X-App-Rate-Limit` and `X-Method-Rate-Limit` headers of every
+    response, and how much of them is already used in the matching `-Count` headers. Application limits are enforced
+    per routing value (e.g. `euw1.api.riotgames.com`) and method limits per routing value and endpoint, so the
+    limiter keeps one bucket for each of them and makes callers wait until every window of both buckets has room.
+
+    Until the limits of a bucket are known only one request is let through at a time, the response headers of that
+    request then fill the bucket in.
+    """
+
+    def __init__(self, padding: float = 0.05):
+        self.padding = padding
+        self.app_buckets: dict[str, RateLimitBucket] = {}
+        self.method_buckets: dict[tuple[str, str], RateLimitBucket] = {}
+        self._probe_done: dict[str, asyncio.Event] = {}
+
+    def _buckets(self, server_addr: str, method: str) -> tuple[RateLimitBucket, RateLimitBucket]:
+        server_addr = str(server_addr)
+        app_bucket = self.app_buckets.get(server_addr)
+        if app_bucket is None:
+            app_bucket = self.app_buckets[server_addr] = self._new_bucket(server_addr)
+        method_bucket = self.method_buckets.get((server_addr, method))
+        if method_bucket is None:
+            method_bucket = self.method_buckets[(server_addr, method)] = self._new_bucket(f"{server_addr}/{method}")
+        return app_bucket, method_bucket
+
+    def _new_bucket(self, key: str) -> RateLimitBucket:
+        """Creates the bucket of `key`, the routing value of an application limit or `routing value/endpoint`."""
+        return RateLimitBucket(self.padding)
+
+    async def acquire(self, server_addr: str, method: str):
+        """Waits until a request to `method` on `server_addr` fits into the known limits and counts it."""
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        while True:
+            probing = [bucket for bucket in (app_bucket, method_bucket) if not bucket.known]
+            if any(bucket.probing for bucket in probing):
+                event = self._probe_done.setdefault(str(server_addr), asyncio.Event())
+                await event.wait()
+                continue
+
+            wait_time = await self._consume(app_bucket, method_bucket, probing)
+            if wait_time <= 0:
+                return
+
+            logger.debug("Rate limit reached for %s on %s, waiting %.2fs", method, server_addr, wait_time)
+            await asyncio.sleep(wait_time)
+
+    async def _consume(
+        self, app_bucket: RateLimitBucket, method_bucket: RateLimitBucket, probing: list[RateLimitBucket]
+    ) -> float:
+        """Counts a request in both buckets if they have room for it, otherwise returns how long to wait first."""
+        now = time.monotonic()
+        wait_time = max(app_bucket.wait_time(now), method_bucket.wait_time(now))
+        if wait_time <= 0:
+            app_bucket.consume(now)
+            method_bucket.consume(now)
+            for bucket in probing:
+                bucket.probing = True
+        return wait_time
+
+    def wait_time(self, server_addr: str, method: str) -> float:
+        """Seconds a request to `method` on `server_addr` would wait for the known limits right now."""
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        now = time.monotonic()
+        return max(app_bucket.wait_time(now), method_bucket.wait_time(now), 0.0)
+
+    def method_wait_time(self, server_addr: str, method: str) -> float:
+        """Seconds a request would wait for the limits of `method` alone, leaving out the application limits."""
+        _, method_bucket = self._buckets(server_addr, method)
+        return max(method_bucket.wait_time(time.monotonic()), 0.0)
+
+    def headroom(self, server_addr: str, method: str) -> float:
+        """Share of the tightest window of `method` on `server_addr` still free, from 0.0 to 1.0.
+
+        Buckets whose limits are not known yet count as free, unless their probe request is still in flight.
+        """
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        now = time.monotonic()
+        return min(app_bucket.headroom(now), method_bucket.headroom(now))
+
+    def block(self, server_addr: str, method: str, rate_limit_type: str, seconds: float):
+        """Holds back every request counted in the exceeded limit for `seconds`, e.g. after a 429 response."""
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        bucket = app_bucket if rate_limit_type == "application" else method_bucket
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+
+    def update(self, server_addr: str, method: str, headers: Mapping[str, str] | None):
+        """Synchronizes the buckets with the rate limit headers of a response.
+
+        Must be called once for every `acquire`, with `headers=None` when the request failed without a response.
+        """
+        app_bucket, method_bucket = self._buckets(server_addr, method)
+        if headers is not None:
+            now = time.monotonic()
+            app_limits = parse_rate_limit_header(headers.get(APP_RATE_LIMIT_HEADER))
+            if app_limits:
+                app_counts = parse_rate_limit_header(headers.get(APP_RATE_LIMIT_COUNT_HEADER))
+                app_bucket.sync(app_limits, app_counts, now)
+            method_limits = parse_rate_limit_header(headers.get(METHOD_RATE_LIMIT_HEADER))
+            if method_limits:
+                method_counts = parse_rate_limit_header(headers.get(METHOD_RATE_LIMIT_COUNT_HEADER))
+                method_bucket.sync(method_limits, method_counts, now)
+
+        if app_bucket.probing or method_bucket.probing:
+            app_bucket.probing = False
+            method_bucket.probing = False
+            event = self._probe_done.pop(str(server_addr), None)
+            if event is not None:
+                event.set()
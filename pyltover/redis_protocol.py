@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any
+
+
+class RespError(Exception):
+    """An error reply of a Redis protocol server."""
+
+
+def _encode(args: tuple) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%b\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("connection closed by the server")
+    kind, value = line[:1], line[1:-2]
+    if kind == b"+":
+        return value.decode()
+    if kind == b"-":
+        return RespError(value.decode())
+    if kind == b":":
+        return int(value)
+    if kind == b"$":
+        length = int(value)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(value)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"unexpected reply {line!r}")
+
+
+class RespClient:
+    """Small asyncio client of the Redis protocol (RESP2), enough for the shared backends of `pyltover.distributed`.
+
+    Works with Redis, Valkey, KeyDB or any other server speaking the protocol, and with the in-memory `RedisServer` of the tests. Up to
+    `max_connections` connections are opened, and `pipeline` sends several commands in a single round trip.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        *,
+        db: int = 0,
+        password: str | None = None,
+        max_connections: int = 10,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        setup = []
+        if self.password is not None:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            writer.write(b"".join(_encode(command) for command in setup))
+            for _ in setup:
+                reply = await _read_reply(reader)
+                if isinstance(reply, RespError):
+                    writer.close()
+                    raise reply
+        return reader, writer
+
+    async def pipeline(self, *commands: tuple) -> list[Any]:
+        """Sends `commands` at once and returns their replies, error replies are returned as `RespError`."""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            reader, writer = connection
+            try:
+                writer.write(b"".join(_encode(command) for command in commands))
+                await writer.drain()
+                replies = [await _read_reply(reader) for _ in commands]
+            except BaseException:
+                # A connection interrupted mid reply can't be reused.
+                writer.close()
+                raise
+            self._idle.append(connection)
+            return replies
+
+    async def execute(self, *args) -> Any:
+        (reply,) = await self.pipeline(args)
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def aclose(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            await writer.wait_closed()
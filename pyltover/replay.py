@@ -0,0 +1,253 @@
+import asyncio
+import base64
+import gzip
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import orjson
+
+from pyltover.base import DEFAULT_LIMITS
+from pyltover.ratelimit import (
+    APP_RATE_LIMIT_COUNT_HEADER,
+    APP_RATE_LIMIT_HEADER,
+    METHOD_RATE_LIMIT_COUNT_HEADER,
+    METHOD_RATE_LIMIT_HEADER,
+)
+from pyltover.retry import RATE_LIMIT_TYPE_HEADER, RETRY_AFTER_HEADER
+
+
+logger = logging.getLogger(__name__)
+
+
+# Only the headers the client acts on are recorded, which keeps cassettes small and free of anything sensitive.
+RECORDED_HEADERS = (
+    "Content-Type",
+    APP_RATE_LIMIT_HEADER,
+    APP_RATE_LIMIT_COUNT_HEADER,
+    METHOD_RATE_LIMIT_HEADER,
+    METHOD_RATE_LIMIT_COUNT_HEADER,
+    RETRY_AFTER_HEADER,
+    RATE_LIMIT_TYPE_HEADER,
+)
+
+
+class CassetteEntry:
+    """One recorded response, `offset` seconds after the recording started, which took riot `elapsed` seconds."""
+
+    __slots__ = ("offset", "elapsed", "method", "url", "status_code", "headers", "content")
+
+    def __init__(
+        self,
+        offset: float,
+        elapsed: float,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: dict[str, str],
+        content: bytes,
+    ):
+        self.offset = offset
+        self.elapsed = elapsed
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def to_json(self) -> bytes:
+        entry = {
+            "offset": round(self.offset, 6),
+            "elapsed": round(self.elapsed, 6),
+            "method": self.method,
+            "url": self.url,
+            "status": self.status_code,
+            "headers": self.headers,
+        }
+        try:
+            entry["body"] = self.content.decode()
+        except UnicodeDecodeError:
+            entry["body_base64"] = base64.b64encode(self.content).decode()
+        return orjson.dumps(entry)
+
+    @classmethod
+    def from_json(cls, line: bytes) -> "CassetteEntry":
+        entry = orjson.loads(line)
+        if "body" in entry:
+            content = entry["body"].encode()
+        else:
+            content = base64.b64decode(entry["body_base64"])
+        return cls(
+            entry["offset"],
+            entry["elapsed"],
+            entry["method"],
+            entry["url"],
+            entry["status"],
+            entry["headers"],
+            content,
+        )
+
+    def __repr__(self):
+        return f"[CassetteEntry: <{self.method} {self.url} {self.status_code} at {self.offset:.3f}s>]"
+
+
+def read_cassette(path: str | Path) -> Iterator[CassetteEntry]:
+    """The responses of a cassette in the order they were recorded, e.g. to replay the traffic at its own pace.
+
+    A response the recording process was killed in the middle of writing is skipped.
+    """
+    with gzip.open(path, "rb") as file:
+        try:
+            for line in file:
+                if line.strip():
+                    yield CassetteEntry.from_json(line)
+        except EOFError:
+            logger.warning("Cassette %s ends with a truncated response, skipping it", path)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends requests through `transport` and appends every response to a cassette, a gzipped file of json lines.
+
+    Plugs into a client like any transport, e.g. `Pyltover("your token", transport=RecordingTransport(path))`, and
+    sends the requests through a pool with `DEFAULT_LIMITS` unless another `transport` is given. The
+    status, the rate limit headers and the body of each response are recorded with its url and timing, never the
+    request headers, so the api key does not end up in the cassette. Each response is written as a gzip member of
+    its own and flushed at once, off the event loop, so a recording killed midway still leaves a readable cassette.
+    Closing the client closes the cassette.
+    """
+
+    def __init__(self, path: str | Path, transport: httpx.AsyncBaseTransport | None = None):
+        self.path = Path(path)
+        self.transport = transport if transport is not None else httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS)
+        self._started_at: float | None = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._lock = threading.Lock()
+
+    def _write(self, entry: CassetteEntry):
+        member = gzip.compress(entry.to_json() + b"\n")
+        with self._lock:
+            self._file.write(member)
+            self._file.flush()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sent_at = time.perf_counter()
+        if self._started_at is None:
+            self._started_at = sent_at
+        resp = await self.transport.handle_async_request(request)
+        try:
+            content = await resp.aread()
+        finally:
+            await resp.aclose()
+
+        entry = CassetteEntry(
+            sent_at - self._started_at,
+            time.perf_counter() - sent_at,
+            request.method,
+            str(request.url),
+            resp.status_code,
+            {name: resp.headers[name] for name in RECORDED_HEADERS if name in resp.headers},
+            content,
+        )
+        await asyncio.to_thread(self._write, entry)
+
+        # The body is already decoded, so it is handed on without the headers describing its encoding on the wire.
+        headers = [
+            (name, value)
+            for name, value in resp.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(resp.status_code, headers=headers, content=content, extensions=resp.extensions)
+
+    async def aclose(self):
+        self._file.close()
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves the responses of a cassette recorded by `RecordingTransport`, without any network nor api key.
+
+    Requests are matched on their method and full url, and the responses recorded for a url are served in turn,
+    starting over once all of them were served. Unknown urls get a 404 like riot's, and are counted in `misses`.
+
+    By default responses are served at once. With `speed` (1.0 is real time) each response is served when riot
+    answered it in the recording, counted from the first request of the replay and scaled down by `speed`, so the
+    recorded traffic pattern is reproduced: a request sent later than recorded waits for riot's answer time alone.
+    `latency` seconds are added to every response. `rate_limit_rate` and
+    `server_error_rate` are the fractions of requests answered by an injected 429 (of `rate_limit_type`, with a
+    `Retry-After` of `retry_after` seconds) or 503 instead, `seed` makes the injected errors reproducible.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        speed: float | None = None,
+        latency: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        rate_limit_type: str = "application",
+        retry_after: float = 1.0,
+        seed: int | None = None,
+    ):
+        self.speed = speed
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.rate_limit_type = rate_limit_type
+        self.retry_after = retry_after
+        self.misses: Counter[str] = Counter()
+
+        self._random = random.Random(seed)
+        self._started_at: float | None = None
+        self._entries: dict[tuple[str, str], list[CassetteEntry]] = {}
+        self._served: Counter[tuple[str, str]] = Counter()
+        for entry in read_cassette(path):
+            self._entries.setdefault((entry.method, entry.url), []).append(entry)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = (request.method, str(request.url))
+        entries = self._entries.get(key)
+        entry = None
+        if entries is not None:
+            entry = entries[self._served[key] % len(entries)]
+            self._served[key] += 1
+
+        now = time.monotonic()
+        if self._started_at is None:
+            self._started_at = now
+        delay = self.latency
+        if entry is not None and self.speed:
+            sent_at = max(self._started_at + entry.offset / self.speed, now)
+            delay += sent_at + entry.elapsed / self.speed - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        draw = self._random.random()
+        if draw < self.rate_limit_rate:
+            return self._riot_error(
+                429,
+                "Rate limit exceeded",
+                {RETRY_AFTER_HEADER: f"{self.retry_after:g}", RATE_LIMIT_TYPE_HEADER: self.rate_limit_type},
+            )
+        if draw < self.rate_limit_rate + self.server_error_rate:
+            return self._riot_error(503, "Service unavailable")
+        if entry is None:
+            logger.warning("No recorded response for %s %s", *key)
+            self.misses[key[1]] += 1
+            return self._riot_error(404, "Data not found - no recorded response")
+        return httpx.Response(entry.status_code, headers=entry.headers, content=entry.content)
+
+    @staticmethod
+    def _riot_error(status_code: int, message: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        return httpx.Response(
+            status_code, json={"status": {"message": message, "status_code": status_code}}, headers=headers
+        )
@@ -0,0 +1,66 @@
+import logging
+import random
+from enum import StrEnum
+
+import httpx
+from pydantic import BaseModel
+
+
+logger = logging.getLogger(__name__)
+
+
+RETRY_AFTER_HEADER = "Retry-After"
+RATE_LIMIT_TYPE_HEADER = "X-Rate-Limit-Type"
+
+
+class RateLimitType(StrEnum):
+    APPLICATION = "application"
+    METHOD = "method"
+    SERVICE = "service"
+
+
+class RetryPolicy(BaseModel):
+    """Decides whether and when a failed request to riot's api is sent again.
+
+    429 responses caused by the application or method limits of the key wait for `Retry-After`, which the rate
+    limiter also applies to every other request sharing the limit. Everything else (429s of the underlying service,
+    5xx responses and connection errors) waits for `Retry-After` when riot sends one, otherwise for a capped
+    exponential backoff with full jitter.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    retry_status_codes: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_transport_errors: bool = True
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def should_retry(self, resp: httpx.Response, attempt: int) -> bool:
+        return attempt < self.max_retries and resp.status_code in self.retry_status_codes
+
+    def should_retry_error(self, error: Exception, attempt: int) -> bool:
+        return attempt < self.max_retries and self.retry_transport_errors and isinstance(error, httpx.TransportError)
+
+    def delay(self, resp: httpx.Response, attempt: int) -> float:
+        retry_after = retry_after_seconds(resp)
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+
+def retry_after_seconds(resp: httpx.Response) -> float | None:
+    value = resp.headers.get(RETRY_AFTER_HEADER)
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        logger.warning("Ignoring malformed Retry-After header %r", value)
+        return None
+
+
+def rate_limit_type(resp: httpx.Response) -> str | None:
+    value = resp.headers.get(RATE_LIMIT_TYPE_HEADER)
+    return value.lower() if value else None
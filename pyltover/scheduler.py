@@ -0,0 +1,124 @@
+import asyncio
+import heapq
+import itertools
+from typing import Any, Mapping, Protocol
+
+
+DEFAULT_PRIORITY_WEIGHTS = {"interactive": 16.0, "default": 4.0, "background": 1.0}
+
+
+class Limiter(Protocol):
+    """What the scheduler hands requests to, a `RateLimiter` or a `KeyPool`."""
+
+    async def acquire(self, server_addr: str, method: str) -> Any: ...
+
+    def method_wait_time(self, server_addr: str, method: str) -> float: ...
+
+
+class _Request:
+    __slots__ = ("priority", "start", "finish", "turn")
+
+    def __init__(self, priority: str, start: float, finish: float):
+        self.priority = priority
+        self.start = start
+        self.finish = finish
+        self.turn: asyncio.Future | None = None
+
+
+class _Lane:
+    """The requests queued for the rate limits of one routing value, served by start-time fair queuing."""
+
+    def __init__(self):
+        self.virtual_time = 0.0
+        self.last_finish: dict[str, float] = {}
+        self.queue: list[tuple[float, int, _Request]] = []
+        self.busy = False
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def request(self, priority: str, weight: float) -> _Request:
+        start = max(self.virtual_time, self.last_finish.get(priority, 0.0))
+        request = _Request(priority, start, start + 1 / weight)
+        self.last_finish[priority] = request.finish
+        return request
+
+    def push(self, request: _Request):
+        request.turn = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.queue, (request.start, next(self._sequence), request))
+        self._dispatch()
+
+    def release(self):
+        self.busy = False
+        self._dispatch()
+
+    def _dispatch(self):
+        while not self.busy and self.queue:
+            start, _, request = heapq.heappop(self.queue)
+            if request.turn.done():
+                continue
+            self.busy = True
+            self.virtual_time = max(self.virtual_time, start)
+            request.turn.set_result(None)
+
+
+class PriorityScheduler:
+    """Orders the requests waiting for the rate limits of a server by priority class, with weighted fair queuing.
+
+        pyltover = Pyltover("your token", scheduler=PriorityScheduler())
+        summoner = await pyltover.euw1.v4.with_options(priority="interactive").get_summoner_by_puuid(puuid)
+
+    Requests of a server take turns at its rate limiter, one at a time. When several classes are waiting, each one
+    gets turns in proportion to its weight in `weights`, e.g. with the default weights an interactive request jumps
+    ahead of the queued background downloads and gets 16 turns for each one of them, while background work keeps at
+    least its 1/21 share however many interactive requests come in. Requests without a priority are of class
+    `default_priority`.
+
+    Only the application limits of the server, which every endpoint shares, are waited for during a turn. A request
+    whose endpoint's own limit is used up gives its turn away, and waits for it outside the queue before taking its
+    place back, so it never holds back the requests to other endpoints.
+    """
+
+    def __init__(self, weights: Mapping[str, float] | None = None, default_priority: str = "default"):
+        self.weights = dict(weights if weights is not None else DEFAULT_PRIORITY_WEIGHTS)
+        if default_priority not in self.weights:
+            raise ValueError(f"default priority {default_priority!r} has no weight")
+        self.default_priority = default_priority
+        self._lanes: dict[str, _Lane] = {}
+
+    def queued(self, server_addr: str) -> int:
+        """Number of requests waiting for their turn on `server_addr`."""
+        lane = self._lanes.get(str(server_addr))
+        return len(lane) if lane is not None else 0
+
+    async def acquire(self, limiter: Limiter, server_addr: str, method: str, priority: str | None = None) -> Any:
+        """Waits for the turn of the request, then for `limiter` to let it through, and returns what `limiter`
+        returned, e.g. the key of a `KeyPool` to send the request with."""
+        priority = priority if priority is not None else self.default_priority
+        weight = self.weights.get(priority)
+        if weight is None:
+            raise ValueError(f"unknown priority {priority!r}, expected one of {sorted(self.weights)}")
+
+        lane = self._lanes.get(str(server_addr))
+        if lane is None:
+            lane = self._lanes[str(server_addr)] = _Lane()
+        request = lane.request(priority, weight)
+        while True:
+            lane.push(request)
+            try:
+                await request.turn
+            except asyncio.CancelledError:
+                if request.turn.done() and not request.turn.cancelled():
+                    lane.release()
+                raise
+            method_wait_time = limiter.method_wait_time(server_addr, method)
+            if method_wait_time <= 0:
+                break
+            lane.release()
+            await asyncio.sleep(method_wait_time)
+
+        try:
+            return await limiter.acquire(server_addr, method)
+        finally:
+            lane.release()
@@ -0,0 +1,213 @@
+import fcntl
+import hashlib
+import math
+import os
+import struct
+import tempfile
+from multiprocessing import resource_tracker, shared_memory
+from typing import Mapping
+
+from pyltover.ratelimit import RateLimitBucket, RateLimiter, RateLimitWindow
+
+
+# A slot is the 16 bytes digest of its key, then the limit, the count and the reset time of a window. The slot of a
+# bucket's `blocked_until` only uses the reset time.
+_SLOT = struct.Struct("=16sqqd")
+_FIELDS = struct.Struct("=qqd")
+_EMPTY_DIGEST = bytes(16)
+
+
+class _FileLock:
+    """Re-entrant exclusive lock shared by every process opening the same file."""
+
+    def __init__(self, path: str):
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._depth = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _SlotTable:
+    """Open addressing hash table of window states in a shared memory segment, zeroed bytes being empty slots."""
+
+    def __init__(self, name: str, slots: int):
+        self.slots = slots
+        self.lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self.lock = _FileLock(self.lock_path)
+        with self.lock:
+            try:
+                self.memory = shared_memory.SharedMemory(name, create=True, size=slots * _SLOT.size)
+            except FileExistsError:
+                self.memory = shared_memory.SharedMemory(name)
+        # The segment outlives this process on purpose, the other workers keep using it, see `unlink()`.
+        resource_tracker.unregister(self.memory._name, "shared_memory")
+        if self.memory.size < slots * _SLOT.size:
+            raise ValueError(f"shared memory {name!r} holds less than {slots} slots")
+        self._offsets: dict[str, int] = {}
+
+    def offset(self, key: str, limit: int = 0) -> int:
+        """Offset of the slot of `key`, allocating it with `limit` if no process did yet."""
+        offset = self._offsets.get(key)
+        if offset is not None:
+            return offset
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        start = int.from_bytes(digest[:8], "little") % self.slots
+        with self.lock:
+            for probe in range(self.slots):
+                offset = (start + probe) % self.slots * _SLOT.size
+                slot_digest = bytes(self.memory.buf[offset : offset + 16])
+                if slot_digest == digest:
+                    break
+                if slot_digest == _EMPTY_DIGEST:
+                    _SLOT.pack_into(self.memory.buf, offset, digest, limit, 0, math.nan)
+                    break
+            else:
+                raise RuntimeError(f"shared memory rate limiter is full, increase its {self.slots} slots")
+        self._offsets[key] = offset
+        return offset
+
+    def read(self, offset: int) -> tuple[int, int, float]:
+        _, limit, count, reset_at = _SLOT.unpack_from(self.memory.buf, offset)
+        return limit, count, reset_at
+
+    def write(self, offset: int, limit: int, count: int, reset_at: float):
+        _FIELDS.pack_into(self.memory.buf, offset + 16, limit, count, reset_at)
+
+    def close(self):
+        self.memory.close()
+        self.lock.close()
+
+
+class _SharedRateLimitWindow(RateLimitWindow):
+    """A window whose limit, count and reset time live in a slot shared with the other processes."""
+
+    def __init__(self, table: _SlotTable, key: str, limit: int, seconds: int, padding: float):
+        self.table = table
+        self.offset = table.offset(key, limit)
+        self.seconds = seconds
+        self.padding = padding
+
+    def _set(self, **fields):
+        limit, count, reset_at = self.table.read(self.offset)
+        fields = {"limit": limit, "count": count, "reset_at": reset_at, **fields}
+        self.table.write(self.offset, fields["limit"], fields["count"], fields["reset_at"])
+
+    @property
+    def limit(self) -> int:
+        return self.table.read(self.offset)[0]
+
+    @limit.setter
+    def limit(self, value: int):
+        self._set(limit=value)
+
+    @property
+    def count(self) -> int:
+        return self.table.read(self.offset)[1]
+
+    @count.setter
+    def count(self, value: int):
+        self._set(count=value)
+
+    @property
+    def reset_at(self) -> float | None:
+        reset_at = self.table.read(self.offset)[2]
+        return None if math.isnan(reset_at) else reset_at
+
+    @reset_at.setter
+    def reset_at(self, value: float | None):
+        self._set(reset_at=math.nan if value is None else value)
+
+
+class _SharedRateLimitBucket(RateLimitBucket):
+    """A bucket whose windows and `blocked_until` are shared, its `__init__` leaves the shared state as it is."""
+
+    def __init__(self, table: _SlotTable, key: str, padding: float):
+        self.table = table
+        self.key = key
+        self.padding = padding
+        self.windows: dict[int, RateLimitWindow] = {}
+        self.probing = False
+        self._blocked_offset = table.offset(f"{key}#blocked")
+
+    @property
+    def blocked_until(self) -> float:
+        blocked_until = self.table.read(self._blocked_offset)[2]
+        return 0.0 if math.isnan(blocked_until) else blocked_until
+
+    @blocked_until.setter
+    def blocked_until(self, value: float):
+        self.table.write(self._blocked_offset, 0, 0, value)
+
+    def _new_window(self, limit: int, seconds: int) -> RateLimitWindow:
+        return _SharedRateLimitWindow(self.table, f"{self.key}#{seconds}", limit, seconds, self.padding)
+
+
+class SharedMemoryRateLimiter(RateLimiter):
+    """Rate limiter sharing its windows with every process of the host that opens one with the same `name`.
+
+    Worker processes each running their own `Pyltover` then share the application and method limits of their key
+    exactly, instead of each one assuming it has the whole quota:
+
+        pyltover = Pyltover("your token", rate_limiter=SharedMemoryRateLimiter("pyltover-production-key"))
+
+    Window counts and reset times are kept in a `multiprocessing.shared_memory` segment, and every check and update
+    of them holds a lock file next to it, so a request is counted by one process at a time. Use one name per api
+    key. The segment stays around while the workers restart, `unlink()` removes it once no worker uses it anymore.
+    Only available on POSIX systems.
+    """
+
+    def __init__(self, name: str, *, slots: int = 4096, padding: float = 0.05):
+        self.name = name
+        self._table = _SlotTable(name, slots)
+        super().__init__(padding)
+
+    def _new_bucket(self, key: str) -> RateLimitBucket:
+        with self._table.lock:
+            return _SharedRateLimitBucket(self._table, key, self.padding)
+
+    async def _consume(self, app_bucket, method_bucket, probing) -> float:
+        # Nothing is awaited in `RateLimiter._consume`, so the lock is never held across a suspension.
+        with self._table.lock:
+            return await super()._consume(app_bucket, method_bucket, probing)
+
+    def wait_time(self, server_addr: str, method: str) -> float:
+        with self._table.lock:
+            return super().wait_time(server_addr, method)
+
+    def method_wait_time(self, server_addr: str, method: str) -> float:
+        with self._table.lock:
+            return super().method_wait_time(server_addr, method)
+
+    def headroom(self, server_addr: str, method: str) -> float:
+        with self._table.lock:
+            return super().headroom(server_addr, method)
+
+    def block(self, server_addr: str, method: str, rate_limit_type: str, seconds: float):
+        with self._table.lock:
+            super().block(server_addr, method, rate_limit_type, seconds)
+
+    def update(self, server_addr: str, method: str, headers: Mapping[str, str] | None):
+        with self._table.lock:
+            super().update(server_addr, method, headers)
+
+    def close(self):
+        self._table.close()
+
+    def unlink(self):
+        """Removes the shared memory segment and its lock file, the processes still attached keep sharing them."""
+        # Registered again only for `SharedMemory.unlink` to unregister it.
+        resource_tracker.register(self._table.memory._name, "shared_memory")
+        self._table.memory.unlink()
+        os.unlink(self._table.lock_path)
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one, every caller awaits the result of the first.
+
+    The call runs in its own task, so cancelling one of the callers doesn't cancel it for the others. `shared` marks
+    calls whose result other processes can read once it is done, e.g. from a shared cache, which only changes anything
+    for `pyltover.distributed.DistributedSingleFlight`.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self):
+        return len(self._tasks)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]], *, shared: bool = False) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved when every caller was cancelled before the call failed.
+            task.exception()
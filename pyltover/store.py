@@ -0,0 +1,120 @@
+import asyncio
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class MatchStore(ABC):
+    """Persistent storage of raw match bodies, subclass it to keep them somewhere else than in sqlite."""
+
+    @abstractmethod
+    async def get(self, match_id: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, match_id: str, content: bytes):
+        raise NotImplementedError
+
+
+class SQLiteMatchStore(MatchStore):
+    """Keeps raw match bodies in a sqlite database, keyed by match id.
+
+    Bodies are zlib compressed unless `compress=False`. Once the stored bodies take more than `max_bytes` the oldest
+    ones are deleted until they fit into `max_bytes * low_watermark` again, `compact()` then gives the freed pages back
+    to the file system.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = 10 * 1024 * 1024 * 1024,
+        low_watermark: float = 0.9,
+        compress: bool = True,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.low_watermark = low_watermark
+        self.compress = compress
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, match_id TEXT NOT NULL UNIQUE, body BLOB NOT NULL, "
+            "size INTEGER NOT NULL, compressed INTEGER NOT NULL)"
+        )
+        (self.size,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM matches").fetchone()
+        return count
+
+    async def get(self, match_id: str) -> bytes | None:
+        return await asyncio.to_thread(self.get_sync, match_id)
+
+    async def set(self, match_id: str, content: bytes):
+        await asyncio.to_thread(self.set_sync, match_id, content)
+
+    async def compact(self):
+        await asyncio.to_thread(self.compact_sync)
+
+    def get_sync(self, match_id: str) -> bytes | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, compressed FROM matches WHERE match_id = ?", (match_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, compressed = row
+        return zlib.decompress(body) if compressed else body
+
+    def set_sync(self, match_id: str, content: bytes):
+        body = zlib.compress(content) if self.compress else content
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN")
+            try:
+                row = connection.execute("SELECT size FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+                if row is not None:
+                    connection.execute("DELETE FROM matches WHERE match_id = ?", (match_id,))
+                    self.size -= row[0]
+                connection.execute(
+                    "INSERT INTO matches (match_id, body, size, compressed) VALUES (?, ?, ?, ?)",
+                    (match_id, body, len(body), int(self.compress)),
+                )
+                self.size += len(body)
+                if self.size > self.max_bytes:
+                    self._evict(int(self.max_bytes * self.low_watermark))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                (self.size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()
+                raise
+
+    def compact_sync(self):
+        with self._lock:
+            self._connection.execute("VACUUM")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self, target_size: int):
+        freed = 0
+        cursor = self._connection.execute("SELECT id, size FROM matches ORDER BY id")
+        last_id = None
+        for row_id, size in cursor:
+            if self.size - freed <= target_size:
+                break
+            freed += size
+            last_id = row_id
+        cursor.close()
+        if last_id is not None:
+            self._connection.execute("DELETE FROM matches WHERE id <= ?", (last_id,))
+            self.size -= freed
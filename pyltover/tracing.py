@@ -0,0 +1,132 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+logger = logging.getLogger(__name__)
+
+
+PHASES = ("limiter_wait", "connect", "tls", "send", "headers", "body", "decode", "validate")
+
+# httpcore trace events (without their `http11.`/`http2.`/`connection.` prefix) and the phase they are timed in.
+_HTTPCORE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "headers",
+    "receive_response_body": "body",
+}
+
+# Trace of the api call running in the current task, set by `BasePyltover._get` when the call is sampled.
+current_trace: ContextVar["RequestTrace | None"] = ContextVar("pyltover_trace", default=None)
+
+
+class RequestTrace:
+    """Time spent in each phase of one api call, in seconds, summed over its retries.
+
+    The phases are `limiter_wait` (queued on the rate limiter), `connect` and `tls` (opening a new connection),
+    `send`, `headers` (waiting for the response headers, i.e. the server's time to first byte), `body` (downloading
+    the body), `decode` (parsing the json) and `validate` (building the models). Only the phases a call went through
+    are present, e.g. a call reusing a warm connection has no `connect`, and one served from the response cache
+    (`cache_hit`) has no request phase at all.
+    """
+
+    def __init__(self, server_addr: str, api_name: str, url: str, tracer: "Tracer"):
+        self.tracer = tracer
+        self.server_addr = server_addr
+        self.api_name = api_name
+        self.url = url
+        self.status_code: int | None = None
+        self.error: BaseException | None = None
+        self.attempts = 0
+        self.cache_hit = False
+        self.phases: dict[str, float] = {}
+        self.started_at = time.perf_counter()
+        self.duration: float | None = None
+        self._event_started_at: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started_at
+
+    async def httpx_trace(self, event_name: str, info: dict):
+        """httpx's `trace` request extension, timing the connection and transfer phases from httpcore's events."""
+        name, _, stage = event_name.rpartition(".")
+        if stage == "started":
+            self._event_started_at[name] = time.perf_counter()
+        elif stage in ("complete", "failed"):
+            started_at = self._event_started_at.pop(name, None)
+            phase = _HTTPCORE_PHASES.get(name.partition(".")[2])
+            if started_at is not None and phase is not None:
+                self.add(phase, time.perf_counter() - started_at)
+
+    def summary(self) -> str:
+        outcome = self.status_code if self.error is None else repr(self.error)
+        phases = ", ".join(f"{phase}={self.phases[phase] * 1e3:.1f}ms" for phase in PHASES if phase in self.phases)
+        duration = f"{self.duration * 1e3:.1f}ms" if self.duration is not None else "?"
+        return f"{self.api_name} {outcome} in {duration} ({phases or 'no phases'})"
+
+    def __repr__(self):
+        return f"[RequestTrace: <{self.summary()}>]"
+
+
+def finish_trace():
+    """Ends the trace of the api call running in the current task, if it is traced, and hands it to its tracer."""
+    trace = current_trace.get()
+    if trace is None:
+        return
+    current_trace.set(None)
+    trace.finish()
+    try:
+        trace.tracer.on_trace(trace)
+    except Exception:
+        logger.exception("%r failed to handle %r", trace.tracer, trace)
+
+
+@contextmanager
+def traced_phase(phase: str):
+    """Adds the time spent in the block to `phase` of the current trace, if any."""
+    trace = current_trace.get()
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        if trace is not None:
+            trace.add(phase, time.perf_counter() - started_at)
+
+
+class Tracer:
+    """Receives the `RequestTrace` of sampled api calls, subclass it to send them anywhere.
+
+    Only `sample_rate` of the calls are traced, so it can stay on in production. A traced call parses its json with
+    orjson before validating it, to time both apart, which is a little slower than validating the json at once.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        self.sample_rate = sample_rate
+
+    def sample(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def on_trace(self, trace: RequestTrace):
+        pass
+
+
+class SlowRequestLogger(Tracer):
+    """Logs a warning with the phase timings of every sampled call slower than `threshold` seconds.
+
+    pyltover = Pyltover("your token", tracer=SlowRequestLogger(threshold=0.5, sample_rate=0.01))
+    """
+
+    def __init__(self, threshold: float = 1.0, sample_rate: float = 1.0):
+        super().__init__(sample_rate)
+        self.threshold = threshold
+
+    def on_trace(self, trace: RequestTrace):
+        if trace.duration is not None and trace.duration >= self.threshold:
+            logger.warning("Slow request %s", trace.summary())
@@ -1,6 +1,11 @@
+from pathlib import Path
+
 import pytest
 
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
 @pytest.fixture
 def unknown_api_token():
     return "unknown-api-token"
@@ -21,6 +26,11 @@ def riot_api_token():
         raise FileNotFoundError("Please create a file with name .devkey with your token inside it.")
 
 
+@pytest.fixture
+def match_json():
+    return (FIXTURES_DIR / "match.json").read_bytes()
+
+
 acounts_puuid = {"SoltanSoren": "iyPYkvZg9bA-vnOKhE1ADcmkT6Z89VwQuxm_t9lHJZg-8PDDHqa1ASGzmiobXJ7Pu8wD3ZbqMuHcsw"}
 acounts_game_names = {"SoltanSoren": "SoltanSoren"}
 acounts_taglines = {"SoltanSoren": "RPS"}
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import Any
+
+from pyltover.redis_protocol import RespError, _read_reply
+
+
+class RedisServer:
+    """Pure python stand-in for a Redis server, keeping strings in memory, to run the shared backends in tests.
+
+        async with RedisServer() as server:
+            client = RespClient(server.host, server.port)
+
+    Supports the commands the backends use: PING, GET, SET (with NX, XX, EX, PX), DEL, EXISTS, INCR, INCRBY, DECR,
+    DECRBY, EXPIRE, PEXPIRE, PTTL and FLUSHALL. Commands run one at a time, as in Redis.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self._server: asyncio.Server | None = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def aclose(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    command = await _read_reply(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                writer.write(self._reply(self._run(command)))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _reply(value: Any) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, RespError):
+            return b"-%b\r\n" % str(value).encode()
+        if isinstance(value, bool):
+            return b"+OK\r\n"
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, str):
+            return b"+%b\r\n" % value.encode()
+        return b"$%d\r\n%b\r\n" % (len(value), value)
+
+    def _entry(self, key: bytes) -> tuple[bytes, float | None] | None:
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    def _incr(self, key: bytes, amount: int) -> int | RespError:
+        entry = self._entry(key)
+        try:
+            value = int(entry[0]) + amount if entry is not None else amount
+        except ValueError:
+            return RespError("ERR value is not an integer or out of range")
+        self.data[key] = (str(value).encode(), entry[1] if entry is not None else None)
+        return value
+
+    def _expire(self, key: bytes, seconds: float) -> int:
+        entry = self._entry(key)
+        if entry is None:
+            return 0
+        self.data[key] = (entry[0], time.monotonic() + seconds)
+        return 1
+
+    def _run(self, command: list[bytes]) -> Any:
+        name, args = command[0].upper().decode(), command[1:]
+        if name == "PING":
+            return "PONG"
+        if name in ("AUTH", "SELECT"):
+            return True
+        if name == "GET":
+            entry = self._entry(args[0])
+            return entry[0] if entry is not None else None
+        if name == "SET":
+            key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+            expires_at = None
+            for option, amount in zip(options, args[3:]):
+                if option in (b"EX", b"PX"):
+                    expires_at = time.monotonic() + int(amount) / (1 if option == b"EX" else 1000)
+            exists = self._entry(key) is not None
+            if (b"NX" in options and exists) or (b"XX" in options and not exists):
+                return None
+            self.data[key] = (value, expires_at)
+            return True
+        if name == "DEL":
+            return sum(self.data.pop(key, None) is not None for key in args)
+        if name == "EXISTS":
+            return sum(self._entry(key) is not None for key in args)
+        if name in ("INCR", "DECR"):
+            return self._incr(args[0], 1 if name == "INCR" else -1)
+        if name in ("INCRBY", "DECRBY"):
+            return self._incr(args[0], int(args[1]) * (1 if name == "INCRBY" else -1))
+        if name in ("EXPIRE", "PEXPIRE"):
+            return self._expire(args[0], int(args[1]) / (1 if name == "EXPIRE" else 1000))
+        if name == "PTTL":
+            entry = self._entry(args[0])
+            if entry is None:
+                return -2
+            return -1 if entry[1] is None else int((entry[1] - time.monotonic()) * 1000)
+        if name == "FLUSHALL":
+            self.data.clear()
+            return True
+        return RespError(f"ERR unknown command '{name}'")
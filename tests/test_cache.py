@@ -0,0 +1,56 @@
+import httpx
+
+from pyltover import Pyltover
+from pyltover.cache import MemoryCache, ResponseCache
+
+
+class _CountingHandler:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if "/summoners/" in request.url.path:
+            return httpx.Response(
+                200, json={"profileIconId": 1, "revisionDate": 2, "summonerLevel": 30, "puuid": "some-puuid"}
+            )
+        return httpx.Response(200, json={"freeChampionIds": [1], "freeChampionIdsForNewPlayers": [2]})
+
+
+async def test_cached_endpoints_are_served_from_cache():
+    handler = _CountingHandler()
+    cache = ResponseCache(ttls={"v3.get_champion_rotaions": 0})
+    async with Pyltover("token", transport=httpx.MockTransport(handler), cache=cache) as pyltover:
+        first = await pyltover.euw1.v4.get_summoner_by_puuid("some-puuid")
+        second = await pyltover.euw1.v4.get_summoner_by_puuid("some-puuid")
+        await pyltover.euw1.v3.get_champion_rotaions()
+        await pyltover.euw1.v3.get_champion_rotaions()
+
+    assert first == second
+    assert handler.calls == 3
+    assert cache.stats["v4.get_summoner_by_puuid"].hits == 1
+    assert cache.stats["v4.get_summoner_by_puuid"].misses == 1
+    assert "v3.get_champion_rotaions" not in cache.stats
+
+
+async def test_memory_cache_evicts_least_recently_used_entries():
+    cache = MemoryCache(max_entries=2, max_bytes=10)
+    await cache.set("a", b"1234", 60)
+    await cache.set("b", b"1234", 60)
+    assert await cache.get("a") == b"1234"
+
+    await cache.set("c", b"1234", 60)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1234"
+    assert cache.evictions == 1
+
+    await cache.set("d", b"12345678", 60)
+    assert len(cache) == 1
+    assert cache.size == 8
+
+
+async def test_memory_cache_expires_entries():
+    cache = MemoryCache()
+    await cache.set("a", b"1234", 0)
+    assert await cache.get("a") is None
+    assert cache.size == 0
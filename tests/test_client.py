@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from pyltover import Pyltover
+
+
+def _summoner_handler(request: httpx.Request) -> httpx.Response:
+    assert request.headers["X-Riot-Token"] == "token"
+    return httpx.Response(
+        200,
+        json={"profileIconId": 1, "revisionDate": 2, "summonerLevel": 30, "puuid": "some-puuid"},
+    )
+
+
+async def test_servers_share_the_root_connection_pool():
+    pyltover = Pyltover("token", transport=httpx.MockTransport(_summoner_handler))
+
+    assert pyltover.euw1.v4.async_client is pyltover.async_client
+    assert pyltover.europe.v1.async_client is pyltover.async_client
+    assert pyltover.na1.v5.rate_limiter is pyltover.rate_limiter
+
+    summoner = await pyltover.euw1.v4.get_summoner_by_puuid("some-puuid")
+    assert summoner.summoner_level == 30
+
+    await pyltover.aclose()
+    assert pyltover.async_client.is_closed
+
+
+async def test_async_context_manager_closes_owned_client_only():
+    async with Pyltover("token", transport=httpx.MockTransport(_summoner_handler)) as pyltover:
+        await pyltover.euw1.v4.get_summoner_by_puuid("some-puuid")
+    assert pyltover.async_client.is_closed
+
+    async_client = httpx.AsyncClient(transport=httpx.MockTransport(_summoner_handler))
+    async with Pyltover("token", async_client=async_client):
+        pass
+    assert not async_client.is_closed
+    await async_client.aclose()
+
+
+def test_pool_options_are_not_ignored_with_a_transport():
+    transport = httpx.MockTransport(_summoner_handler)
+    with pytest.raises(ValueError):
+        Pyltover("token", transport=transport, http2=True)
+    with pytest.raises(ValueError):
+        Pyltover("token", transport=transport, limits=httpx.Limits(max_connections=10))
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from pyltover.concurrency import bounded_map
+
+
+async def test_bounded_map_limits_calls_in_flight():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def func(item):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001 * (10 - item))
+        in_flight -= 1
+        return item * 2
+
+    results = [result async for result in bounded_map(func, range(10), concurrency=3)]
+
+    assert max_in_flight == 3
+    assert sorted(results) == [(item, item * 2) for item in range(10)]
+
+
+async def test_bounded_map_keeps_order_when_asked():
+    async def func(item):
+        await asyncio.sleep(0.001 * (5 - item))
+        return item
+
+    results = [item async for item, _ in bounded_map(func, range(5), concurrency=5, ordered=True)]
+
+    assert results == list(range(5))
+
+
+async def test_bounded_map_raises_or_returns_exceptions():
+    async def func(item):
+        if item == 1:
+            raise ValueError(item)
+        return item
+
+    results = dict([result async for result in bounded_map(func, range(3), concurrency=2, return_exceptions=True)])
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+
+    with pytest.raises(ValueError):
+        async for _ in bounded_map(func, range(3), concurrency=2):
+            pass
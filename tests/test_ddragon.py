@@ -0,0 +1,158 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from pyltover.base import BasePyltover
+from pyltover.schema import ChampionWithDetails
+
+
+def _image(name):
+    return {"full": f"{name}.png", "sprite": "champion0.png", "group": "champion", "x": 0, "y": 0, "w": 48, "h": 48}
+
+
+def _champion(champion_id, key, name):
+    return {
+        "id": champion_id,
+        "key": str(key),
+        "name": name,
+        "title": "the test",
+        "blurb": "",
+        "lore": "",
+        "allytips": [],
+        "enemytips": [],
+        "info": {"attack": 1, "defense": 2, "magic": 3, "difficulty": 4},
+        "image": _image(champion_id),
+        "skins": [{"id": key * 1000, "num": 0, "name": "default", "chromas": False}],
+        "tags": ["Fighter"],
+        "partype": "Mana",
+        "stats": {
+            name: 1
+            for name in (
+                "hp hpperlevel mp mpperlevel movespeed armor armorperlevel spellblock spellblockperlevel attackrange "
+                "hpregen hpregenperlevel mpregen mpregenperlevel crit critperlevel attackdamage attackdamageperlevel "
+                "attackspeedperlevel attackspeed"
+            ).split()
+        },
+        "spells": [],
+        "passive": {},
+        "recommended": [],
+    }
+
+
+CHAMPION_FULL = orjson.dumps(
+    {
+        "type": "champion",
+        "format": "full",
+        "version": "15.15.1",
+        "data": {"Annie": _champion("Annie", 1, "Annie"), "MonkeyKing": _champion("MonkeyKing", 62, "Wukong")},
+        "keys": {"1": "Annie", "62": "MonkeyKing"},
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_ddragon_data(monkeypatch):
+    monkeypatch.setattr(BasePyltover, "champions_db", BasePyltover.champions_db)
+    monkeypatch.setattr(BasePyltover, "champion_details_db", BasePyltover.champion_details_db)
+    monkeypatch.setattr(BasePyltover, "ddragon_version", BasePyltover.ddragon_version)
+    monkeypatch.setattr(BasePyltover, "_latest_ddragon_version", (0.0, None))
+
+
+async def test_preload_champion_details_uses_versioned_disk_cache(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, content=CHAMPION_FULL)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+        await BasePyltover.preload_champion_details(tmp_path, async_client=async_client)
+        assert requests == [f"/cdn/{BasePyltover.ddragon_version}/data/en_US/championFull.json"]
+        assert (tmp_path / f"championFull-{BasePyltover.ddragon_version}.json").read_bytes() == CHAMPION_FULL
+
+        BasePyltover.champion_details_db = {"by_id": {}, "by_name": {}}
+        await BasePyltover.preload_champion_details(tmp_path, async_client=async_client)
+        assert len(requests) == 1
+
+    wukong = BasePyltover.champion_details_db["by_id"][62]
+    assert isinstance(wukong, ChampionWithDetails)
+    assert BasePyltover.champion_details_db["by_name"]["MonkeyKing"] is wukong
+    assert BasePyltover.champions_db.get_champion_by_id(62).name == "Wukong"
+    async with BasePyltover("token") as pyltover:
+        assert await pyltover.get_champion_details(1) is BasePyltover.champion_details_db["by_id"][1]
+
+
+async def test_preload_champion_details_replaces_invalid_cache(tmp_path):
+    (tmp_path / f"championFull-{BasePyltover.ddragon_version}.json").write_bytes(b"{truncated")
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, content=CHAMPION_FULL))
+
+    async with httpx.AsyncClient(transport=transport) as async_client:
+        await BasePyltover.preload_champion_details(tmp_path, async_client=async_client)
+
+    assert BasePyltover.champions_db.get_champion_by_name("Annie").name == "Annie"
+    assert (tmp_path / f"championFull-{BasePyltover.ddragon_version}.json").read_bytes() == CHAMPION_FULL
+
+
+class _PatchHandler:
+    def __init__(self, versions):
+        self.versions = versions
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        if request.url.path == "/api/versions.json":
+            return httpx.Response(200, json=self.versions)
+        if request.url.path.endswith("championFull.json"):
+            return httpx.Response(200, content=CHAMPION_FULL)
+        return httpx.Response(
+            200,
+            json={
+                "type": "champion",
+                "format": "standAloneComplex",
+                "version": self.versions[0],
+                "data": {"Annie": _champion("Annie", 1, "Annie")},
+            },
+        )
+
+
+async def test_refresh_ddragon_swaps_in_new_patch():
+    handler = _PatchHandler(["99.1.1", "15.15.1"])
+    old_champions_db = BasePyltover.champions_db
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+        assert await BasePyltover.refresh_ddragon(async_client=async_client)
+        assert handler.requests == ["/api/versions.json", "/cdn/99.1.1/data/en_US/champion.json"]
+        assert BasePyltover.ddragon_version == "99.1.1"
+        assert BasePyltover.champions_db is not old_champions_db
+        assert BasePyltover.champions_db.get_champion_by_id(1).name == "Annie"
+
+        # versions.json is not asked again while its answer is fresh, and an unchanged patch loads nothing.
+        assert not await BasePyltover.refresh_ddragon(async_client=async_client)
+        assert len(handler.requests) == 2
+
+
+async def test_refresh_ddragon_with_details(tmp_path):
+    handler = _PatchHandler(["99.1.1"])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+        assert await BasePyltover.refresh_ddragon(details=True, cache_dir=tmp_path, async_client=async_client)
+
+    assert handler.requests[-1] == "/cdn/99.1.1/data/en_US/championFull.json"
+    assert (tmp_path / "championFull-99.1.1.json").exists()
+    assert BasePyltover.champion_details_db["by_name"]["MonkeyKing"].name == "Wukong"
+
+
+async def test_start_ddragon_refresh_runs_in_background(monkeypatch):
+    async def refresh_ddragon(**kwargs):
+        refreshed.set()
+        raise httpx.ConnectError("offline")
+
+    refreshed = asyncio.Event()
+    monkeypatch.setattr(BasePyltover, "refresh_ddragon", refresh_ddragon)
+    task = BasePyltover.start_ddragon_refresh(interval=60)
+    await asyncio.wait_for(refreshed.wait(), 1)
+
+    assert not task.done()
+    task.cancel()
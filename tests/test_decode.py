@@ -0,0 +1,30 @@
+import orjson
+
+from pyltover.apis.v4.schema import ChampionMastery
+from pyltover.apis.v5 import schema
+from pyltover.decode import TrustedView, trusted_view
+
+
+def test_trusted_match_reads_like_validated_match(match_json):
+    match = schema.Match.model_validate_json(match_json)
+    trusted_match = trusted_view(schema.Match, orjson.loads(match_json))
+
+    assert isinstance(trusted_match, TrustedView)
+    assert trusted_match.metadata.match_id == match.metadata.match_id
+    assert trusted_match.info.participants[3].kills == match.info.participants[3].kills
+    assert trusted_match.info.participants[0].challenges.kda == match.info.participants[0].challenges.kda
+    assert trusted_match.info.teams[1].objectives.baron.kills == match.info.teams[1].objectives.baron.kills
+    assert trusted_match.to_model() == match
+
+
+def test_trusted_view_skips_validation():
+    mastery = {"puuid": "puuid", "championId": "not an int", "nextSeasonMilestone": {"bonus": False}}
+    (trusted_mastery,) = trusted_view(list[ChampionMastery], [mastery])
+
+    assert trusted_mastery.champion_id == "not an int"
+    assert isinstance(trusted_mastery.next_season_milestone, TrustedView)
+    assert trusted_mastery.champion is None
+
+    trusted_mastery.set_champion_info("champion")
+    assert trusted_mastery.champion == "champion"
+    assert repr(trusted_mastery) == "TrustedChampionMastery(<3 of 14 fields read>)"
@@ -0,0 +1,148 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.cache import ResponseCache
+from pyltover.distributed import DistributedRateLimiter, DistributedSingleFlight, RedisCache, RedisRateLimitBackend
+from pyltover.redis_protocol import RespClient, RespError
+
+from tests.redis_server import RedisServer
+
+
+SERVER = "euw1.api.riotgames.com"
+METHOD = "v4.get_summoner_by_puuid"
+SUMMONER = {"profileIconId": 29, "revisionDate": 1, "summonerLevel": 420, "puuid": "puuid"}
+
+
+@pytest.fixture
+async def client():
+    async with RedisServer() as server:
+        client = RespClient(server.host, server.port)
+        yield client
+        await client.aclose()
+
+
+async def test_redis_server_commands(client):
+    assert await client.execute("PING") == "PONG"
+    assert await client.execute("GET", "missing") is None
+    assert await client.execute("SET", "key", b"\x00value") == "OK"
+    assert await client.execute("SET", "key", "other", "NX") is None
+    assert await client.execute("GET", "key") == b"\x00value"
+    assert await client.pipeline(("INCR", "counter"), ("INCRBY", "counter", 5), ("DECR", "counter")) == [1, 6, 5]
+    assert await client.execute("PTTL", "counter") == -1
+    assert await client.execute("PEXPIRE", "counter", 10_000) == 1
+    assert 9_000 < await client.execute("PTTL", "counter") <= 10_000
+    assert await client.execute("DEL", "key", "counter", "missing") == 2
+    assert await client.execute("PTTL", "key") == -2
+
+    await client.execute("SET", "short", 1, "PX", 1)
+    await asyncio.sleep(0.01)
+    assert await client.execute("GET", "short") is None
+
+    await client.execute("SET", "text", "a")
+    with pytest.raises(RespError):
+        await client.execute("INCR", "text")
+    with pytest.raises(RespError):
+        await client.execute("NOPE")
+
+
+async def test_redis_rate_limit_backend_never_overcounts(client):
+    backend = RedisRateLimitBackend(client)
+    windows = [(SERVER, 3, 10), (f"{SERVER}/{METHOD}", 100, 10)]
+
+    waits = await asyncio.gather(*(backend.consume(windows, [SERVER]) for _ in range(5)))
+    assert sorted(wait > 0 for wait in waits) == [False, False, False, True, True]
+    assert await client.execute("GET", f"pyltover:window:{SERVER}:10") == b"3"
+    assert await client.execute("GET", f"pyltover:window:{SERVER}/{METHOD}:10") == b"3"
+
+    await backend.sync(f"{SERVER}/{METHOD}", 10, 50)
+    assert await client.execute("GET", f"pyltover:window:{SERVER}/{METHOD}:10") == b"50"
+
+    await backend.block(f"{SERVER}/{METHOD}", 2)
+    assert 1 < await backend.consume([], [SERVER, f"{SERVER}/{METHOD}"]) <= 2
+
+
+async def test_distributed_limiters_share_windows(client):
+    first = DistributedRateLimiter(RedisRateLimitBackend(client))
+    second = DistributedRateLimiter(RedisRateLimitBackend(client))
+    for limiter in (first, second):
+        await limiter.acquire(SERVER, METHOD)
+        limiter.update(SERVER, METHOD, {"X-App-Rate-Limit": "2:10"})
+
+    for _ in range(2):
+        await first.acquire(SERVER, METHOD)
+        first.update(SERVER, METHOD, {"X-App-Rate-Limit": "2:10"})
+    # The second node sent nothing since learning the limits, but the first one used them up.
+    assert second.headroom(SERVER, METHOD) == 1.0
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(second.acquire(SERVER, METHOD), 0.2)
+
+    second.block(SERVER, METHOD, "application", 30)
+    await second._flush()
+    assert await client.execute("PTTL", f"pyltover:block:{SERVER}") > 29_000
+
+
+async def test_nodes_share_cache_and_flights(client):
+    requests = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests[request.url.path] += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=SUMMONER)
+
+    def node():
+        return Pyltover(
+            "token",
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(RedisCache(client)),
+            single_flight=DistributedSingleFlight(client, poll_interval=0.01),
+        )
+
+    async with node() as first, node() as second:
+        summoners = await asyncio.gather(
+            first.euw1.v4.get_summoner_by_puuid("puuid"),
+            second.euw1.v4.get_summoner_by_puuid("puuid"),
+            second.euw1.v4.get_summoner_by_puuid("puuid"),
+        )
+
+    assert [summoner.summoner_level for summoner in summoners] == [420, 420, 420]
+    assert requests == {"/lol/summoner/v4/summoners/by-puuid/puuid": 1}
+    assert (
+        await client.execute(
+            "GET", "pyltover:flight:GET:https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/puuid"
+        )
+        is None
+    )
+
+
+async def test_uncached_requests_are_not_serialized_across_nodes(client):
+    in_flight = []
+    concurrent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight.append(request)
+        concurrent.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.remove(request)
+        return httpx.Response(200, json=SUMMONER)
+
+    def node():
+        return Pyltover(
+            "token",
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(RedisCache(client), ttls={"v4.get_summoner_by_puuid": 0}),
+            single_flight=DistributedSingleFlight(client, poll_interval=0.01),
+        )
+
+    async with node() as first, node() as second:
+        await asyncio.gather(
+            first.euw1.v4.get_summoner_by_puuid("puuid"),
+            second.euw1.v4.get_summoner_by_puuid("puuid"),
+            second.euw1.v4.get_summoner_by_puuid("puuid"),
+        )
+
+    # Each node sends the request once, without waiting for the other one.
+    assert concurrent == [1, 2]
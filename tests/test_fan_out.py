@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.errors import RiotAPIError
+from pyltover.apis.schema import QueueTypes
+from pyltover.apis.v4.schema import League
+from pyltover.servers import PlatformRoutingValues, RegionalRoutingValues
+
+from benchmarks.mock_riot import MockRiot
+
+
+ROTATION = {"freeChampionIds": [1, 2, 3], "freeChampionIdsForNewPlayers": [4, 5], "maxNewPlayerLevel": 10}
+
+
+async def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == PlatformRoutingValues.KR:
+        await asyncio.sleep(0.05)
+    if request.url.host == PlatformRoutingValues.RU:
+        return httpx.Response(403, json={"status": {"message": "Forbidden", "status_code": 403}})
+    headers = {"X-App-Rate-Limit": "1:10", "X-App-Rate-Limit-Count": "1:10"}
+    return httpx.Response(200, json=ROTATION, headers=headers)
+
+
+def test_server_by_routing_value():
+    pyltover = Pyltover("token")
+    assert pyltover.server(PlatformRoutingValues.EUW1) is pyltover.euw1
+    assert pyltover.server("europe.api.riotgames.com") is pyltover.europe
+    assert pyltover.server("esports.api.riotgames.com") is pyltover.esport
+    with pytest.raises(ValueError):
+        pyltover.server("example.com")
+
+
+async def test_fan_out_across_every_platform():
+    async with Pyltover("token", transport=httpx.MockTransport(_handler)) as pyltover:
+        # Every platform has its own budget, the 1 request per 10 seconds of one host doesn't hold back the others.
+        rotations = await asyncio.wait_for(
+            pyltover.fan_out(lambda server: server.v3.get_champion_rotaions()),
+            1,
+        )
+
+    assert list(rotations) == list(PlatformRoutingValues)
+    assert isinstance(rotations[PlatformRoutingValues.RU], RiotAPIError)
+    assert rotations[PlatformRoutingValues.KR].free_champion_ids == [1, 2, 3]
+    assert sum(isinstance(rotation, RiotAPIError) for rotation in rotations.values()) == 1
+
+
+async def test_fan_out_as_completed():
+    regions = [RegionalRoutingValues.EUROPE, PlatformRoutingValues.KR, PlatformRoutingValues.EUW1]
+    async with Pyltover("token", transport=httpx.MockTransport(_handler)) as pyltover:
+        completed = [
+            server_addr
+            async for server_addr, _ in pyltover.fan_out_as_completed(
+                lambda server: server.v3.get_champion_rotaions(), regions
+            )
+        ]
+        assert completed[-1] == PlatformRoutingValues.KR
+        assert sorted(completed) == sorted(regions)
+
+        with pytest.raises(RiotAPIError):
+            await pyltover.fan_out(
+                lambda server: server.v3.get_champion_rotaions(),
+                [PlatformRoutingValues.RU, PlatformRoutingValues.EUW1],
+                return_exceptions=False,
+            )
+
+
+async def test_fan_out_challenger_leagues():
+    async with Pyltover("token", transport=MockRiot().transport()) as pyltover:
+        leagues = await pyltover.fan_out(
+            lambda server: server.v4.get_the_challenger_league_for_queue(QueueTypes.RANKED_SOLO_5x5)
+        )
+
+    assert len(leagues) == len(PlatformRoutingValues)
+    assert all(isinstance(league, League) for league in leagues.values())
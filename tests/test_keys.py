@@ -0,0 +1,93 @@
+from collections import Counter
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.errors import RiotAPIError
+from pyltover.keys import KeyPool, NoApiKeyError
+
+
+SUMMONER = {"profileIconId": 29, "revisionDate": 1, "summonerLevel": 420, "puuid": "puuid"}
+
+
+class _Riot:
+    def __init__(self, rejected=(), limit=10, forbidden_paths=()):
+        self.rejected = set(rejected)
+        self.forbidden_paths = tuple(forbidden_paths)
+        self.limit = limit
+        self.requests = Counter()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        token = request.headers["X-Riot-Token"]
+        self.requests[token] += 1
+        if token in self.rejected:
+            return httpx.Response(403, json={"status": {"message": "Forbidden", "status_code": 403}})
+        if request.url.path.startswith(self.forbidden_paths):
+            return httpx.Response(403, json={"status": {"message": "Forbidden", "status_code": 403}})
+        headers = {
+            "X-App-Rate-Limit": f"{self.limit}:10",
+            "X-App-Rate-Limit-Count": f"{self.requests[token]}:10",
+        }
+        return httpx.Response(200, json=SUMMONER, headers=headers)
+
+
+async def test_key_pool_spreads_requests_by_headroom():
+    riot = _Riot()
+    pool = KeyPool(["first", "second", "third"])
+    async with Pyltover(pool, transport=httpx.MockTransport(riot.handler)) as pyltover:
+        for index in range(9):
+            await pyltover.euw1.v4.get_summoner_by_puuid(f"puuid-{index}")
+
+    assert riot.requests == {"first": 3, "second": 3, "third": 3}
+    assert pool.keys[0].rate_limiter.headroom("euw1.api.riotgames.com", "v4.get_summoner_by_puuid") == 0.7
+
+
+async def test_key_pool_avoids_refused_keys():
+    riot = _Riot(rejected={"revoked"}, limit=100)
+    pool = KeyPool(["revoked", "valid"])
+    async with Pyltover(pool, transport=httpx.MockTransport(riot.handler)) as pyltover:
+        with pytest.raises(RiotAPIError):
+            await pyltover.euw1.v4.get_total_champion_mastery_score("puuid")
+        for _ in range(19):
+            await pyltover.euw1.v4.get_total_champion_mastery_score("puuid")
+
+    assert riot.requests == {"revoked": 1, "valid": 19}
+
+
+async def test_key_pool_drops_keys_refused_in_a_row():
+    riot = _Riot(rejected={"revoked"})
+    pool = KeyPool(["revoked", "valid"], max_refusals=1)
+    async with Pyltover(pool, transport=httpx.MockTransport(riot.handler)) as pyltover:
+        summoner = await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+        assert summoner.summoner_level == 420
+
+    assert riot.requests == {"revoked": 1, "valid": 1}
+    assert [key.token for key in pool.active_keys()] == ["valid"]
+
+
+async def test_key_pool_without_keys_left():
+    riot = _Riot(rejected={"revoked"})
+    async with Pyltover(KeyPool(["revoked"]), transport=httpx.MockTransport(riot.handler)) as pyltover:
+        for _ in range(3):
+            with pytest.raises(RiotAPIError):
+                await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+        with pytest.raises(NoApiKeyError):
+            await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+
+    with pytest.raises(ValueError):
+        KeyPool([])
+
+
+async def test_key_pool_keeps_keys_refused_by_one_endpoint():
+    riot = _Riot(forbidden_paths=["/riot/account/v1/accounts/me"])
+    pool = KeyPool(["first", "second"])
+    async with Pyltover(pool, transport=httpx.MockTransport(riot.handler)) as pyltover:
+        with pytest.raises(RiotAPIError) as error:
+            await pyltover.europe.v1.get_account_by_access_token()
+        assert error.value.error_status.status_code == 403
+        summoner = await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+        assert summoner.summoner_level == 420
+
+    assert sum(riot.requests.values()) == 2
+    assert len(pool) == 2
@@ -0,0 +1,25 @@
+from pyltover.apis.v5 import schema
+from pyltover.lazy import LazyModel
+
+
+def test_lazy_match_matches_validated_match(match_json):
+    match = schema.Match.model_validate_json(match_json)
+    lazy_match = LazyModel(schema.Match, match_json)
+
+    assert lazy_match.metadata.match_id == match.metadata.match_id
+    assert lazy_match.info.game_duration == match.info.game_duration
+    assert len(lazy_match.info.participants) == 10
+    assert lazy_match.info.participants[3].kills == match.info.participants[3].kills
+    assert lazy_match.info.teams[1].objectives.baron == match.info.teams[1].objectives.baron
+    assert lazy_match.to_model() == match
+
+
+def test_lazy_match_validates_leaf_models_on_first_access(match_json):
+    lazy_match = LazyModel(schema.Match, match_json)
+    participant = lazy_match.info.participants[0]
+
+    challenges = participant.challenges
+    assert isinstance(challenges, schema.Challenges)
+    assert participant.challenges is challenges
+    assert lazy_match.info.participants[0] is participant
+    assert "1 of" in repr(lazy_match)
@@ -0,0 +1,90 @@
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.errors import RiotAPIError
+from pyltover.metrics import Histogram, Metrics
+
+from benchmarks.mock_riot import MockRiot
+
+
+SUMMONER = {"profileIconId": 1, "revisionDate": 2, "summonerLevel": 30, "puuid": "some-puuid"}
+RATE_LIMIT_HEADERS = {
+    "X-App-Rate-Limit": "20:1,100:120",
+    "X-App-Rate-Limit-Count": "1:1,7:120",
+    "X-Method-Rate-Limit": "1600:60",
+    "X-Method-Rate-Limit-Count": "3:60",
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("unknown"):
+        return httpx.Response(404, json={"status": {"message": "Data not found", "status_code": 404}})
+    if request.url.path.endswith("offline"):
+        raise httpx.ConnectError("offline", request=request)
+    return httpx.Response(200, json=SUMMONER, headers=RATE_LIMIT_HEADERS)
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(3.65)
+
+
+async def test_metrics_per_endpoint():
+    metrics = Metrics()
+    async with Pyltover("token", transport=httpx.MockTransport(_handler), metrics=metrics) as pyltover:
+        summoners = pyltover.euw1.v4.with_options(max_retries=0)
+        await summoners.get_summoner_by_puuid("some-puuid")
+        await summoners.get_summoner_by_puuid("other-puuid")
+        with pytest.raises(RiotAPIError):
+            await summoners.get_summoner_by_puuid("unknown")
+        with pytest.raises(httpx.ConnectError):
+            await summoners.get_summoner_by_puuid("offline")
+
+    endpoint = metrics.endpoints["v4.get_summoner_by_puuid"]
+    assert endpoint.requests == 4
+    assert endpoint.status_codes == {200: 2, 404: 1}
+    assert endpoint.transport_errors == 1
+    assert endpoint.bytes_received > 0
+    assert endpoint.latency.count == 4
+    assert endpoint.decode.count == 2
+    assert endpoint.rate_limits[("euw1.api.riotgames.com", "application")] == {1: (1, 20), 120: (7, 100)}
+    assert endpoint.rate_limits[("euw1.api.riotgames.com", "method")] == {60: (3, 1600)}
+
+    text = metrics.render_prometheus()
+    assert "# TYPE pyltover_requests_total counter" in text
+    assert 'pyltover_requests_total{api="v4.get_summoner_by_puuid",status="404"} 1\n' in text
+    assert 'pyltover_request_duration_seconds_bucket{api="v4.get_summoner_by_puuid",le="+Inf"} 4\n' in text
+    assert 'pyltover_decode_duration_seconds_count{api="v4.get_summoner_by_puuid"} 2\n' in text
+    assert (
+        'pyltover_rate_limit_count{api="v4.get_summoner_by_puuid",server="euw1.api.riotgames.com",'
+        'scope="application",window="120"} 7\n'
+    ) in text
+
+
+async def test_metrics_time_the_decoding_of_plain_json_endpoints():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=["EUW1_1", "EUW1_2"] if "/match/" in request.url.path else 4200)
+
+    metrics = Metrics()
+    async with Pyltover("token", transport=httpx.MockTransport(handler), metrics=metrics) as pyltover:
+        assert await pyltover.europe.v5.get_list_of_match_ids_by_puuid("puuid") == ["EUW1_1", "EUW1_2"]
+        assert await pyltover.euw1.v4.get_total_champion_mastery_score("puuid") == 4200
+
+    assert metrics.endpoints["v5.get_list_of_match_ids_by_puuid"].decode.count == 1
+    assert metrics.endpoints["v4.get_total_champion_mastery_score"].decode.count == 1
+
+
+async def test_metrics_time_the_decoding_of_timelines_and_lazy_matches():
+    metrics = Metrics()
+    async with Pyltover("token", transport=MockRiot().transport(), metrics=metrics) as pyltover:
+        await pyltover.europe.v5.get_match_timeline_by_id("EUW1_1")
+        await pyltover.europe.v5.get_match_by_id("EUW1_1", lazy=True)
+
+    assert metrics.endpoints["v5.get_match_timeline_by_id"].decode.count == 1
+    assert metrics.endpoints["v5.get_match_by_id"].decode.count == 1
@@ -0,0 +1,28 @@
+import re
+
+import httpx
+
+from pyltover.apis.v1 import urls as v1_urls
+from pyltover.apis.v3 import urls as v3_urls
+from pyltover.apis.v4 import urls as v4_urls
+from pyltover.apis.v5 import urls as v5_urls
+
+from benchmarks.mock_riot import ROUTES, MockRiot
+
+
+def _endpoint_urls():
+    for module in (v1_urls, v3_urls, v4_urls, v5_urls):
+        for name, template in vars(module).items():
+            if isinstance(template, str) and template.startswith("https://"):
+                yield name, re.sub(r"\{(\w+)\}", r"\1", template).replace("server_addr", "euw1.api.riotgames.com")
+
+
+async def test_mock_riot_serves_every_endpoint():
+    riot = MockRiot()
+    async with httpx.AsyncClient(transport=riot.transport()) as client:
+        for name, url in _endpoint_urls():
+            resp = await client.get(url)
+            assert resp.status_code == 200, name
+            assert resp.headers["X-App-Rate-Limit"]
+    # Every route answered at least one endpoint, e.g. timelines are not served the match.
+    assert len(riot.requests) == len(ROUTES)
@@ -0,0 +1,38 @@
+import pytest
+from pydantic import BaseModel
+
+from pyltover.apis.v5 import schema
+from pyltover.projection import projected_model
+
+
+def test_projected_match_only_keeps_requested_fields(match_json):
+    match = schema.Match.model_validate_json(match_json)
+    projection = projected_model(
+        schema.Match, ["metadata.match_id", "info.participants.champion_id", "info.participants.challenges.kda"]
+    )
+    projected = projection.model_validate_json(match_json)
+
+    assert set(projection.model_fields) == {"metadata", "info"}
+    assert set(type(projected.metadata).model_fields) == {"match_id"}
+    assert set(type(projected.info.participants[0]).model_fields) == {"champion_id", "challenges"}
+    assert projected.metadata.match_id == match.metadata.match_id
+    assert [participant.champion_id for participant in projected.info.participants] == [
+        participant.champion_id for participant in match.info.participants
+    ]
+    assert projected.info.participants[4].challenges.kda == match.info.participants[4].challenges.kda
+
+
+def test_projection_keeps_whole_models_and_is_cached(match_json):
+    projection = projected_model(schema.Match, ["info.teams", "info.teams.objectives.baron"])
+
+    assert projection is projected_model(schema.Match, ["info.teams"])
+    assert issubclass(projection.model_fields["info"].annotation, BaseModel)
+    teams = projection.model_validate_json(match_json).info.teams
+    assert isinstance(teams[0], schema.MatchTeam)
+
+
+def test_projection_rejects_unknown_paths():
+    with pytest.raises(ValueError, match="info.participants.nope"):
+        projected_model(schema.Match, ["info.participants.nope"])
+    with pytest.raises(ValueError, match="metadata.match_id.length"):
+        projected_model(schema.Match, ["metadata.match_id.length"])
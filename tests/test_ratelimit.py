@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from pyltover import ratelimit
+from pyltover.ratelimit import RateLimiter, parse_rate_limit_header
+
+
+_sleep = asyncio.sleep
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await _sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def _headers(app="20:1,100:120", app_count="1:1,1:120", method="2000:10", method_count="1:10"):
+    return {
+        "X-App-Rate-Limit": app,
+        "X-App-Rate-Limit-Count": app_count,
+        "X-Method-Rate-Limit": method,
+        "X-Method-Rate-Limit-Count": method_count,
+    }
+
+
+def test_parse_rate_limit_header():
+    assert parse_rate_limit_header("20:1,100:120") == {1: 20, 120: 100}
+    assert parse_rate_limit_header("") == {}
+    assert parse_rate_limit_header(None) == {}
+
+
+async def test_rate_limiter_waits_for_app_window(clock):
+    limiter = RateLimiter(padding=0)
+    await limiter.acquire("euw1.api.riotgames.com", "v4.get_summoner_by_puuid")
+    limiter.update("euw1.api.riotgames.com", "v4.get_summoner_by_puuid", _headers(app="2:1", app_count="1:1"))
+
+    await limiter.acquire("euw1.api.riotgames.com", "v4.get_summoner_by_puuid")
+    assert clock.sleeps == []
+
+    await limiter.acquire("euw1.api.riotgames.com", "v4.get_summoner_by_puuid")
+    assert clock.sleeps == [1]
+
+
+async def test_rate_limiter_keeps_separate_buckets_per_server_and_method(clock):
+    limiter = RateLimiter(padding=0)
+    for server_addr in ("euw1.api.riotgames.com", "na1.api.riotgames.com"):
+        for method in ("v4.get_summoner_by_puuid", "v5.get_match_by_id"):
+            await limiter.acquire(server_addr, method)
+            limiter.update(server_addr, method, _headers(method="1:10", method_count="1:10"))
+
+    app_bucket = limiter.app_buckets["euw1.api.riotgames.com"]
+    assert app_bucket.windows[1].count == 2
+    assert limiter.method_buckets[("euw1.api.riotgames.com", "v5.get_match_by_id")].windows[10].count == 1
+
+    await limiter.acquire("euw1.api.riotgames.com", "v5.get_match_by_id")
+    assert clock.sleeps == [10]
+
+
+async def test_rate_limiter_probes_unknown_limits_one_request_at_a_time(clock):
+    limiter = RateLimiter(padding=0)
+    await limiter.acquire("euw1.api.riotgames.com", "v5.get_match_by_id")
+
+    second = asyncio.create_task(limiter.acquire("euw1.api.riotgames.com", "v5.get_match_by_id"))
+    await _sleep(0)
+    assert not second.done()
+
+    limiter.update("euw1.api.riotgames.com", "v5.get_match_by_id", _headers())
+    await second
+    assert limiter.app_buckets["euw1.api.riotgames.com"].windows[1].count == 2
+
+
+async def test_rate_limiter_headroom(clock):
+    limiter = RateLimiter(padding=0)
+    assert limiter.headroom("euw1.api.riotgames.com", "v4.get_summoner_by_puuid") == 1.0
+
+    await limiter.acquire("euw1.api.riotgames.com", "v4.get_summoner_by_puuid")
+    assert limiter.headroom("euw1.api.riotgames.com", "v4.get_summoner_by_puuid") == 0.0  # probing
+
+    limiter.update("euw1.api.riotgames.com", "v4.get_summoner_by_puuid", _headers(app="4:1", app_count="3:1"))
+    assert limiter.headroom("euw1.api.riotgames.com", "v4.get_summoner_by_puuid") == 0.25
+
+    limiter.block("euw1.api.riotgames.com", "v4.get_summoner_by_puuid", "method", 5)
+    assert limiter.headroom("euw1.api.riotgames.com", "v4.get_summoner_by_puuid") == 0.0
+    assert limiter.wait_time("euw1.api.riotgames.com", "v4.get_summoner_by_puuid") == 5
@@ -0,0 +1,130 @@
+import gzip
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.errors import RiotAPIError
+from pyltover.replay import CassetteEntry, RecordingTransport, ReplayTransport, read_cassette
+from pyltover.retry import RetryPolicy
+
+
+SUMMONER = {"profileIconId": 29, "revisionDate": 1, "summonerLevel": 420, "puuid": "puuid"}
+RATE_LIMIT_HEADERS = {"X-App-Rate-Limit": "20:1,100:120", "X-App-Rate-Limit-Count": "1:1,1:120"}
+
+
+def _riot(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=SUMMONER, headers={**RATE_LIMIT_HEADERS, "Set-Cookie": "session=1"})
+
+
+async def _record(path):
+    async with Pyltover("secret-token", transport=RecordingTransport(path, httpx.MockTransport(_riot))) as pyltover:
+        summoner = await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+    return summoner
+
+
+async def test_recording_transport_writes_a_cassette(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    summoner = await _record(path)
+
+    assert summoner.summoner_level == 420
+    (entry,) = read_cassette(path)
+    assert entry.url == "https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/puuid"
+    assert entry.status_code == 200
+    assert entry.headers["X-App-Rate-Limit"] == "20:1,100:120"
+    assert "Set-Cookie" not in entry.headers
+    assert b"secret-token" not in path.read_bytes()
+
+
+async def test_replay_transport_serves_the_recorded_responses(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    await _record(path)
+
+    replay = ReplayTransport(path)
+    async with Pyltover("token", transport=replay) as pyltover:
+        summoner = await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+        again = await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+        with pytest.raises(RiotAPIError):
+            await pyltover.euw1.v4.get_summoner_by_puuid("unknown")
+
+    assert summoner.puuid == again.puuid == "puuid"
+    assert pyltover.rate_limiter._buckets("euw1.api.riotgames.com", "v4.get_summoner_by_puuid")[0].known
+    assert replay.misses == {"https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/unknown": 1}
+
+
+async def test_replay_transport_injects_errors(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    await _record(path)
+    url = "https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/puuid"
+
+    async with httpx.AsyncClient(transport=ReplayTransport(path, rate_limit_rate=1.0, retry_after=2)) as client:
+        resp = await client.get(url)
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+    assert resp.headers["X-Rate-Limit-Type"] == "application"
+
+    replay = ReplayTransport(path, server_error_rate=0.5, seed=1)
+    async with Pyltover("token", transport=replay, retry_policy=RetryPolicy(max_retries=0)) as pyltover:
+        outcomes = []
+        for _ in range(40):
+            try:
+                await pyltover.euw1.v4.get_summoner_by_puuid("puuid")
+                outcomes.append(200)
+            except RiotAPIError as error:
+                outcomes.append(error.error_status.status_code)
+    assert set(outcomes) == {200, 503}
+
+
+async def test_replay_transport_speed(tmp_path, monkeypatch):
+    path = tmp_path / "cassette.jsonl.gz"
+    await _record(path)
+    (entry,) = read_cassette(path)
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("pyltover.replay.asyncio.sleep", fake_sleep)
+    async with httpx.AsyncClient(transport=ReplayTransport(path, speed=2.0, latency=0.5)) as client:
+        await client.get(entry.url)
+    assert sleeps == [pytest.approx(0.5 + entry.elapsed / 2)]
+
+
+async def test_recording_survives_a_killed_process(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    async with httpx.AsyncClient(transport=RecordingTransport(path, httpx.MockTransport(_riot))) as client:
+        await client.get("https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/first")
+        await client.get("https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/second")
+
+        # The cassette is still open, and the process died in the middle of writing a third response.
+        path.write_bytes(path.read_bytes() + gzip.compress(b'{"offset": 1.0}\n')[:12])
+        assert [entry.url.rsplit("/", 1)[1] for entry in read_cassette(path)] == ["first", "second"]
+
+
+async def test_replay_transport_reproduces_the_recorded_pace(tmp_path, monkeypatch):
+    path = tmp_path / "cassette.jsonl.gz"
+    entries = [
+        CassetteEntry(
+            offset,
+            0.1,
+            "GET",
+            f"https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{name}",
+            200,
+            {},
+            b"{}",
+        )
+        for offset, name in ((0.0, "first"), (2.0, "second"))
+    ]
+    path.write_bytes(b"".join(gzip.compress(entry.to_json() + b"\n") for entry in entries))
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("pyltover.replay.asyncio.sleep", fake_sleep)
+    async with httpx.AsyncClient(transport=ReplayTransport(path, speed=2.0)) as client:
+        for entry in read_cassette(path):
+            await client.get(entry.url)
+    assert sleeps == [pytest.approx(0.05, abs=0.01), pytest.approx(1.05, abs=0.01)]
@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyltover import Pyltover, base
+from pyltover.apis.errors import RiotAPIError
+from pyltover.apis.v5 import Pyltover as V5Pyltover
+from pyltover.retry import RetryPolicy
+
+
+class _FakeAsyncClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def get(self, url, params=None):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _error(status_code, headers=None):
+    return httpx.Response(
+        status_code, headers=headers, json={"status": {"message": "error", "status_code": status_code}}
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        await sleep(0)
+
+    monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+    return sleeps
+
+
+async def test_retries_service_errors_with_backoff(sleeps):
+    client = _FakeAsyncClient([_error(503), _error(502), httpx.Response(200, json=["EUW1_1"])])
+    api = V5Pyltover("europe.api.riotgames.com", "token", async_client=client)
+
+    response = await api.get_list_of_match_ids_by_puuid("some-puuid")
+
+    assert response == ["EUW1_1"]
+    assert client.calls == 3
+    assert len(sleeps) == 2
+    assert all(0 <= delay <= RetryPolicy().backoff_cap for delay in sleeps)
+
+
+async def test_retries_application_rate_limit_after_retry_after():
+    client = _FakeAsyncClient(
+        [
+            _error(429, {"Retry-After": "0", "X-Rate-Limit-Type": "application"}),
+            httpx.Response(200, json=["EUW1_1"]),
+        ]
+    )
+    api = V5Pyltover("europe.api.riotgames.com", "token", async_client=client)
+
+    response = await api.get_list_of_match_ids_by_puuid("some-puuid")
+
+    assert response == ["EUW1_1"]
+    assert client.calls == 2
+
+
+async def test_retry_budget_per_call(sleeps):
+    client = _FakeAsyncClient([_error(500), _error(500), httpx.ConnectError("boom"), _error(500)])
+    api = V5Pyltover("europe.api.riotgames.com", "token", async_client=client)
+
+    with pytest.raises(RiotAPIError) as error:
+        await api.with_options(max_retries=3).get_list_of_match_ids_by_puuid("some-puuid")
+
+    assert error.value.error_status.status_code == 500
+    assert client.calls == 4
+    assert api.retry_policy.max_retries == RetryPolicy().max_retries
+
+
+async def test_does_not_retry_client_errors(sleeps):
+    client = _FakeAsyncClient([_error(404)])
+    api = V5Pyltover("europe.api.riotgames.com", "token", async_client=client)
+
+    with pytest.raises(RiotAPIError):
+        await api.get_list_of_match_ids_by_puuid("some-puuid")
+
+    assert client.calls == 1
+    assert sleeps == []
+
+
+async def test_options_of_servers_reach_their_api_versions(sleeps):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _error(503)
+
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        for api in (
+            pyltover.euw1.with_options(max_retries=0).v4,
+            pyltover.with_options(max_retries=0).euw1.v4,
+        ):
+            requests.clear()
+            with pytest.raises(RiotAPIError):
+                await api.get_summoner_by_puuid("puuid")
+            assert len(requests) == 1
+
+        assert pyltover.euw1.v4.retry_policy.max_retries == RetryPolicy().max_retries
@@ -0,0 +1,115 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.scheduler import PriorityScheduler
+
+
+SERVER = "euw1.api.riotgames.com"
+SUMMONER = {"profileIconId": 29, "revisionDate": 1, "summonerLevel": 420, "puuid": "puuid"}
+
+
+class _Gate:
+    """Limiter letting requests through one by one as the test releases them, recording their order."""
+
+    def __init__(self, method_waits=None):
+        self.method_waits = dict(method_waits or {})
+        self.slots = asyncio.Semaphore(0)
+        self.order = []
+
+    async def acquire(self, server_addr, method):
+        await self.slots.acquire()
+        self.order.append(method)
+
+    def method_wait_time(self, server_addr, method):
+        return self.method_waits.pop(method, 0.0)
+
+
+async def _queue(scheduler, gate, requests):
+    tasks = []
+    for method, priority in requests:
+        tasks.append(asyncio.create_task(scheduler.acquire(gate, SERVER, method, priority)))
+        await asyncio.sleep(0)
+    return tasks
+
+
+async def test_interactive_requests_jump_the_queue():
+    scheduler = PriorityScheduler()
+    gate = _Gate()
+    tasks = await _queue(scheduler, gate, [(f"match-{index}", "background") for index in range(5)])
+    tasks += await _queue(scheduler, gate, [("summoner", "interactive")])
+    assert scheduler.queued(SERVER) == 5
+
+    for _ in tasks:
+        gate.slots.release()
+    await asyncio.gather(*tasks)
+
+    assert gate.order == ["match-0", "summoner", "match-1", "match-2", "match-3", "match-4"]
+    assert scheduler.queued(SERVER) == 0
+
+
+async def test_background_requests_keep_their_share():
+    scheduler = PriorityScheduler({"interactive": 3, "background": 1}, default_priority="background")
+    gate = _Gate()
+    tasks = await _queue(scheduler, gate, [(f"background-{index}", "background") for index in range(8)])
+    tasks += await _queue(scheduler, gate, [(f"interactive-{index}", "interactive") for index in range(8)])
+
+    for _ in tasks:
+        gate.slots.release()
+    await asyncio.gather(*tasks)
+
+    assert len(gate.order) == 16
+    assert [method.split("-")[0] for method in gate.order[:8]].count("background") == 2
+
+
+async def test_requests_waiting_for_their_method_limit_give_their_turn_away():
+    scheduler = PriorityScheduler()
+    gate = _Gate(method_waits={"match": 0.1})
+    tasks = await _queue(scheduler, gate, [("match", "interactive"), ("summoner", "background")])
+
+    for _ in tasks:
+        gate.slots.release()
+    await asyncio.gather(*tasks)
+
+    assert gate.order == ["summoner", "match"]
+
+
+async def test_cancelled_requests_leave_the_queue():
+    scheduler = PriorityScheduler()
+    gate = _Gate()
+    first, second = await _queue(scheduler, gate, [("first", None), ("second", None)])
+    second.cancel()
+    gate.slots.release()
+    await first
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+    (third,) = await _queue(scheduler, gate, [("third", None)])
+    gate.slots.release()
+    await asyncio.wait_for(third, 1)
+    assert gate.order == ["first", "third"]
+
+
+async def test_pyltover_requests_with_a_priority():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=SUMMONER)
+
+    scheduler = PriorityScheduler()
+    async with Pyltover("token", transport=httpx.MockTransport(handler), scheduler=scheduler) as pyltover:
+        summoners = await asyncio.gather(
+            pyltover.euw1.v4.with_options(priority="interactive").get_summoner_by_puuid("puuid"),
+            pyltover.euw1.v4.with_options(priority="background").get_summoner_by_puuid("other"),
+            pyltover.euw1.v4.get_summoner_by_puuid("third"),
+        )
+        assert [summoner.summoner_level for summoner in summoners] == [420, 420, 420]
+
+        with pytest.raises(ValueError):
+            await pyltover.euw1.v4.with_options(priority="urgent").get_summoner_by_puuid("puuid")
+    assert scheduler.queued(SERVER) == 0
+
+
+def test_default_priority_needs_a_weight():
+    with pytest.raises(ValueError):
+        PriorityScheduler({"interactive": 2.0})
@@ -0,0 +1,77 @@
+import asyncio
+import multiprocessing
+import uuid
+
+import pytest
+
+from pyltover.keys import KeyPool
+from pyltover.shared_ratelimit import SharedMemoryRateLimiter
+from tests.test_ratelimit import _headers, clock  # noqa: F401
+
+
+SERVER = "euw1.api.riotgames.com"
+METHOD = "v4.get_summoner_by_puuid"
+
+
+@pytest.fixture
+def name():
+    name = f"pyltover-test-{uuid.uuid4().hex[:12]}"
+    yield name
+    limiter = SharedMemoryRateLimiter(name)
+    limiter.unlink()
+    limiter.close()
+
+
+async def test_shared_limiters_count_each_others_requests(clock, name):  # noqa: F811
+    first, second = SharedMemoryRateLimiter(name, padding=0), SharedMemoryRateLimiter(name, padding=0)
+
+    await first.acquire(SERVER, METHOD)
+    first.update(SERVER, METHOD, _headers(app="3:1", app_count="1:1"))
+    await second.acquire(SERVER, METHOD)
+    second.update(SERVER, METHOD, _headers(app="3:1", app_count="2:1"))
+
+    await first.acquire(SERVER, METHOD)
+    assert clock.sleeps == []
+    await second.acquire(SERVER, METHOD)
+    assert clock.sleeps == [1]
+
+    second.block(SERVER, METHOD, "application", 5)
+    assert first.wait_time(SERVER, METHOD) == 5
+    first.close()
+    second.close()
+
+
+def _worker(name: str, requests: int):
+    async def run():
+        limiter = SharedMemoryRateLimiter(name)
+        limiter.update(SERVER, METHOD, _headers(app="100000:600", app_count="", method="100000:600", method_count=""))
+        for _ in range(requests):
+            await limiter.acquire(SERVER, METHOD)
+            limiter.update(
+                SERVER, METHOD, _headers(app="100000:600", app_count="", method="100000:600", method_count="")
+            )
+        limiter.close()
+
+    asyncio.run(run())
+
+
+def test_shared_limiter_across_processes(name):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_worker, args=(name, 200)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    limiter = SharedMemoryRateLimiter(name)
+    limiter.update(SERVER, METHOD, _headers(app="100000:600", app_count="", method="100000:600", method_count=""))
+    assert limiter.app_buckets[SERVER].windows[600].count == 800
+    assert limiter.method_buckets[(SERVER, METHOD)].windows[600].count == 800
+    limiter.close()
+
+
+async def test_key_pool_with_shared_limiters(name):
+    pool = KeyPool(["key"], rate_limiter=lambda token: SharedMemoryRateLimiter(name))
+    assert isinstance(pool.keys[0].rate_limiter, SharedMemoryRateLimiter)
+    pool.keys[0].rate_limiter.close()
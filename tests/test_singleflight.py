@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.singleflight import SingleFlight
+
+
+class _SlowHandler:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200, json={"profileIconId": 1, "revisionDate": 2, "summonerLevel": 30, "puuid": request.url.path[-4:]}
+        )
+
+
+async def test_identical_concurrent_requests_are_coalesced():
+    handler = _SlowHandler()
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        summoners = await asyncio.gather(
+            *[pyltover.euw1.v4.get_summoner_by_puuid("aaaa") for _ in range(50)],
+            pyltover.euw1.v4.get_summoner_by_puuid("bbbb"),
+        )
+
+    assert handler.calls == 2
+    assert {summoner.puuid for summoner in summoners} == {"aaaa", "bbbb"}
+    assert len(pyltover.single_flight) == 0
+
+
+async def test_cancelled_caller_does_not_cancel_the_others():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.01)
+        return 42
+
+    first = asyncio.create_task(single_flight.do("key", call))
+    await started.wait()
+    second = asyncio.create_task(single_flight.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,39 @@
+import httpx
+
+from pyltover import Pyltover
+from pyltover.store import SQLiteMatchStore
+
+
+async def test_get_match_by_id_reads_through_the_store(tmp_path, match_json):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, content=match_json)
+
+    store = SQLiteMatchStore(tmp_path / "matches.sqlite3")
+    async with Pyltover("token", transport=httpx.MockTransport(handler), match_store=store) as pyltover:
+        match = await pyltover.europe.v5.get_match_by_id("EUW1_7000000001")
+        stored_match = await pyltover.europe.v5.get_match_by_id("EUW1_7000000001")
+
+    assert len(calls) == 1
+    assert stored_match == match
+    assert await store.get("EUW1_7000000001") == match_json
+
+    reopened_store = SQLiteMatchStore(tmp_path / "matches.sqlite3")
+    assert len(reopened_store) == 1
+    assert reopened_store.size == store.size
+
+
+async def test_store_evicts_oldest_matches_over_max_bytes(tmp_path):
+    store = SQLiteMatchStore(tmp_path / "matches.sqlite3", max_bytes=250, low_watermark=0.5, compress=False)
+    for index in range(3):
+        await store.set(f"EUW1_{index}", bytes(100))
+
+    assert await store.get("EUW1_0") is None
+    assert await store.get("EUW1_1") is None
+    assert await store.get("EUW1_2") == bytes(100)
+    assert store.size == 100
+
+    await store.compact()
+    assert len(store) == 1
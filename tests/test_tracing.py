@@ -0,0 +1,82 @@
+import logging
+
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.errors import RiotAPIError
+from pyltover.tracing import RequestTrace, SlowRequestLogger, Tracer
+
+
+SUMMONER = {"profileIconId": 1, "revisionDate": 2, "summonerLevel": 30, "puuid": "some-puuid"}
+
+
+class _CollectingTracer(Tracer):
+    def __init__(self, sample_rate=1.0):
+        super().__init__(sample_rate)
+        self.traces = []
+
+    def on_trace(self, trace):
+        self.traces.append(trace)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("offline"):
+        raise httpx.ConnectError("offline", request=request)
+    if request.url.path.endswith("unknown"):
+        return httpx.Response(404, json={"status": {"message": "Data not found", "status_code": 404}})
+    return httpx.Response(200, json=SUMMONER)
+
+
+async def test_traced_call_times_every_phase():
+    tracer = _CollectingTracer()
+    async with Pyltover("token", transport=httpx.MockTransport(_handler), tracer=tracer) as pyltover:
+        summoner = await pyltover.euw1.v4.get_summoner_by_puuid("some-puuid")
+
+    assert summoner.summoner_level == 30
+    (trace,) = tracer.traces
+    assert trace.api_name == "v4.get_summoner_by_puuid"
+    assert trace.status_code == 200
+    assert trace.attempts == 1
+    assert set(trace.phases) == {"limiter_wait", "decode", "validate"}
+    assert trace.duration >= sum(trace.phases.values())
+
+
+async def test_traces_end_with_errors_and_can_be_sampled_out():
+    tracer = _CollectingTracer()
+    async with Pyltover("token", transport=httpx.MockTransport(_handler), tracer=tracer) as pyltover:
+        summoners = pyltover.euw1.v4.with_options(max_retries=0)
+        with pytest.raises(RiotAPIError) as error:
+            await summoners.get_summoner_by_puuid("unknown")
+        assert error.value.error_status.status_code == 404
+        with pytest.raises(httpx.ConnectError):
+            await summoners.get_summoner_by_puuid("offline")
+
+        tracer.sample_rate = 0.0
+        await summoners.get_summoner_by_puuid("some-puuid")
+
+    assert [trace.status_code for trace in tracer.traces] == [404, None]
+    assert isinstance(tracer.traces[1].error, httpx.ConnectError)
+
+
+async def test_httpx_trace_events_are_timed_into_phases():
+    trace = RequestTrace("euw1.api.riotgames.com", "v4.get_summoner_by_puuid", "url", Tracer())
+    for name in ("connection.connect_tcp", "connection.start_tls", "http2.receive_response_headers"):
+        await trace.httpx_trace(f"{name}.started", {})
+        await trace.httpx_trace(f"{name}.complete", {})
+    await trace.httpx_trace("http11.receive_response_body.started", {})
+    await trace.httpx_trace("http11.receive_response_body.failed", {})
+    await trace.httpx_trace("http11.response_closed.started", {})
+
+    assert set(trace.phases) == {"connect", "tls", "headers", "body"}
+
+
+async def test_slow_request_logger(caplog):
+    async with Pyltover(
+        "token", transport=httpx.MockTransport(_handler), tracer=SlowRequestLogger(threshold=0.0)
+    ) as pyltover:
+        with caplog.at_level(logging.WARNING, logger="pyltover.tracing"):
+            await pyltover.euw1.v4.get_summoner_by_puuid("some-puuid")
+
+    assert "Slow request v4.get_summoner_by_puuid 200 in" in caplog.text
+    assert "validate=" in caplog.text
@@ -0,0 +1,74 @@
+import httpx
+
+from pyltover import Pyltover
+from pyltover.apis.schema import Tier, QueueTypes
+
+
+def _league_entry(puuid, tier, rank):
+    return {
+        "leagueId": f"league-{tier}",
+        "puuid": puuid,
+        "queueType": "RANKED_SOLO_5x5",
+        "tier": tier,
+        "rank": rank,
+        "leaguePoints": 50,
+        "wins": 10,
+        "losses": 8,
+        "hotStreak": False,
+        "veteran": False,
+        "freshBlood": True,
+        "inactive": False,
+    }
+
+
+def _ladder_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if "challengerleagues" in path:
+        item = _league_entry("challenger-1", "CHALLENGER", "I")
+        for key in ("leagueId", "queueType", "tier"):
+            item.pop(key)
+        return httpx.Response(
+            200,
+            json={
+                "leagueId": "league-CHALLENGER",
+                "entries": [item],
+                "tier": "CHALLENGER",
+                "name": "Challengers",
+                "queue": "RANKED_SOLO_5x5",
+            },
+        )
+
+    _, _, _, _, _, _, tier, division = path.split("/")
+    page = int(request.url.params["page"])
+    if tier == "GOLD" and page <= 2:
+        return httpx.Response(
+            200, json=[_league_entry(f"{division}-{page}-{index}", tier, division) for index in range(2)]
+        )
+    return httpx.Response(200, json=[])
+
+
+async def test_iter_ladder_pages_every_division_and_apex_league():
+    async with Pyltover("token", transport=httpx.MockTransport(_ladder_handler)) as pyltover:
+        entries = [
+            entry
+            async for entry in pyltover.euw1.v4.iter_ladder(
+                [QueueTypes.RANKED_SOLO_5x5], [Tier.GOLD, Tier.SILVER, Tier.CHALLENGER], concurrency=3
+            )
+        ]
+
+    assert len(entries) == 4 * 2 * 2 + 1
+    assert {entry.tier for entry in entries} == {"GOLD", "CHALLENGER"}
+    challenger = next(entry for entry in entries if entry.tier == "CHALLENGER")
+    assert challenger.puuid == "challenger-1"
+    assert challenger.league_id == "league-CHALLENGER"
+
+
+async def test_iter_ladder_with_trusted_responses():
+    async with Pyltover("token", transport=httpx.MockTransport(_ladder_handler), trusted=True) as pyltover:
+        entries = [
+            entry
+            async for entry in pyltover.euw1.v4.iter_ladder([QueueTypes.RANKED_SOLO_5x5], [Tier.GOLD, Tier.CHALLENGER])
+        ]
+
+    assert len(entries) == 4 * 2 * 2 + 1
+    assert entries[0].league_points == 50
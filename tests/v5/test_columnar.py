@@ -0,0 +1,54 @@
+import orjson
+import pytest
+
+from pyltover.apis.v5 import schema
+from pyltover.apis.v5.columnar import participant_columns
+from pyltover.lazy import LazyModel
+
+
+def test_participant_columns_from_raw_and_validated_matches(match_json):
+    match = schema.Match.model_validate_json(match_json)
+
+    from_raw = participant_columns([match_json, match_json], challenges=["damage_per_minute"])
+    from_models = participant_columns([match, LazyModel(schema.Match, match_json)], challenges=["damage_per_minute"])
+
+    assert from_raw.keys() == from_models.keys()
+    for name, column in from_raw.items():
+        assert column.to_list() == from_models[name].to_list(), name
+
+    assert len(from_raw["kills"]) == 20
+    assert from_raw["kills"].to_list()[:10] == [participant.kills for participant in match.info.participants]
+    assert from_raw["win"].to_list()[:10] == [participant.win for participant in match.info.participants]
+    assert from_raw["match_id"].to_list()[0] == "EUW1_7000000001"
+    assert from_raw["challenges.damage_per_minute"].values.typecode == "d"
+    assert from_raw["team.baron.kills"].to_list()[0] == match.info.teams[0].objectives.baron.kills
+
+
+def test_participant_columns_masks_missing_values(match_json):
+    raw_match = orjson.loads(match_json)
+    del raw_match["info"]["participants"][0]["challenges"]["damagePerMinute"]
+
+    columns = participant_columns([raw_match], fields=["kills"], challenges=["damage_per_minute"], objectives=False)
+
+    assert set(columns) == {
+        "match_id",
+        "game_creation",
+        "game_duration",
+        "game_version",
+        "queue_id",
+        "kills",
+        "challenges.damage_per_minute",
+    }
+    damage_per_minute = columns["challenges.damage_per_minute"]
+    assert damage_per_minute.has_nulls
+    assert damage_per_minute.to_list()[0] is None
+    assert damage_per_minute.to_list()[1] is not None
+
+
+def test_column_to_numpy(match_json):
+    numpy = pytest.importorskip("numpy")
+
+    columns = participant_columns([match_json], fields=["kills", "win"], objectives=False)
+
+    assert columns["kills"].to_numpy().dtype == numpy.int64
+    assert columns["win"].to_numpy().dtype == numpy.bool_
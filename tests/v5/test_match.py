@@ -1,9 +1,16 @@
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.errors import RiotAPIError
 from pyltover.apis.v5 import Pyltover as V5Pyltover
+from pyltover.apis.v5 import schema
 
 
 class _FakeResponse:
     def __init__(self, payload):
         self.status_code = 200
+        self.headers = {}
         self._payload = payload
 
     def json(self):
@@ -23,8 +30,7 @@ class _FakeAsyncClient:
 
 async def test_get_list_of_match_ids_by_puuid_uses_default_query_params():
     client = _FakeAsyncClient()
-    api = V5Pyltover("europe.api.riotgames.com", "token")
-    V5Pyltover.async_client = client
+    api = V5Pyltover("europe.api.riotgames.com", "token", async_client=client)
 
     response = await api.get_list_of_match_ids_by_puuid("some-puuid")
 
@@ -34,8 +40,7 @@ async def test_get_list_of_match_ids_by_puuid_uses_default_query_params():
 
 async def test_get_list_of_match_ids_by_puuid_uses_all_supported_query_params():
     client = _FakeAsyncClient()
-    api = V5Pyltover("europe.api.riotgames.com", "token")
-    V5Pyltover.async_client = client
+    api = V5Pyltover("europe.api.riotgames.com", "token", async_client=client)
 
     response = await api.get_list_of_match_ids_by_puuid(
         "some-puuid",
@@ -56,3 +61,84 @@ async def test_get_list_of_match_ids_by_puuid_uses_all_supported_query_params():
         "start": 10,
         "count": 50,
     }
+
+
+async def test_iter_matches_captures_errors_per_match(match_json):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("EUW1_404"):
+            return httpx.Response(404, json={"status": {"message": "Data not found", "status_code": 404}})
+        return httpx.Response(200, content=match_json)
+
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        results = [
+            result
+            async for result in pyltover.europe.v5.iter_matches(
+                ["EUW1_1", "EUW1_404", "EUW1_2"], concurrency=2, ordered=True
+            )
+        ]
+
+    assert [match_id for match_id, _ in results] == ["EUW1_1", "EUW1_404", "EUW1_2"]
+    assert isinstance(results[0][1], schema.Match)
+    assert isinstance(results[1][1], RiotAPIError)
+    assert results[1][1].error_status.status_code == 404
+
+
+class _PagedHandler:
+    def __init__(self, match_ids):
+        self.match_ids = match_ids
+        self.pages = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        count = int(request.url.params["count"])
+        self.pages.append(start)
+        return httpx.Response(200, json=self.match_ids[start : start + count])
+
+
+async def test_iter_match_ids_by_puuid_walks_every_page():
+    handler = _PagedHandler([f"EUW1_{index}" for index in range(250, 0, -1)])
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        match_ids = [match_id async for match_id in pyltover.europe.v5.iter_match_ids_by_puuid("some-puuid")]
+
+    assert match_ids == handler.match_ids
+    assert handler.pages == [0, 100, 200]
+
+
+async def test_iter_match_ids_by_puuid_stops_at_seen_match():
+    handler = _PagedHandler([f"EUW1_{index}" for index in range(250, 0, -1)])
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        match_ids = [
+            match_id
+            async for match_id in pyltover.europe.v5.iter_match_ids_by_puuid(
+                "some-puuid", page_size=20, stop_at="EUW1_230", prefetch=False
+            )
+        ]
+
+    assert match_ids == [f"EUW1_{index}" for index in range(250, 230, -1)]
+    assert handler.pages == [0, 20]
+
+
+async def test_iter_match_ids_by_puuid_page_size_is_capped():
+    handler = _PagedHandler([f"EUW1_{index}" for index in range(250, 0, -1)])
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        for page_size in (0, 200):
+            with pytest.raises(ValueError):
+                async for _ in pyltover.europe.v5.iter_match_ids_by_puuid("some-puuid", page_size=page_size):
+                    pass
+
+    assert handler.pages == []
+
+
+async def test_iter_matches_with_projected_fields(match_json):
+    async with Pyltover(
+        "token", transport=httpx.MockTransport(lambda _: httpx.Response(200, content=match_json))
+    ) as pyltover:
+        results = [
+            match
+            async for _, match in pyltover.europe.v5.iter_matches(["EUW1_1", "EUW1_2"], fields=["info.game_duration"])
+        ]
+
+    assert [match.info.game_duration for match in results] == [
+        schema.Match.model_validate_json(match_json).info.game_duration
+    ] * 2
+    assert not hasattr(results[0], "metadata")
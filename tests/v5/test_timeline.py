@@ -0,0 +1,97 @@
+import httpx
+import pytest
+
+from pyltover import Pyltover
+from pyltover.apis.v5 import schema
+
+
+def _participant_frame(participant_id, minute):
+    return {
+        "championStats": {"armor": 30 + minute, "attackSpeed": 100},
+        "currentGold": 100 * minute,
+        "damageStats": {"totalDamageDoneToChampions": 250 * minute * participant_id},
+        "goldPerSecond": 2,
+        "jungleMinionsKilled": 0,
+        "level": 1 + minute,
+        "minionsKilled": 8 * minute,
+        "participantId": participant_id,
+        "position": {"x": 500 * participant_id, "y": 400},
+        "timeEnemySpentControlled": 0,
+        "totalGold": 500 + 400 * minute + (100 * minute if participant_id <= 5 else 0),
+        "xp": 300 * minute,
+    }
+
+
+def _timeline(minutes=3):
+    frames = []
+    for minute in range(minutes):
+        events = [{"type": "ITEM_PURCHASED", "timestamp": minute * 60_000 + 10, "participantId": 3, "itemId": 1055}]
+        if minute == 2:
+            events.append(
+                {
+                    "type": "CHAMPION_KILL",
+                    "timestamp": 121_000,
+                    "killerId": 1,
+                    "victimId": 7,
+                    "assistingParticipantIds": [2, 4],
+                    "position": {"x": 7000, "y": 7100},
+                }
+            )
+        frames.append(
+            {
+                "events": events,
+                "participantFrames": {str(pid): _participant_frame(pid, minute) for pid in range(1, 11)},
+                "timestamp": minute * 60_000 + (12 if minute else 0),
+            }
+        )
+    return {
+        "metadata": {"dataVersion": "2", "matchId": "EUW1_1", "participants": [f"puuid-{pid}" for pid in range(10)]},
+        "info": {
+            "endOfGameResult": "GameComplete",
+            "frameInterval": 60000,
+            "gameId": 1,
+            "participants": [{"participantId": pid, "puuid": f"puuid-{pid - 1}"} for pid in range(1, 11)],
+            "frames": frames,
+        },
+    }
+
+
+async def test_get_match_timeline_by_id():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/lol/match/v5/matches/EUW1_1/timeline"
+        return httpx.Response(200, json=_timeline())
+
+    async with Pyltover("token", transport=httpx.MockTransport(handler)) as pyltover:
+        timeline = await pyltover.europe.v5.get_match_timeline_by_id("EUW1_1")
+
+    assert isinstance(timeline, schema.MatchTimeline)
+    assert timeline.metadata.match_id == "EUW1_1"
+    assert timeline.info.participants[0].puuid == "puuid-0"
+    assert len(timeline.frames) == 3
+    assert timeline.frames.stat("total_gold", 2, 1) == 1500
+    assert timeline.frames.stat("damage_stats_total_damage_done_to_champions", 1, 4) == 1000
+    assert list(timeline.frames.participant_series("level", 6)) == [1, 2, 3]
+    assert timeline.gold_diff_at(2) == 5 * 200
+    assert timeline.xp_diff_at(2) == 0
+
+
+def test_timeline_events_are_typed_columns():
+    timeline = schema.MatchTimeline.from_json(httpx.Response(200, json=_timeline()).content)
+    events = timeline.events
+
+    assert len(events) == 4
+    (kill,) = events.of_type("CHAMPION_KILL")
+    assert events.participant_ids[kill] == 1
+    assert events.victim_ids[kill] == 7
+    assert list(events.assisting(kill)) == [2, 4]
+    assert (events.position_x[kill], events.position_y[kill]) == (7000, 7100)
+    assert [events.item_ids[index] for index in events.of_type("ITEM_PURCHASED")] == [1055] * 3
+
+
+def test_timeline_without_frames():
+    timeline = schema.MatchTimeline.from_json(httpx.Response(200, json=_timeline(minutes=0)).content)
+
+    assert len(timeline.frames) == 0
+    assert len(timeline.events) == 0
+    with pytest.raises(ValueError, match="no frames"):
+        timeline.gold_diff_at(1)